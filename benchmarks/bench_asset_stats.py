@@ -0,0 +1,107 @@
+import heapq
+import os
+import shutil
+import sqlite3 as sql
+import sys
+import tempfile
+import time
+from contextlib import closing
+from datetime import date, datetime
+
+from benchmarks.datagen import generate
+from src.database import Database_manager
+from src.models import Assignment
+
+
+def full_scan(path: str, days: int, n: int) -> tuple[int, list]:
+    # what the reports did before asset_stats: read every assignment and
+    # parse its dates in Python
+    today = date.today()
+    totals: dict[int, int] = {}
+    last_returned: dict[int, date] = {}
+    out = set()
+
+    with closing(sql.connect(path)) as conn:
+        asset_ids = [row[0] for row in conn.execute("SELECT id FROM assets")]
+        rows = conn.execute("SELECT asset_id, assigned_date, return_date FROM assignments")
+
+        for asset_id, assigned, returned in rows:
+            start = datetime.strptime(assigned, "%Y-%m-%d").date()
+            if returned is None:
+                out.add(asset_id)
+                end = today
+            else:
+                end = datetime.strptime(returned, "%Y-%m-%d").date()
+                if end > last_returned.get(asset_id, date.min):
+                    last_returned[asset_id] = end
+            totals[asset_id] = totals.get(asset_id, 0) + (end - start).days
+
+    idle = sum(
+        1
+        for asset_id in asset_ids
+        if asset_id not in out
+        and (today - last_returned.get(asset_id, date.min)).days >= days
+    )
+    return idle, heapq.nlargest(n, totals.items(), key=lambda item: item[1])
+
+
+def best_of(runs: int, fn) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def write_cost(path: str, pairs: int) -> float:
+    # assign + return round trips, the path the triggers add work to
+    with Database_manager(path) as db:
+        with closing(sql.connect(path)) as conn:
+            available = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT id FROM assets WHERE status='AVAILABLE' LIMIT ?", (pairs,)
+                )
+            ]
+
+        start = time.perf_counter()
+        for asset_id in available:
+            db.assign_asset(Assignment(asset_id=asset_id, employee_id=1))
+            db.return_asset(asset_id, date.today().isoformat())
+        return (time.perf_counter() - start) / len(available)
+
+
+def main(assets: int = 100_000, runs: int = 5, pairs: int = 500) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stats.db")
+        info = generate(path, assets)
+        print(f"{assets} assets, {info['closed_assignments'] + info['open_assignments']} assignments\n")
+
+        print(f"{'READ':<24} | {'FULL SCAN MS':>12} | {'ASSET_STATS MS':>14}")
+        print("-" * 56)
+
+        with Database_manager(path) as db:
+            scan = best_of(runs, lambda: full_scan(path, 90, 10))
+            idle = best_of(runs, lambda: db.idle_assets(90))
+            top = best_of(runs, lambda: db.top_utilized(10))
+            print(f"{'idle_assets(90)':<24} | {scan * 1000:>12.1f} | {idle * 1000:>14.2f}")
+            print(f"{'top_utilized(10)':<24} | {scan * 1000:>12.1f} | {top * 1000:>14.2f}")
+
+        without = os.path.join(tmp, "without.db")
+        shutil.copy(path, without)
+        with closing(sql.connect(without)) as conn:
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='trigger' AND name LIKE 'trg_asset_stats_%'"
+            ).fetchall():
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.commit()
+
+        print(
+            f"\nassign+return: {write_cost(without, pairs) * 1000:.3f} ms without triggers, "
+            f"{write_cost(path, pairs) * 1000:.3f} ms with"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
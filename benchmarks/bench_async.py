@@ -0,0 +1,88 @@
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.async_database import AsyncDatabaseManager
+from src.database import Database_manager, setup_database
+from src.models import Assignment
+
+ASSETS = 2000
+EMPLOYEES = 200
+
+
+async def client(db: AsyncDatabaseManager, seed: int, ops: int, latencies: list) -> None:
+    rng = random.Random(seed)
+
+    for _ in range(ops):
+        asset_id = rng.randint(1, ASSETS)
+        roll = rng.random()
+        start = time.perf_counter()
+
+        try:
+            if roll < 0.6:
+                await db.get_asset(asset_id)
+            elif roll < 0.8:
+                await db.page_assets(after_id=asset_id, limit=50, status="AVAILABLE")
+            elif roll < 0.9:
+                employee_id = rng.randint(1, EMPLOYEES)
+                await db.assign_asset(Assignment(asset_id=asset_id, employee_id=employee_id))
+            else:
+                await db.return_asset(asset_id, "2025-01-01")
+        except ValueError:
+            pass
+
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(db_name: str, clients: int, ops: int) -> None:
+    latencies: list[float] = []
+
+    async with AsyncDatabaseManager(db_name, readers=4, max_pending=64) as db:
+        loop_lag = 0.0
+
+        async def ticker():
+            nonlocal loop_lag
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0.001)
+                loop_lag = max(loop_lag, time.perf_counter() - start - 0.001)
+
+        tick = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await asyncio.gather(*(client(db, i, ops, latencies) for i in range(clients)))
+        elapsed = time.perf_counter() - start
+        tick.cancel()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"clients: {clients}  ops: {total}  time: {elapsed:.2f}s")
+    print(f"ops/sec: {total / elapsed:,.0f}")
+    print(
+        f"p50: {latencies[total // 2] * 1000:.2f}ms  "
+        f"p99: {latencies[int(total * 0.99)] * 1000:.2f}ms  "
+        f"max event-loop lag: {loop_lag * 1000:.2f}ms"
+    )
+
+
+def main(clients: int = 200, ops: int = 50) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "async.db")
+        setup_database(db_name)
+
+        with Database_manager(db_name) as db:
+            db.bulk_add_assets(
+                {"name": f"Laptop {i}", "category": "Laptop"} for i in range(ASSETS)
+            )
+            db.bulk_add_employees(
+                {"name": "Bob", "department": "IT"} for _ in range(EMPLOYEES)
+            )
+
+        asyncio.run(run(db_name, clients, ops))
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
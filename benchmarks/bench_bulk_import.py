@@ -0,0 +1,38 @@
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from src.database import Database_manager, setup_database
+from src.fileio import read_records
+
+
+def write_csv(path: str, rows: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "category"])
+        for i in range(rows):
+            writer.writerow([f"laptop {i}", "laptop"])
+
+
+def main(rows: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "bulk.db")
+        csv_path = os.path.join(tmp, "assets.csv")
+        write_csv(csv_path, rows)
+        setup_database(db_name)
+
+        with Database_manager(
+            db_name, pooled=True, journal_mode="WAL", synchronous="NORMAL"
+        ) as db:
+            start = time.perf_counter()
+            result = db.bulk_add_assets(read_records(csv_path))
+            elapsed = time.perf_counter() - start
+
+    print(f"rows: {result.inserted}  rejected: {len(result.errors)}")
+    print(f"time: {elapsed:.2f}s  rows/sec: {result.inserted / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
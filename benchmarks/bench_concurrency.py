@@ -0,0 +1,76 @@
+import multiprocessing as mp
+import os
+import random
+import sqlite3 as sql
+import sys
+import tempfile
+import time
+from contextlib import closing
+
+from src.database import Database_manager, setup_database
+from src.models import Assignment
+
+ASSETS = 50
+EMPLOYEES = 20
+
+
+def worker(db_name: str, seed: int, ops: int) -> tuple[int, int]:
+    rng = random.Random(seed)
+    succeeded = rejected = 0
+
+    with Database_manager(
+        db_name, pooled=True, journal_mode="WAL", synchronous="NORMAL"
+    ) as db:
+        for _ in range(ops):
+            asset_id = rng.randint(1, ASSETS)
+            try:
+                if rng.random() < 0.5:
+                    employee_id = rng.randint(1, EMPLOYEES)
+                    db.assign_asset(Assignment(asset_id=asset_id, employee_id=employee_id))
+                else:
+                    db.return_asset(asset_id, "2025-01-01")
+                succeeded += 1
+            except ValueError:
+                rejected += 1
+
+    return succeeded, rejected
+
+
+def main(processes: int = 4, ops: int = 2000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "stress.db")
+        setup_database(db_name)
+
+        with Database_manager(db_name) as db:
+            db.bulk_add_assets(
+                [{"name": f"Laptop {i}", "category": "Tech"} for i in range(ASSETS)]
+            )
+            db.bulk_add_employees([{"name": "Bob", "department": "IT"}] * EMPLOYEES)
+
+        start = time.perf_counter()
+        with mp.get_context("spawn").Pool(processes) as pool:
+            results = pool.starmap(
+                worker, [(db_name, seed, ops) for seed in range(processes)]
+            )
+        elapsed = time.perf_counter() - start
+
+        with closing(sql.connect(db_name)) as conn:
+            doubles = conn.execute(
+                """SELECT COUNT(*) FROM (
+                    SELECT asset_id FROM assignments WHERE return_date IS NULL
+                    GROUP BY asset_id HAVING COUNT(*) > 1
+                )"""
+            ).fetchone()[0]
+
+    succeeded = sum(r[0] for r in results)
+    rejected = sum(r[1] for r in results)
+    total = processes * ops
+
+    print(f"processes: {processes}  ops: {total}  time: {elapsed:.2f}s")
+    print(f"ops/sec: {total / elapsed:,.0f}  (committed {succeeded}, rejected {rejected})")
+    print(f"double assignments: {doubles}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
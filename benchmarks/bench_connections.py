@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import time
+
+from src.database import Database_manager, setup_database
+from src.models import Asset
+
+
+def run(manager: Database_manager, ops: int) -> float:
+    start = time.perf_counter()
+
+    for i in range(ops):
+        if i % 2 == 0:
+            manager.add_assets(Asset(name=f"Laptop {i}", category="Laptop"))
+        else:
+            manager.get_all_employees()
+
+    return ops / (time.perf_counter() - start)
+
+
+def main(ops: int = 2000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        per_call_db = os.path.join(tmp, "per_call.db")
+        pooled_db = os.path.join(tmp, "pooled.db")
+        setup_database(per_call_db)
+        setup_database(pooled_db)
+
+        per_call = run(Database_manager(per_call_db), ops)
+
+        with Database_manager(
+            pooled_db, pooled=True, journal_mode="WAL", synchronous="NORMAL"
+        ) as manager:
+            pooled = run(manager, ops)
+
+    print(f"{'MODE':<10} | {'OPS/SEC':>10}")
+    print("-" * 25)
+    print(f"{'per-call':<10} | {per_call:>10.0f}")
+    print(f"{'pooled':<10} | {pooled:>10.0f}")
+    print(f"speedup: {pooled / per_call:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
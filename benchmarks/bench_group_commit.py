@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.database import Database_manager, setup_database
+from src.models import Assignment
+
+SCANNERS = 8
+
+
+def events(scanner: int, count: int) -> list[tuple[str, int]]:
+    # each badge scanner checks its own assets out and back in
+    ops = []
+    for i in range(count // 2):
+        asset_id = scanner * count + i + 1
+        ops.append(("assign", asset_id))
+        ops.append(("return", asset_id))
+    return ops
+
+
+def per_call(db: Database_manager, scanner: int, count: int) -> None:
+    for kind, asset_id in events(scanner, count):
+        if kind == "assign":
+            db.assign_asset(Assignment(asset_id=asset_id, employee_id=1))
+        else:
+            db.return_asset(asset_id, "2025-01-02")
+
+
+def grouped(committer, scanner: int, count: int) -> None:
+    # a scanner pushes its burst without waiting on each event
+    futures = []
+    for kind, asset_id in events(scanner, count):
+        if kind == "assign":
+            futures.append(
+                committer.submit_assign(Assignment(asset_id=asset_id, employee_id=1))
+            )
+        else:
+            futures.append(committer.submit_return(asset_id, "2025-01-02"))
+
+    for future in futures:
+        future.result()
+
+
+def prepare(path: str, count: int) -> None:
+    setup_database(path)
+    with Database_manager(path) as db:
+        db.bulk_add_assets(
+            {"name": f"Laptop {i}", "category": "Tech"} for i in range(SCANNERS * count)
+        )
+        db.bulk_add_employees([{"name": "Bob", "department": "IT"}])
+
+
+def run(path: str, count: int, use_group: bool) -> float:
+    options = {"pooled": True, "journal_mode": "WAL", "synchronous": "FULL"}
+
+    with Database_manager(path, **options) as db:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(SCANNERS) as pool:
+            if use_group:
+                with db.group_commit(max_ops=64, max_delay_ms=2) as committer:
+                    list(pool.map(lambda s: grouped(committer, s, count), range(SCANNERS)))
+            else:
+                list(pool.map(lambda s: per_call(db, s, count), range(SCANNERS)))
+        return SCANNERS * count / (time.perf_counter() - start)
+
+
+def main(count: int = 500) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        per_call_db = os.path.join(tmp, "per_call.db")
+        grouped_db = os.path.join(tmp, "grouped.db")
+        prepare(per_call_db, count)
+        prepare(grouped_db, count)
+
+        single = run(per_call_db, count, use_group=False)
+        group = run(grouped_db, count, use_group=True)
+
+    print(f"{'MODE':<14} | {'OPS/SEC':>10}")
+    print("-" * 29)
+    print(f"{'per-call':<14} | {single:>10.0f}")
+    print(f"{'group commit':<14} | {group:>10.0f}")
+    print(f"speedup: {group / single:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
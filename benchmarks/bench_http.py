@@ -0,0 +1,147 @@
+import http.client
+import json
+import os
+import random
+import socket
+import sqlite3 as sql
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import closing
+
+from benchmarks.datagen import generate
+
+# share of requests per operation; assign/return alternate on each worker's
+# own assets so writes never collide between workers
+MIX = {"list-assets": 0.45, "list-assignments": 0.15, "get-asset": 0.2, "assign/return": 0.2}
+
+
+def free_port() -> int:
+    with closing(socket.socket()) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+def worker(
+    port: int,
+    seconds: float,
+    assets: list[int],
+    employees: list[int],
+    max_id: int,
+    seed: int,
+    results: list,
+) -> None:
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    held: list[int] = []
+    free = list(assets)
+    ops, weights = list(MIX), list(MIX.values())
+    latencies: dict[str, list[float]] = {op: [] for op in ops}
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        op = rng.choices(ops, weights)[0]
+        body = None
+        if op == "list-assets":
+            method, path = "GET", f"/assets?limit=50&after_id={rng.randrange(max_id)}"
+        elif op == "list-assignments":
+            method, path = "GET", f"/assignments?limit=50&after_id={rng.randrange(max_id)}"
+        elif op == "get-asset":
+            method, path = "GET", f"/assets/{rng.randrange(1, max_id + 1)}"
+        elif free and (not held or rng.random() < 0.5):
+            asset = free.pop()
+            held.append(asset)
+            method, path = "POST", "/assignments"
+            body = json.dumps({"asset_id": asset, "employee_id": rng.choice(employees)})
+        else:
+            asset = held.pop(0)
+            free.append(asset)
+            method, path = "POST", f"/assets/{asset}/return"
+            body = "{}"
+
+        start = time.perf_counter()
+        conn.request(method, path, body=body)
+        response = conn.getresponse()
+        response.read()
+        latencies[op].append(time.perf_counter() - start)
+        errors += response.status >= 400 and op != "get-asset"
+
+    conn.close()
+    results.append((latencies, errors))
+
+
+def p99(values: list[float]) -> float:
+    return statistics.quantiles(values, n=100)[98] if len(values) > 1 else values[0]
+
+
+def main(clients: int = 8, seconds: float = 10.0, assets: int = 10_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "http.db")
+        generate(db_name, assets)
+
+        with closing(sql.connect(db_name)) as conn:
+            available = [r[0] for r in conn.execute("SELECT id FROM assets WHERE status='AVAILABLE'")]
+            employees = [r[0] for r in conn.execute("SELECT id FROM employees WHERE is_active=1")]
+
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, "main.py", "--db", db_name, "serve", "--port", str(port)],
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_ready(port)
+            results: list = []
+            threads = [
+                threading.Thread(
+                    target=worker,
+                    args=(port, seconds, available[i::clients], employees, assets, i, results),
+                )
+                for i in range(clients)
+            ]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+    merged: dict[str, list[float]] = {op: [] for op in MIX}
+    for latencies, _ in results:
+        for op, values in latencies.items():
+            merged[op] += values
+    every = [v for values in merged.values() for v in values]
+    errors = sum(e for _, e in results)
+
+    print(f"{clients} clients, {seconds:.0f}s, {assets} assets, {errors} failed writes")
+    print(f"{'OPERATION':<18} | {'REQUESTS':>8} | {'P50 MS':>7} | {'P99 MS':>7}")
+    print("-" * 50)
+    for op, values in [*merged.items(), ("all", every)]:
+        if values:
+            print(
+                f"{op:<18} | {len(values):>8} | {statistics.median(values) * 1000:>7.2f}"
+                f" | {p99(values) * 1000:>7.2f}"
+            )
+    print(f"\nthroughput: {len(every) / elapsed:,.0f} requests/sec")
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:3]]
+    main(int(args[0]) if args else 8, *(args[1:]))
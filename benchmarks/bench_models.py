@@ -0,0 +1,74 @@
+import sys
+import time
+import tracemalloc
+
+from benchmarks import original_models as original
+from src.models import Asset, Assignment, Employee
+
+
+def per_object_ns(build, count: int) -> float:
+    start = time.perf_counter_ns()
+    for i in range(count):
+        build(i)
+    return (time.perf_counter_ns() - start) / count
+
+
+def bytes_per_object(build, count: int) -> float:
+    tracemalloc.start()
+    objects = [build(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main(count: int = 100_000) -> None:
+    # inputs are built once, outside the measurements, and both sides of
+    # each row read the same ones
+    names = [f"laptop {i}" for i in range(count)]
+    dates = [f"2025-01-{i % 28 + 1:02d}" for i in range(count)]
+
+    cases = {
+        "Asset()": (
+            lambda i: Asset(name=names[i], category="laptop", id=i),
+            lambda i: original.Asset(name=names[i], category="laptop", id=i),
+        ),
+        "Employee()": (
+            lambda i: Employee(name="bob dob", department="it", id=i),
+            lambda i: original.Employee(name="bob dob", department="it", id=i),
+        ),
+        "Assignment()": (
+            lambda i: Assignment(asset_id=i, employee_id=i, assigned_date=dates[i], id=i),
+            lambda i: original.Assignment(asset_id=i, employee_id=i, assigned_date=dates[i], id=i),
+        ),
+        # from_row skips validation; the original had to go through __init__
+        "Asset.from_row": (
+            lambda i: Asset.from_row((i, names[i], "Laptop", "AVAILABLE")),
+            lambda i: original.Asset(names[i], "Laptop", "AVAILABLE", i),
+        ),
+        "Employee.from_row": (
+            lambda i: Employee.from_row((i, "Bob Dob", "IT", 1)),
+            lambda i: original.Employee("Bob Dob", "IT", 1, i),
+        ),
+        "Assignment.from_row": (
+            lambda i: Assignment.from_row((i, i, i, dates[i], None)),
+            lambda i: original.Assignment(i, i, dates[i], None, i),
+        ),
+    }
+
+    print(f"{count} objects per case; ORIGINAL is the unslotted pre-change model")
+    print(
+        f"{'CASE':<20} | {'NS/OBJ':>8} | {'ORIGINAL':>8} | {'MB/100K':>8} | {'ORIGINAL':>8}"
+    )
+    print("-" * 66)
+
+    for label, (build, baseline) in cases.items():
+        ns, base_ns = per_object_ns(build, count), per_object_ns(baseline, count)
+        mb, base_mb = (
+            bytes_per_object(fn, count) * 100_000 / 1024 / 1024 for fn in (build, baseline)
+        )
+        print(f"{label:<20} | {ns:>8.0f} | {base_ns:>8.0f} | {mb:>8.1f} | {base_mb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import time
+
+from src.database import Database_manager, setup_database
+from src.models import get_today
+
+ASSETS_PER_EMPLOYEE = 30
+
+
+def prepare(path: str, employees: int) -> None:
+    setup_database(path)
+    with Database_manager(path) as db:
+        db.bulk_add_employees(
+            {"name": "Bob", "department": "IT"} for _ in range(employees)
+        )
+        db.bulk_add_assets(
+            {"name": f"Laptop {i}", "category": "Tech"}
+            for i in range(employees * ASSETS_PER_EMPLOYEE)
+        )
+        db.bulk_assign(
+            {"asset_id": i + 1, "employee_id": i // ASSETS_PER_EMPLOYEE + 1}
+            for i in range(employees * ASSETS_PER_EMPLOYEE)
+        )
+
+
+def per_asset(db: Database_manager, employees: int) -> None:
+    # the old workflow: deactivate, then return every asset one call at a time
+    for employee_id in range(1, employees + 1):
+        db.offboard_employee(employee_id)
+        for _, asset_id, _, _, _ in db.employee_history(employee_id):
+            db.return_asset(asset_id, get_today())
+
+
+def set_based(db: Database_manager, employees: int) -> None:
+    db.bulk_offboard(range(1, employees + 1))
+
+
+def run(path: str, employees: int, offboard) -> float:
+    options = {"pooled": True, "journal_mode": "WAL", "synchronous": "NORMAL"}
+
+    with Database_manager(path, **options) as db:
+        start = time.perf_counter()
+        offboard(db, employees)
+        elapsed = time.perf_counter() - start
+
+        assert db.get_active_assignments() == []
+    return elapsed
+
+
+def main(employees: int = 300) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+        for name, offboard in (("per-asset", per_asset), ("bulk_offboard", set_based)):
+            path = os.path.join(tmp, f"{name}.db")
+            prepare(path, employees)
+            timings[name] = run(path, employees, offboard)
+
+    print(f"{employees} employees x {ASSETS_PER_EMPLOYEE} assets")
+    print(f"{'MODE':<14} | {'SECONDS':>10}")
+    print("-" * 29)
+    for name, elapsed in timings.items():
+        print(f"{name:<14} | {elapsed:>10.3f}")
+    print(f"speedup: {timings['per-asset'] / timings['bulk_offboard']:.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
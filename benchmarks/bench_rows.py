@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+import time
+
+from src.database import Database_manager, setup_database
+
+
+def main(rows: int = 100_000, repeat: int = 3) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "rows.db")
+        setup_database(db_name)
+
+        with Database_manager(db_name) as db:
+            db.bulk_add_assets(
+                {"name": f"Laptop {i}", "category": "Laptop"} for i in range(rows)
+            )
+
+        print(f"{'ROW TYPE':<8} | {'TOTAL MS':>9} | {'NS/ROW':>7}")
+        print("-" * 31)
+
+        for row_type in ("tuple", "named", "model"):
+            with Database_manager(db_name, pooled=True, row_type=row_type) as db:
+                db.get_all_assets()
+                best = float("inf")
+
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    db.get_all_assets()
+                    best = min(best, time.perf_counter() - start)
+
+            print(f"{row_type:<8} | {best * 1000:>9.1f} | {best * 1e9 / rows:>7.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
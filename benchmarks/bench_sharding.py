@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.datagen import generate
+from src.sharding import ShardedDatabaseManager
+
+SITES = ("nyc", "sfo", "ldn", "ber")
+
+READS = {
+    "get_active_assignments": lambda db: len(db.get_active_assignments()),
+    "iter_assets (merged)": lambda db: sum(1 for _ in db.iter_assets()),
+    "search_assets": lambda db: len(db.search_assets("dell lat", limit=20)),
+    "get_inventory_summary": lambda db: len(db.get_inventory_summary()["assets"]),
+}
+
+
+def sequential(db: ShardedDatabaseManager, read) -> None:
+    # what cross-site reports did before: open each site and read in turn
+    for site in db.sites:
+        read(db.shard(site))
+
+
+def best_of(runs: int, fn) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(assets_per_site: int = 50_000, runs: int = 3) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {site: os.path.join(tmp, f"{site}.db") for site in SITES}
+        for seed, path in enumerate(paths.values()):
+            generate(path, assets_per_site, seed=seed)
+
+        print(f"{len(SITES)} sites x {assets_per_site} assets")
+        print(f"{'READ':<24} | {'ONE BY ONE MS':>13} | {'FAN-OUT MS':>10}")
+        print("-" * 54)
+
+        with ShardedDatabaseManager(paths) as db:
+            for name, read in READS.items():
+                one_by_one = best_of(runs, lambda: sequential(db, read))
+                fan_out = best_of(runs, lambda: read(db))
+                print(f"{name:<24} | {one_by_one * 1000:>13.1f} | {fan_out * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
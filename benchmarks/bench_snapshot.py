@@ -0,0 +1,75 @@
+import os
+import sqlite3 as sql
+import sys
+import tempfile
+import time
+from contextlib import closing
+
+from benchmarks.datagen import generate
+from src.database import Database_manager
+from src.migrations import day_number_sql
+from src.models import get_today
+
+# each analytic as a plain SQL query and as the same question to a snapshot
+QUERIES = {
+    "assets by category/status": (
+        "SELECT category, status, COUNT(*) FROM assets GROUP BY 1, 2",
+        lambda snap: snap.count_assets("category", "status"),
+    ),
+    "assignments by category": (
+        "SELECT a.category, COUNT(*) FROM assignments AS s JOIN assets AS a ON a.id = s.asset_id GROUP BY 1",
+        lambda snap: snap.count_assignments("category"),
+    ),
+    "mean days by department": (
+        f"""SELECT e.department,
+            AVG({day_number_sql("COALESCE(s.return_date, :today)")} - {day_number_sql("s.assigned_date")})
+        FROM assignments AS s JOIN employees AS e ON e.id = s.employee_id GROUP BY 1""",
+        lambda snap: snap.mean_duration("department"),
+    ),
+    "mean days, IT laptops, closed": (
+        f"""SELECT AVG({day_number_sql("s.return_date")} - {day_number_sql("s.assigned_date")})
+        FROM assignments AS s
+        JOIN employees AS e ON e.id = s.employee_id
+        JOIN assets AS a ON a.id = s.asset_id
+        WHERE e.department = 'IT' AND a.category = 'Laptop' AND s.return_date IS NOT NULL""",
+        lambda snap: snap.mean_duration("department", department="IT", category="Laptop", open=0),
+    ),
+}
+
+
+def best_of(runs: int, fn) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(assets: int = 100_000, runs: int = 5) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "snapshot.db")
+        generate(path, assets)
+
+        start = time.perf_counter()
+        snap = Database_manager(path).load_snapshot()
+        load = time.perf_counter() - start
+
+        print(f"{assets} assets, {len(snap.assignments)} assignments")
+        print(f"load_snapshot: {load * 1000:.0f} ms, {snap.nbytes / 1e6:.1f} MB of columns\n")
+        print(f"{'QUERY':<32} | {'SQL MS':>8} | {'SNAPSHOT MS':>11} | {'SPEEDUP':>7}")
+        print("-" * 68)
+
+        params = {"today": get_today()}
+        with closing(sql.connect(path)) as conn:
+            for name, (query, analytic) in QUERIES.items():
+                sql_time = best_of(runs, lambda: conn.execute(query, params).fetchall())
+                snap_time = best_of(runs, lambda: analytic(snap))
+                print(
+                    f"{name:<32} | {sql_time * 1000:>8.1f} | {snap_time * 1000:>11.1f}"
+                    f" | {sql_time / snap_time:>6.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
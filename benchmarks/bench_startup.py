@@ -0,0 +1,73 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "import main": ["-c", "import main"],
+    "list-assets": ["main.py", "--db", "{db}", "list-assets", "--status", "retired"],
+    "add-asset": ["main.py", "--db", "{db}", "add-asset", "Dell", "Laptop"],
+    "menu exit": ["main.py", "--db", "{db}"],
+}
+
+
+def wall_ms(args: list[str], runs: int, stdin: str = "0\n") -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            input=stdin,
+            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def import_times(top: int) -> list[tuple[int, str]]:
+    # same data as `python -X importtime -c "import main"`, cumulative µs
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(runs: int = 20) -> None:
+    # bytecode is compiled up front so runs measure imports, not compiling
+    subprocess.run(
+        [sys.executable, "-m", "compileall", "-q", "main.py", "src"],
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "startup.db")
+        subprocess.run([sys.executable, "main.py", "--db", db_name, "list-assets"], check=True)
+
+        print(f"{'COMMAND':<16} | {'MEDIAN MS':>10}")
+        print("-" * 31)
+        for name, args in COMMANDS.items():
+            args = [arg.format(db=db_name) for arg in args]
+            print(f"{name:<16} | {wall_ms(args, runs):>10.1f}")
+
+    print("\nslowest imports (cumulative µs):")
+    for micros, module in import_times(10):
+        print(f"{micros:>8} | {module}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,93 @@
+import random
+import sys
+import time
+
+from src.models import (
+    Asset,
+    Assignment,
+    Employee,
+    validate_assets,
+    validate_assignments,
+    validate_employees,
+)
+
+CATEGORIES = ["laptop", " monitor", "phone ", "tablet", "dock", "headset"]
+STATUSES = ["available", "ASSIGNED", "maintenance", "retired"]
+DEPARTMENTS = ["it", "hr", "sales", "finance", "ops", " legal "]
+FIRST = ["alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi"]
+LAST = ["smith", "jones", "patel", "garcia", "kim", "nguyen", "müller", "o'neil"]
+
+
+def columns(count: int, seed: int = 7) -> dict[str, dict[str, list]]:
+    # about 1% of rows break one rule, as a messy CSV export would
+    rng = random.Random(seed)
+    dates = [f"202{rng.randint(0, 5)}-{rng.randint(1, 12)}-{rng.randint(1, 28)}" for _ in range(2000)]
+    bad = set(rng.sample(range(count), count // 100))
+
+    return {
+        "assets": {
+            "names": [f"device {i}" if i not in bad else str(i) for i in range(count)],
+            "categories": [rng.choice(CATEGORIES) for _ in range(count)],
+            "statuses": [rng.choice(STATUSES) for _ in range(count)],
+        },
+        "employees": {
+            "names": [
+                f"{rng.choice(FIRST)} {rng.choice(LAST)}" if i not in bad else f"bot {i}"
+                for i in range(count)
+            ],
+            "departments": [rng.choice(DEPARTMENTS) for _ in range(count)],
+        },
+        "assignments": {
+            "asset_ids": list(range(1, count + 1)),
+            "employee_ids": [rng.randint(1, count // 2) for _ in range(count)],
+            "assigned_dates": [
+                rng.choice(dates) if i not in bad else "2025/01/30" for i in range(count)
+            ],
+            "return_dates": [rng.choice(dates) if i % 3 else None for i in range(count)],
+        },
+    }
+
+
+def per_object(model, fields: tuple[str, ...], data: dict[str, list]) -> int:
+    errors = 0
+    for values in zip(*data.values()):
+        try:
+            model(**dict(zip(fields, values)))
+        except ValueError:
+            errors += 1
+    return errors
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(count: int = 1_000_000) -> None:
+    data = columns(count)
+    cases = {
+        "assets": (Asset, ("name", "category", "status"), validate_assets),
+        "employees": (Employee, ("name", "department"), validate_employees),
+        "assignments": (
+            Assignment,
+            ("asset_id", "employee_id", "assigned_date", "return_date"),
+            validate_assignments,
+        ),
+    }
+
+    print(f"{count} rows per model")
+    print(f"{'MODEL':<12} | {'PER-OBJECT S':>12} | {'BATCH S':>8} | {'SPEEDUP':>7} | {'ERRORS':>7}")
+    print("-" * 60)
+
+    for name, (model, fields, validate) in cases.items():
+        slow, errors = timed(lambda: per_object(model, fields, data[name]))
+        fast, batch = timed(lambda: validate(*data[name].values()))
+        assert len(batch.errors) == errors
+        print(
+            f"{name:<12} | {slow:>12.2f} | {fast:>8.2f} | {slow / fast:>6.1f}x | {errors:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
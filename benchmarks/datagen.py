@@ -0,0 +1,140 @@
+import random
+import sqlite3 as sql
+import sys
+import time
+from contextlib import closing
+from datetime import date, timedelta
+from typing import Iterator
+
+from src.database import Database_manager, setup_database
+from src.models import Asset, Assignment, Employee
+
+CATEGORIES = {
+    "Laptop": ["Dell Latitude", "Lenovo Thinkpad", "Macbook Pro", "Hp Elitebook"],
+    "Monitor": ["Dell Ultrasharp", "Lg Ultrafine", "Samsung Odyssey"],
+    "Phone": ["Iphone", "Pixel", "Galaxy"],
+    "Tablet": ["Ipad", "Surface Go"],
+    "Headset": ["Jabra Evolve", "Poly Voyager"],
+    "Dock": ["Thunderbolt Dock", "Usb-C Hub"],
+}
+DEPARTMENTS = ["IT", "HR", "FINANCE", "SALES", "ENGINEERING", "SUPPORT", "LEGAL", "OPS"]
+FIRST_NAMES = [
+    "Aman", "Alice", "Bob", "Carol", "Dave", "Erin", "Frank", "Grace", "Heidi",
+    "Ivan", "Judy", "Mallory", "Niaj", "Olivia", "Peggy", "Rupert", "Sybil",
+    "Trent", "Victor", "Walter", "Priya", "Kenji", "Fatima", "Diego",
+]
+LAST_NAMES = [
+    "Smith", "Patel", "Garcia", "Chen", "Kumar", "Nguyen", "Muller", "Rossi",
+    "Kowalski", "Silva", "Tanaka", "Okafor", "Jensen", "Haddad", "Novak",
+]
+# sequential serial suffixes keep names unique without putting digits in people
+SERIAL_LETTERS = "ABCDEFGHJKLMNPQRSTUVWXYZ"
+
+
+def serial(n: int) -> str:
+    letters = SERIAL_LETTERS[n % 24] + SERIAL_LETTERS[n // 24 % 24]
+    return f"{letters}{n:07d}"
+
+
+def gen_assets(rng: random.Random, count: int) -> Iterator[Asset]:
+    categories = list(CATEGORIES)
+    for i in range(count):
+        category = rng.choice(categories)
+        model = rng.choice(CATEGORIES[category])
+        yield Asset(name=f"{model} {serial(i)}", category=category)
+
+
+def gen_employees(rng: random.Random, count: int) -> Iterator[Employee]:
+    for _ in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        yield Employee(name=name, department=rng.choice(DEPARTMENTS))
+
+
+def gen_history(
+    rng: random.Random, assets: int, employees: int, years: int, today: date
+) -> tuple[list[Assignment], list[Assignment]]:
+    closed: list[Assignment] = []
+    open_: list[Assignment] = []
+    start = today - timedelta(days=365 * years)
+
+    for asset_id in range(1, assets + 1):
+        day = start + timedelta(days=rng.randint(0, 60))
+
+        while True:
+            held = rng.randint(7, 540)
+            employee_id = rng.randint(1, employees)
+            returned = day + timedelta(days=held)
+
+            if returned >= today:
+                # roughly two thirds of assets end up currently assigned
+                if rng.random() < 0.66:
+                    open_.append(
+                        Assignment(asset_id, employee_id, day.isoformat())
+                    )
+                break
+
+            closed.append(
+                Assignment(asset_id, employee_id, day.isoformat(), returned.isoformat())
+            )
+            day = returned + timedelta(days=rng.randint(0, 90))
+
+    return closed, open_
+
+
+def generate(
+    db_name: str,
+    assets: int,
+    employees: int | None = None,
+    years: int = 3,
+    seed: int = 42,
+    today: date | None = None,
+) -> dict:
+    rng = random.Random(seed)
+    employees = employees or max(1, assets // 2)
+    today = today or date.today()
+    timings = {}
+
+    setup_database(db_name)
+
+    with Database_manager(
+        db_name, pooled=True, journal_mode="WAL", synchronous="OFF"
+    ) as db:
+        start = time.perf_counter()
+        db.bulk_add_assets(gen_assets(rng, assets))
+        db.bulk_add_employees(gen_employees(rng, employees))
+        timings["assets_and_employees"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        closed, open_ = gen_history(rng, assets, employees, years, today)
+
+        # returned assignments never change asset status, so they are written
+        # as-is; open ones go through bulk_assign to flip assets to ASSIGNED
+        with closing(sql.connect(db_name)) as conn:
+            conn.executemany(
+                "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(?,?,?,?)",
+                (
+                    (a.asset_id, a.employee_id, a.assigned_date, a.return_date)
+                    for a in closed
+                ),
+            )
+            conn.commit()
+
+        db.bulk_assign(open_)
+        timings["history"] = time.perf_counter() - start
+
+    return {
+        "assets": assets,
+        "employees": employees,
+        "closed_assignments": len(closed),
+        "open_assignments": len(open_),
+        "seconds": timings,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("usage: python -m benchmarks.datagen <db_file> <assets> [employees] [years]")
+        sys.exit(1)
+
+    args = [int(a) for a in sys.argv[3:5]]
+    print(generate(sys.argv[1], int(sys.argv[2]), *args))
@@ -0,0 +1,200 @@
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sqlite3 as sql
+import statistics
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable
+from unittest import mock
+
+import main as cli
+from benchmarks.datagen import generate
+from src.database import Database_manager
+from src.models import Asset, Assignment, Employee
+
+DEFAULT_SIZES = [10_000, 100_000]
+SEARCHES = ["dell lat", "macbook", "thinkpad", "ipad", "usb hub", "jabra evo"]
+PEOPLE_SEARCHES = ["alice pat", "kenji", "sales", "ga"]
+
+
+def measure(fn: Callable[[int], object], runs: int) -> dict:
+    latencies = []
+    for i in range(runs):
+        start = time.perf_counter()
+        fn(i)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "runs": runs,
+        "total_s": round(total, 6),
+        "ops_per_sec": round(runs / total, 1) if total else None,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 4),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 4),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(runs * 0.99))] * 1000, 4),
+    }
+
+
+def silent(view: Callable[[Database_manager], None]) -> Callable:
+    # the menu views page with input(); pressing Enter keeps them going
+    def run(db: Database_manager) -> None:
+        with mock.patch("builtins.input", return_value=""), redirect_stdout(io.StringIO()):
+            view(db)
+
+    return run
+
+
+def pick_ids(db_name: str, query: str, count: int, rng: random.Random) -> list[int]:
+    with sql.connect(db_name) as conn:
+        ids = [row[0] for row in conn.execute(query)]
+    rng.shuffle(ids)
+    return ids[:count]
+
+
+def bench_size(size: int, runs: int, list_runs: int, workdir: str) -> dict:
+    db_name = os.path.join(workdir, f"bench_{size}.db")
+    dataset = generate(db_name, size, seed=size)
+    rng = random.Random(size)
+    results = {}
+
+    available = pick_ids(
+        db_name, "SELECT id FROM assets WHERE status='AVAILABLE'", runs * 2, rng
+    )
+    assigned = pick_ids(
+        db_name, "SELECT id FROM assets WHERE status='ASSIGNED'", runs, rng
+    )
+    employees = pick_ids(db_name, "SELECT id FROM employees", runs * 2, rng)
+    runs = min(runs, len(available) // 2, len(assigned), len(employees) // 2)
+    today = date.today()
+
+    with Database_manager(
+        db_name,
+        pooled=True,
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        row_type="named",
+    ) as db:
+        seqs = [rng.randint(0, db.last_change_seq()) for _ in range(runs)]
+        point_ops = {
+            "add_assets": lambda i: db.add_assets(Asset(name=f"Bench {i}", category="Laptop")),
+            "add_employees": lambda i: db.add_employees(Employee(name="Bench Person", department="IT")),
+            "assign_asset": lambda i: db.assign_asset(
+                Assignment(asset_id=available[i], employee_id=employees[i])
+            ),
+            "return_asset": lambda i: db.return_asset(assigned[i], "2030-01-01"),
+            "update_asset_status": lambda i: db.update_asset_status(
+                available[runs + i], "MAINTENANCE"
+            ),
+            "offboard_employee": lambda i: db.offboard_employee(employees[runs + i]),
+            "get_asset": lambda i: db.get_asset(available[i]),
+            "get_employee": lambda i: db.get_employee(employees[i]),
+            "page_assets": lambda i: db.page_assets(after_id=available[i], limit=100),
+            "page_assets_filtered": lambda i: db.page_assets(
+                after_id=available[i], limit=100, status="AVAILABLE", category="Laptop"
+            ),
+            "search_assets": lambda i: db.search_assets(SEARCHES[i % len(SEARCHES)]),
+            "search_employees": lambda i: db.search_employees(
+                PEOPLE_SEARCHES[i % len(PEOPLE_SEARCHES)]
+            ),
+            "page_employees": lambda i: db.page_employees(after_id=employees[i], limit=100),
+            "page_active_assignments": lambda i: db.page_active_assignments(
+                after_id=assigned[i], limit=100
+            ),
+            "asset_history": lambda i: db.asset_history(assigned[i]),
+            "employee_history": lambda i: db.employee_history(employees[i]),
+            "changes_since": lambda i: db.changes_since(seqs[i], limit=500),
+            "last_change_seq": lambda i: db.last_change_seq(),
+            "get_inventory_summary": lambda i: db.get_inventory_summary(),
+            "idle_assets_top100": lambda i: db.idle_assets(90, limit=100),
+            "top_utilized": lambda i: db.top_utilized(10),
+        }
+        for name, fn in point_ops.items():
+            results[name] = measure(fn, runs)
+
+        scans = {
+            "get_all_assets": lambda i: db.get_all_assets(),
+            "get_all_employees": lambda i: db.get_all_employees(),
+            "get_active_assignments": lambda i: db.get_active_assignments(),
+            "iter_assets": lambda i: sum(1 for _ in db.iter_assets()),
+            "iter_active_assignments": lambda i: sum(1 for _ in db.iter_active_assignments()),
+            "iter_employees": lambda i: sum(1 for _ in db.iter_employees()),
+            "iter_history": lambda i: sum(1 for _ in db.iter_history()),
+            "utilization_1y": lambda i: db.utilization(
+                (today - timedelta(days=365)).isoformat(), today.isoformat()
+            ),
+            "idle_assets": lambda i: db.idle_assets(90),
+            "check_inventory_summary": lambda i: db.check_inventory_summary(),
+            "load_snapshot": lambda i: db.load_snapshot(),
+            "cli.handle_list_assets": lambda i: silent(cli.handle_list_assets)(db),
+            "cli.handle_list_employees": lambda i: silent(cli.handle_list_employees)(db),
+            "cli.get_assignments": lambda i: silent(cli.get_assignments)(db),
+        }
+        for name, fn in scans.items():
+            results[name] = measure(fn, list_runs)
+
+        bulk_rows = [{"name": f"Bulk {i}", "category": "Dock"} for i in range(size // 10)]
+        results["bulk_add_assets"] = measure(lambda i: db.bulk_add_assets(bulk_rows), 1)
+        results["bulk_add_assets"]["rows"] = len(bulk_rows)
+
+        people = [{"name": "Bulk Person", "department": "IT"} for _ in range(size // 10)]
+        results["bulk_add_employees"] = measure(lambda i: db.bulk_add_employees(people), 1)
+        results["bulk_add_employees"]["rows"] = len(people)
+
+        # fresh picks, since the point operations above changed statuses
+        free = pick_ids(db_name, "SELECT id FROM assets WHERE status='AVAILABLE'", size // 100, rng)
+        active = pick_ids(db_name, "SELECT id FROM employees WHERE is_active=1", size // 50, rng)
+        moves = [
+            {"asset_id": asset_id, "employee_id": employee_id}
+            for asset_id, employee_id in zip(free, active)
+        ]
+        results["bulk_assign"] = measure(lambda i: db.bulk_assign(moves), 1)
+        results["bulk_assign"]["rows"] = len(moves)
+
+        leavers = active[len(moves):]
+        results["bulk_offboard"] = measure(lambda i: db.bulk_offboard(leavers), 1)
+        results["bulk_offboard"]["rows"] = len(leavers)
+
+    return {"size": size, "dataset": dataset, "operations": results}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Asset tracker benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--runs", type=int, default=200, help="runs per point operation")
+    parser.add_argument("--list-runs", type=int, default=3, help="runs per full scan")
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sql.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            result = bench_size(size, args.runs, args.list_runs, workdir)
+            report["results"].append(result)
+
+            print(f"\n== {size:,} assets ==")
+            for name, stats in result["operations"].items():
+                print(f"{name:<28} {stats['ops_per_sec'] or 0:>12,.1f} ops/s  p99 {stats['p99_ms']:>9.3f} ms")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
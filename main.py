@@ -1,7 +1,55 @@
+import argparse
+import shlex
+import sqlite3 as sql
+import sys
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 from src.models import Asset, Employee, Assignment, get_today
-from src.database import Database_manager, setup_database
+from src.database import (
+    BULK_CHUNK_SIZE,
+    AssetRow,
+    ChangeRow,
+    Database_manager,
+    EmployeeRow,
+    HistoryRow,
+    OpenAssignmentRow,
+    RECLAIM_STATUSES,
+    setup_database,
+)
+from src.fileio import FORMATS, WRITE_FORMATS, read_records, write_records
+
+if TYPE_CHECKING:
+    from src.maintenance import MaintenanceReport
 
 DB_NAME = "data.db"
+LIST_PAGE_SIZE = 20
+OUTPUT_FORMATS = ("table", *WRITE_FORMATS)
+COMMANDS = {
+    "add-asset": "Add an asset, print its ID",
+    "add-employee": "Add an employee, print their ID",
+    "assign": "Assign an asset to an employee",
+    "return": "Return an assigned asset",
+    "set-status": "Set an asset's status",
+    "list-assets": "Stream assets",
+    "list-employees": "Stream employees",
+    "list-assignments": "Stream active assignments",
+    "batch": "Run one subcommand per line from stdin or a file",
+    "import": "Bulk import rows from CSV/JSONL",
+    "check-summary": "Verify the dashboard summary counters",
+    "offboard": "Offboard employees and reclaim their assets",
+    "search": "Ranked prefix search by name",
+    "export-history": "Stream assignment history as CSV/JSONL",
+    "tail": "Stream the change log from a sequence number",
+    "serve": "Serve the JSON HTTP API",
+    "backup": "Copy the live database to a file",
+    "snapshot": "Write a compacted VACUUM INTO copy, keeping the newest N",
+    "restore": "Replace the database with a backup",
+    "compact": "Archive old closed assignments and shrink the file",
+}
+ASSET_HEADER = f"{'ID':<5} | {'NAME':<20} | {'CATEGORY':<15} | {'STATUS':<12}"
+EMPLOYEE_HEADER = f"{'ID':<5} | {'NAME':<20} | {'DEPT':<15} | {'ACTIVE':<12}"
+ASSIGNMENT_HEADER = f"{'EMPLOYEE':<20} | {'ASSET':<20} | {'DATE':12}"
+CHANGE_HEADER = f"{'SEQ':<8} | {'TABLE':<11} | {'OP':<6} | {'ROW':<8} | {'DATA'}"
 
 
 def handle_add_asset(db: Database_manager) -> None:
@@ -111,48 +159,112 @@ def handle_offboard_employee(db: Database_manager) -> None:
         print("Error: Employee ID must be a number.")
         return
 
+    reclaim = input("Reclaim assigned assets? [Y/n]: ").strip().lower() != "n"
+
     try:
         emp_id = int(emp_id_input)
 
-        db.offboard_employee(emp_id)
+        result = db.offboard_employee(emp_id, reclaim=reclaim)
+        for _, asset_id in result.reclaimed:
+            print(f"Reclaimed asset {asset_id}")
         print("-- Employee offboarded --\n")
 
     except ValueError as e:
         print(f"ERROR: {e}")
 
 
+def print_paged(lines: Iterator[str], page_size: int = LIST_PAGE_SIZE) -> None:
+    for count, line in enumerate(lines, 1):
+        print(line)
+
+        if count % page_size == 0:
+            if input("-- Enter for more, q to stop --").strip().lower() == "q":
+                return
+
+
 def handle_list_assets(db: Database_manager) -> None:
     print("\n--- All Assets ---\n")
-    assets = db.get_all_assets()
 
-    print(f"{'ID':<5} | {'NAME':<20} | {'CATEGORY':<15} | {'STATUS':<12}")
+    print(ASSET_HEADER)
     print("-" * 60)
 
-    for asset in assets:
-        print(f"{asset[0]:<5} | {asset[1]:<20} | {asset[2]:<15} | {asset[3]:<12}")
+    print_paged(format_asset(asset) for asset in db.iter_assets())
+
+
+def format_asset(asset: AssetRow) -> str:
+    return f"{asset.id:<5} | {asset.name:<20} | {asset.category:<15} | {asset.status:<12}"
+
+
+def format_employee(emp: EmployeeRow) -> str:
+    status = "Yes" if emp.is_active == 1 else "No"
+    return f"{emp.id:<5} | {emp.name:<20} | {emp.department:<15} | {status:<12}"
 
 
 def handle_list_employees(db: Database_manager) -> None:
     print("\n--- All Employees ---\n")
-    emps = db.get_all_employees()
 
-    print(f"{'ID':<5} | {'NAME':<20} | {'DEPT':<15} | {'ACTIVE':<12}")
+    print(EMPLOYEE_HEADER)
     print("-" * 60)
 
-    for emp in emps:
-        status = "Yes" if emp[3] == 1 else "No"
-        print(f"{emp[0]:<5} | {emp[1]:<20} | {emp[2]:<15} | {status:<12}")
+    print_paged(format_employee(emp) for emp in db.iter_employees())
 
 
 def get_assignments(db: Database_manager) -> None:
     print("\n--- All ASSIGNMENTS ---\n")
-    rows = db.get_active_assignments()
 
-    print(f"{'EMPLOYEE':<20} | {'ASSET':<20} | {'DATE':12}")
+    print(ASSIGNMENT_HEADER)
     print("-" * 60)
 
-    for row in rows:
-        print(f"{row[0]:<20} | {row[1]:<20} | {row[2]:<12}")
+    print_paged(format_assignment(row) for row in db.iter_active_assignments())
+
+
+def format_assignment(row: OpenAssignmentRow) -> str:
+    return f"{row.employee:<20} | {row.asset:<20} | {row.assigned_date:<12}"
+
+
+def handle_inventory_summary(db: Database_manager) -> None:
+    print("\n--- Inventory Summary ---\n")
+    summary = db.get_inventory_summary()
+    statuses = ["AVAILABLE", "ASSIGNED", "MAINTENANCE", "RETIRED"]
+
+    print(f"{'CATEGORY':<15} | " + " | ".join(f"{s:<11}" for s in statuses))
+    print("-" * 70)
+
+    for category, counts in sorted(summary["assets"].items()):
+        cells = " | ".join(f"{counts.get(s, 0):<11}" for s in statuses)
+        print(f"{category:<15} | {cells}")
+
+    print("\n--- Assigned by Department ---\n")
+    print(f"{'DEPT':<15} | {'CATEGORY':<15} | {'ASSIGNED':<8}")
+    print("-" * 45)
+
+    for department, counts in sorted(summary["assigned_by_department"].items()):
+        for category, assigned in sorted(counts.items()):
+            print(f"{department:<15} | {category:<15} | {assigned:<8}")
+
+
+def handle_search(db: Database_manager) -> None:
+    print("\n--- Search ---\n")
+
+    target = input("Search (a)ssets or (e)mployees? [a]: ").strip().lower()
+    query = input("Search for: ")
+
+    try:
+        if target == "e":
+            rows = db.search_employees(query, limit=LIST_PAGE_SIZE)
+            print(EMPLOYEE_HEADER)
+            print("-" * 60)
+            lines = [format_employee(emp) for emp in rows]
+        else:
+            rows = db.search_assets(query, limit=LIST_PAGE_SIZE)
+            print(ASSET_HEADER)
+            print("-" * 60)
+            lines = [format_asset(asset) for asset in rows]
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return
+
+    print("\n".join(lines) if lines else "No matches.")
 
 
 def print_menu() -> None:
@@ -168,14 +280,13 @@ def print_menu() -> None:
     print("7. View Active Assignments")
     print("8. View All Assets")
     print("9. View All Employees")
+    print("10. Inventory Summary")
+    print("11. Search Assets/Employees")
     print("0. Exit")
     print("=" * 40)
 
 
-def main() -> None:
-    setup_database(DB_NAME)
-    db = Database_manager(DB_NAME)
-
+def run_menu(db: Database_manager) -> None:
     print_menu()
 
     while True:
@@ -202,6 +313,10 @@ def main() -> None:
                 handle_list_assets(db)
             case "9":
                 handle_list_employees(db)
+            case "10":
+                handle_inventory_summary(db)
+            case "11":
+                handle_search(db)
             case "0":
                 print("Exiting....")
                 break
@@ -209,5 +324,523 @@ def main() -> None:
                 print("Invalid choice, please try again.")
 
 
+def write_rows(
+    rows: Iterable,
+    fmt: str,
+    fieldnames: tuple[str, ...],
+    header: str,
+    format_row: Callable,
+) -> int:
+    if fmt != "table":
+        return write_records(rows, sys.stdout, fmt, fieldnames)
+
+    print(header)
+    print("-" * 60)
+    count = 0
+    for row in rows:
+        print(format_row(row))
+        count += 1
+    return count
+
+
+def handle_add_asset_command(db: Database_manager, args: argparse.Namespace) -> int:
+    print(db.add_assets(Asset(name=args.name, category=args.category)))
+    return 0
+
+
+def handle_add_employee_command(
+    db: Database_manager, args: argparse.Namespace
+) -> int:
+    print(db.add_employees(Employee(name=args.name, department=args.department)))
+    return 0
+
+
+def handle_assign_command(db: Database_manager, args: argparse.Namespace) -> int:
+    if args.date is None:
+        assign = Assignment(asset_id=args.asset_id, employee_id=args.employee_id)
+    else:
+        assign = Assignment(
+            asset_id=args.asset_id, employee_id=args.employee_id, assigned_date=args.date
+        )
+
+    db.assign_asset(assign)
+    return 0
+
+
+def handle_return_command(db: Database_manager, args: argparse.Namespace) -> int:
+    db.return_asset(args.asset_id, args.date or get_today())
+    return 0
+
+
+def handle_set_status_command(db: Database_manager, args: argparse.Namespace) -> int:
+    db.update_asset_status(args.asset_id, args.status.strip().upper())
+    return 0
+
+
+def handle_list_assets_command(
+    db: Database_manager, args: argparse.Namespace
+) -> int:
+    rows = db.iter_assets(status=args.status, category=args.category)
+    write_rows(rows, args.format, AssetRow._fields, ASSET_HEADER, format_asset)
+    return 0
+
+
+def handle_list_employees_command(
+    db: Database_manager, args: argparse.Namespace
+) -> int:
+    rows = db.iter_employees(department=args.department, active=args.active)
+    write_rows(rows, args.format, EmployeeRow._fields, EMPLOYEE_HEADER, format_employee)
+    return 0
+
+
+def handle_list_assignments_command(
+    db: Database_manager, args: argparse.Namespace
+) -> int:
+    rows = db.iter_active_assignments(department=args.department, category=args.category)
+    write_rows(
+        rows, args.format, OpenAssignmentRow._fields, ASSIGNMENT_HEADER, format_assignment
+    )
+    return 0
+
+
+def run_command(db: Database_manager, args: argparse.Namespace) -> int:
+    try:
+        return args.handler(db, args)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+
+def handle_batch(db: Database_manager, args: argparse.Namespace) -> int:
+    # every line runs against the same open manager, so a large batch pays
+    # interpreter startup and connection setup once
+    parser = build_parser()
+    ran = failed = 0
+
+    for line_num, line in enumerate(args.input, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        ran += 1
+        try:
+            command = parser.parse_args(shlex.split(line))
+            if command.command is None:
+                raise ValueError("expected a command")
+            # neither returns until interrupted, which would stall the batch
+            if command.command in ("batch", "serve"):
+                raise ValueError(f"'{command.command}' cannot run inside a batch")
+            code = run_command(db, command)
+        except SystemExit as e:
+            # argparse has already printed the usage error
+            code = e.code
+        except (ValueError, sql.Error) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            code = 1
+
+        if code:
+            failed += 1
+            print(f"Line {line_num}: failed with exit code {code}", file=sys.stderr)
+            if args.stop_on_error:
+                break
+
+        sys.stdout.flush()
+
+    print(f"Ran {ran} commands, {failed} failed", file=sys.stderr)
+    return 0 if not failed else 2
+
+
+def handle_import(db: Database_manager, args: argparse.Namespace) -> int:
+    importers = {
+        "assets": db.bulk_add_assets,
+        "employees": db.bulk_add_employees,
+        "assignments": db.bulk_assign,
+    }
+
+    try:
+        records = read_records(args.path, args.format)
+        result = importers[args.kind](records, chunk_size=args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    for row_num, message in result.errors:
+        print(f"Row {row_num}: {message}", file=sys.stderr)
+
+    print(f"Imported {result.inserted} {args.kind}, {len(result.errors)} rejected")
+    return 0 if not result.errors else 2
+
+
+def handle_check_summary(db: Database_manager, args: argparse.Namespace) -> int:
+    mismatches = db.check_inventory_summary(rebuild=args.rebuild)
+
+    for table, *key, stored, actual in mismatches:
+        print(f"{table}: ({', '.join(map(str, key))}) stored={stored} actual={actual}")
+
+    if not mismatches:
+        print("Summary counters are consistent.")
+    elif args.rebuild:
+        print(f"Rebuilt summary counters ({len(mismatches)} mismatches fixed).")
+    else:
+        print(f"{len(mismatches)} mismatches found. Re-run with --rebuild to fix.")
+
+    return 0 if not mismatches or args.rebuild else 2
+
+
+def handle_offboard(db: Database_manager, args: argparse.Namespace) -> int:
+    try:
+        result = db.bulk_offboard(
+            args.employee_ids,
+            reclaim=not args.keep_assets,
+            return_date=args.date,
+            reclaim_status=args.status,
+        )
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    for employee_id in result.missing:
+        print(f"Employee ID {employee_id} not found.", file=sys.stderr)
+
+    for employee_id, asset_id in result.reclaimed:
+        print(f"Reclaimed asset {asset_id} from employee {employee_id}")
+
+    print(
+        f"Offboarded {len(result.offboarded)} employees, "
+        f"reclaimed {len(result.reclaimed)} assets"
+    )
+    return 0 if not result.missing else 2
+
+
+def handle_search_command(db: Database_manager, args: argparse.Namespace) -> int:
+    try:
+        if args.kind == "employees":
+            rows = db.search_employees(args.query, limit=args.limit)
+            lines = [format_employee(emp) for emp in rows]
+        else:
+            rows = db.search_assets(args.query, limit=args.limit)
+            lines = [format_asset(asset) for asset in rows]
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    for line in lines:
+        print(line)
+    return 0 if lines else 2
+
+
+def handle_export_history(db: Database_manager, args: argparse.Namespace) -> int:
+    try:
+        rows = db.iter_history(
+            start=args.start,
+            end=args.end,
+            asset_id=args.asset_id,
+            employee_id=args.employee_id,
+        )
+
+        if args.output == "-":
+            count = write_records(rows, sys.stdout, args.format, HistoryRow._fields)
+        else:
+            with open(args.output, "w", newline="", encoding="utf-8") as f:
+                count = write_records(rows, f, args.format, HistoryRow._fields)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Exported {count} assignments", file=sys.stderr)
+    return 0
+
+
+def format_change(change: ChangeRow) -> str:
+    return (
+        f"{change.seq:<8} | {change.table_name:<11} | {change.op:<6} | "
+        f"{change.row_id:<8} | {change.data or ''}"
+    )
+
+
+def handle_tail(db: Database_manager, args: argparse.Namespace) -> int:
+    last_seq = args.since
+
+    def changes() -> Iterator[ChangeRow]:
+        nonlocal last_seq
+
+        while True:
+            rows = db.changes_since(last_seq, limit=args.limit, table=args.table)
+            yield from rows
+
+            if rows:
+                last_seq = rows[-1].seq
+            if len(rows) < args.limit:
+                if not args.follow:
+                    return
+                # caught up: show what we have before waiting for more
+                sys.stdout.flush()
+                time.sleep(args.interval)
+
+    rows: Iterable = changes()
+    if args.format in ("json", "jsonl"):
+        import json
+
+        # nested JSON rather than a JSON string inside each record
+        rows = (change._replace(data=json.loads(change.data or "null")) for change in rows)
+
+    try:
+        write_rows(rows, args.format, ChangeRow._fields, CHANGE_HEADER, format_change)
+    except KeyboardInterrupt:
+        pass
+
+    # pass this back as --since to pick up where this run stopped
+    print(f"Last seq: {last_seq}", file=sys.stderr)
+    return 0
+
+
+def handle_serve(db: Database_manager, args: argparse.Namespace) -> int:
+    from src.http_api import ApiServer
+
+    # the server opens its own reader and writer connections
+    server = ApiServer(args.db, host=args.host, port=args.port, readers=args.readers)
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port} (Ctrl-C to stop)", file=sys.stderr, flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def print_report(report: "MaintenanceReport") -> None:
+    stats = ", ".join(f"{name}={value}" for name, value in report.stats.items())
+    print(f"{report.path}: {stats}", file=sys.stderr)
+    for phase, seconds in report.timings.items():
+        print(f"  {phase:<12} {seconds * 1000:>9.1f} ms", file=sys.stderr)
+
+
+def handle_maintenance(db: Database_manager, args: argparse.Namespace) -> int:
+    from src import maintenance
+
+    # the maintenance functions open their own connections, so the
+    # manager's pooled ones are closed first
+    db.close()
+
+    try:
+        match args.command:
+            case "backup":
+                report = maintenance.backup(args.db, args.dest, args.pages, args.delay)
+            case "snapshot":
+                report = maintenance.snapshot(args.db, args.directory, args.keep)
+            case "restore":
+                report = maintenance.restore(args.db, args.source, args.pages, args.delay)
+            case "compact":
+                report = maintenance.compact(
+                    args.db, args.archive, args.years, vacuum=not args.no_vacuum
+                )
+    except (OSError, ValueError, sql.Error) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    print_report(report)
+    return 0
+
+
+def positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Asset Management System")
+    parser.add_argument("--db", default=DB_NAME, help="SQLite database file")
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        help="write latency metrics on exit (.json, otherwise Prometheus text)",
+    )
+    commands = parser.add_subparsers(dest="command")
+    wanted = requested_command(argv) if argv is not None else None
+
+    # argparse spends ~1ms per subparser; a one-shot command only needs its own
+    for name in COMMANDS:
+        if wanted is None or name == wanted:
+            add_command(commands, name)
+
+    return parser
+
+
+def requested_command(argv: list[str]) -> str | None:
+    args = iter(argv)
+    for arg in args:
+        if arg in ("--db", "--metrics"):
+            next(args, None)
+        elif arg in ("-h", "--help"):
+            return None
+        elif not arg.startswith("-"):
+            return arg if arg in COMMANDS else None
+    return None
+
+
+def add_command(commands: argparse._SubParsersAction, name: str) -> None:
+    sub = commands.add_parser(name, help=COMMANDS[name])
+
+    match name:
+        case "add-asset":
+            sub.add_argument("name")
+            sub.add_argument("category")
+            sub.set_defaults(handler=handle_add_asset_command)
+        case "add-employee":
+            sub.add_argument("name")
+            sub.add_argument("department")
+            sub.set_defaults(handler=handle_add_employee_command)
+        case "assign":
+            sub.add_argument("asset_id", type=int)
+            sub.add_argument("employee_id", type=int)
+            sub.add_argument("--date", help="YYYY-MM-DD (default today)")
+            sub.set_defaults(handler=handle_assign_command)
+        case "return":
+            sub.add_argument("asset_id", type=int)
+            sub.add_argument("--date", help="YYYY-MM-DD (default today)")
+            sub.set_defaults(handler=handle_return_command)
+        case "set-status":
+            sub.add_argument("asset_id", type=int)
+            sub.add_argument("status", help="AVAILABLE, MAINTENANCE or RETIRED")
+            sub.set_defaults(handler=handle_set_status_command)
+        case "list-assets":
+            sub.add_argument("--status")
+            sub.add_argument("--category")
+            sub.add_argument("--format", choices=OUTPUT_FORMATS, default="table")
+            sub.set_defaults(handler=handle_list_assets_command)
+        case "list-employees":
+            sub.add_argument("--department")
+            active = sub.add_mutually_exclusive_group()
+            active.add_argument("--active", action="store_true", default=None)
+            active.add_argument("--inactive", action="store_false", dest="active")
+            sub.add_argument("--format", choices=OUTPUT_FORMATS, default="table")
+            sub.set_defaults(handler=handle_list_employees_command)
+        case "list-assignments":
+            sub.add_argument("--department")
+            sub.add_argument("--category")
+            sub.add_argument("--format", choices=OUTPUT_FORMATS, default="table")
+            sub.set_defaults(handler=handle_list_assignments_command)
+        case "batch":
+            sub.add_argument(
+                "input", nargs="?", type=argparse.FileType("r"), default=sys.stdin
+            )
+            sub.add_argument("--stop-on-error", action="store_true")
+            sub.set_defaults(handler=handle_batch)
+        case "import":
+            sub.add_argument("kind", choices=["assets", "employees", "assignments"])
+            sub.add_argument("path")
+            sub.add_argument("--format", choices=FORMATS, default=None)
+            sub.add_argument("--chunk-size", type=positive_int, default=BULK_CHUNK_SIZE)
+            sub.set_defaults(handler=handle_import)
+        case "check-summary":
+            sub.add_argument(
+                "--rebuild", action="store_true", help="rewrite them from a recount"
+            )
+            sub.set_defaults(handler=handle_check_summary)
+        case "offboard":
+            sub.add_argument("employee_ids", type=int, nargs="+", metavar="EMPLOYEE_ID")
+            sub.add_argument("--date", help="return date YYYY-MM-DD (default today)")
+            sub.add_argument(
+                "--status",
+                choices=RECLAIM_STATUSES,
+                default="AVAILABLE",
+                help="status for reclaimed assets",
+            )
+            sub.add_argument(
+                "--keep-assets", action="store_true", help="only deactivate the employees"
+            )
+            sub.set_defaults(handler=handle_offboard)
+        case "search":
+            sub.add_argument("kind", choices=["assets", "employees"])
+            sub.add_argument("query", help='words or word prefixes, e.g. "dell lat"')
+            sub.add_argument("--limit", type=positive_int, default=LIST_PAGE_SIZE)
+            sub.set_defaults(handler=handle_search_command)
+        case "export-history":
+            sub.add_argument("--start", help="only assignments open on/after YYYY-MM-DD")
+            sub.add_argument("--end", help="only assignments starting on/before YYYY-MM-DD")
+            sub.add_argument("--asset-id", type=int)
+            sub.add_argument("--employee-id", type=int)
+            sub.add_argument("--format", choices=FORMATS, default="csv")
+            sub.add_argument("--output", default="-", help="file path, or - for stdout")
+            sub.set_defaults(handler=handle_export_history)
+        case "tail":
+            sub.add_argument("--since", type=int, default=0, metavar="SEQ")
+            sub.add_argument("--table", choices=["assets", "employees", "assignments"])
+            sub.add_argument("--limit", type=positive_int, default=500, help="changes per read")
+            sub.add_argument(
+                "--follow", "-f", action="store_true", help="keep polling for new changes"
+            )
+            sub.add_argument("--interval", type=float, default=1.0, help="poll seconds")
+            sub.add_argument("--format", choices=OUTPUT_FORMATS, default="table")
+            sub.set_defaults(handler=handle_tail)
+        case "serve":
+            sub.add_argument("--host", default="127.0.0.1")
+            sub.add_argument("--port", type=int, default=8000, help="0 picks a free port")
+            sub.add_argument("--readers", type=int, default=4, help="reader threads")
+            sub.set_defaults(handler=handle_serve)
+        case "backup" | "restore":
+            from src.maintenance import BACKUP_DELAY, BACKUP_PAGES
+
+            if name == "backup":
+                sub.add_argument("dest", help="backup file to write")
+            else:
+                sub.add_argument("source", help="backup file to restore from")
+            sub.add_argument(
+                "--pages", type=int, default=BACKUP_PAGES, help="pages per copy step"
+            )
+            sub.add_argument(
+                "--delay", type=float, default=BACKUP_DELAY, help="seconds to pause between steps"
+            )
+            sub.set_defaults(handler=handle_maintenance)
+        case "snapshot":
+            sub.add_argument("directory")
+            sub.add_argument("--keep", type=positive_int, default=7, help="snapshots to keep")
+            sub.set_defaults(handler=handle_maintenance)
+        case "compact":
+            sub.add_argument("--archive", required=True, help="archive database file")
+            sub.add_argument(
+                "--years", type=int, required=True, help="keep closed assignments this recent"
+            )
+            sub.add_argument("--no-vacuum", action="store_true", help="skip shrinking the file")
+            sub.set_defaults(handler=handle_maintenance)
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = build_parser(argv).parse_args(argv)
+    setup_database(args.db)
+    instrumentation = None
+
+    if args.metrics:
+        from src.instrumentation import Instrumentation
+
+        instrumentation = Instrumentation()
+
+    try:
+        with Database_manager(
+            args.db,
+            pooled=True,
+            journal_mode="WAL",
+            synchronous="NORMAL",
+            row_type="named",
+            instrumentation=instrumentation,
+        ) as db:
+            if args.command is None:
+                run_menu(db)
+                return 0
+
+            return run_command(db, args)
+    finally:
+        if instrumentation is not None:
+            instrumentation.export(args.metrics)
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
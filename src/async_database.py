@@ -0,0 +1,161 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterable
+
+from src.database import (
+    BULK_CHUNK_SIZE,
+    PAGE_SIZE,
+    BulkResult,
+    Database_manager,
+    OffboardResult,
+)
+from src.models import Asset, Assignment, Employee
+
+
+class AsyncDatabaseManager:
+    def __init__(
+        self,
+        db_name: str,
+        readers: int = 4,
+        max_pending: int = 256,
+        **options: Any,
+    ) -> None:
+        options.setdefault("journal_mode", "WAL")
+        options.setdefault("synchronous", "NORMAL")
+        self.db = Database_manager(db_name, pooled=True, **options)
+
+        # one writer thread serialises writes; WAL lets readers run beside it
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="db-writer")
+        self._readers = ThreadPoolExecutor(readers, thread_name_prefix="db-reader")
+
+        # callers wait here once max_pending calls are queued (back-pressure)
+        self._write_slots = asyncio.Semaphore(max_pending)
+        self._read_slots = asyncio.Semaphore(max_pending)
+
+    async def __aenter__(self) -> "AsyncDatabaseManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _write(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        async with self._write_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._writer, functools.partial(fn, *args, **kwargs)
+            )
+
+    async def _read(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        async with self._read_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._readers, functools.partial(fn, *args, **kwargs)
+            )
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        self.db.close()
+
+    async def add_assets(self, asset: Asset) -> int:
+        return await self._write(self.db.add_assets, asset)
+
+    async def add_employees(self, emp: Employee) -> int:
+        return await self._write(self.db.add_employees, emp)
+
+    async def assign_asset(self, assign: Assignment) -> None:
+        await self._write(self.db.assign_asset, assign)
+
+    async def return_asset(self, asset_id: int, return_date: str) -> None:
+        await self._write(self.db.return_asset, asset_id, return_date)
+
+    async def update_asset_status(self, asset_id: int, new_status: str) -> None:
+        await self._write(self.db.update_asset_status, asset_id, new_status)
+
+    async def offboard_employee(
+        self, employee_id: int, **kwargs: Any
+    ) -> OffboardResult:
+        return await self._write(self.db.offboard_employee, employee_id, **kwargs)
+
+    async def bulk_offboard(
+        self, employee_ids: Iterable[int], **kwargs: Any
+    ) -> OffboardResult:
+        return await self._write(self.db.bulk_offboard, list(employee_ids), **kwargs)
+
+    async def bulk_add_assets(
+        self, records: Iterable, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return await self._write(self.db.bulk_add_assets, records, chunk_size)
+
+    async def bulk_add_employees(
+        self, records: Iterable, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return await self._write(self.db.bulk_add_employees, records, chunk_size)
+
+    async def bulk_assign(
+        self, records: Iterable, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return await self._write(self.db.bulk_assign, records, chunk_size)
+
+    async def get_asset(self, asset_id: int) -> Any:
+        return await self._read(self.db.get_asset, asset_id)
+
+    async def get_employee(self, employee_id: int) -> Any:
+        return await self._read(self.db.get_employee, employee_id)
+
+    async def get_all_assets(self) -> list:
+        return await self._read(self.db.get_all_assets)
+
+    async def get_all_employees(self) -> list:
+        return await self._read(self.db.get_all_employees)
+
+    async def get_active_assignments(self) -> list:
+        return await self._read(self.db.get_active_assignments)
+
+    async def page_assets(self, **kwargs: Any) -> list:
+        return await self._read(self.db.page_assets, **kwargs)
+
+    async def page_employees(self, **kwargs: Any) -> list:
+        return await self._read(self.db.page_employees, **kwargs)
+
+    async def page_active_assignments(self, **kwargs: Any) -> list:
+        return await self._read(self.db.page_active_assignments, **kwargs)
+
+    async def iter_assets(
+        self, batch_size: int = PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[tuple]:
+        async for row in self._iter_pages(self.db.page_assets, batch_size, filters):
+            yield row
+
+    async def iter_employees(
+        self, batch_size: int = PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[tuple]:
+        async for row in self._iter_pages(self.db.page_employees, batch_size, filters):
+            yield row
+
+    async def iter_active_assignments(
+        self, batch_size: int = PAGE_SIZE, **filters: Any
+    ) -> AsyncIterator[tuple]:
+        async for row in self._iter_pages(
+            self.db.page_active_assignments, batch_size, filters
+        ):
+            yield row
+
+    async def _iter_pages(
+        self, page: Callable, batch_size: int, filters: dict
+    ) -> AsyncIterator[tuple]:
+        after_id = 0
+
+        while True:
+            rows = await self._read(page, after_id=after_id, limit=batch_size, **filters)
+            for row in rows:
+                yield row
+
+            if len(rows) < batch_size:
+                return
+            after_id = self.db._row_id(rows[-1])
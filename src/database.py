@@ -1,129 +1,598 @@
+import functools
+import re
 import sqlite3 as sql
-from src.models import Asset, Employee, Assignment
+import threading
+import time
+from collections import namedtuple
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
+from src.models import Asset, Employee, Assignment, get_today, parse_date
+from src.migrations import (
+    ASSET_STATS_QUERY,
+    CHANGE_COLUMNS,
+    DEPARTMENT_SUMMARY_QUERY,
+    INVENTORY_SUMMARY_QUERY,
+    SCHEMA_VERSION,
+    bulk_insert_sql,
+    get_version,
+    migrate,
+)
+from src.cache import LRUCache
+
+# group commit pulls in concurrent.futures and instrumentation pulls in
+# logging; neither is needed for a one-shot CLI call, so they load on use
+if TYPE_CHECKING:
+    from src.group_commit import GroupCommitter
+    from src.instrumentation import Instrumentation
+    from src.snapshot import Snapshot
+
+BULK_CHUNK_SIZE = 5000
+PAGE_SIZE = 500
+BUSY_RETRIES = 5
+BUSY_RETRY_DELAY = 0.01
+UNINSTRUMENTED_METHODS = {"close", "cache_stats", "group_commit"}
+
+ROW_TYPES = ("tuple", "named", "model")
+ASSET_STATUSES = ("AVAILABLE", "ASSIGNED", "MAINTENANCE", "RETIRED")
+# ASSIGNED is only ever set by an assignment, so an ASSIGNED asset always
+# has an open assignment to return
+MANUAL_STATUSES = tuple(status for status in ASSET_STATUSES if status != "ASSIGNED")
+RECLAIM_STATUSES = ("AVAILABLE", "MAINTENANCE")
+_SEARCH_TERM_RE = re.compile(r"\w+")
+
+AssetRow = namedtuple("AssetRow", "id name category status")
+EmployeeRow = namedtuple("EmployeeRow", "id name department is_active")
+AssignmentRow = namedtuple(
+    "AssignmentRow", "id asset_id employee_id assigned_date return_date"
+)
+ActiveAssignmentRow = namedtuple("ActiveAssignmentRow", "employee asset assigned_date")
+OpenAssignmentRow = namedtuple("OpenAssignmentRow", "id employee asset assigned_date")
+HistoryRow = namedtuple(
+    "HistoryRow",
+    "id asset_id asset category employee_id employee department assigned_date return_date",
+)
+UtilizationRow = namedtuple(
+    "UtilizationRow", "asset_id asset category assignments days_assigned utilization"
+)
+ChangeRow = namedtuple("ChangeRow", "seq table_name row_id op data changed_at")
+IdleAssetRow = namedtuple("IdleAssetRow", "id name category status last_returned idle_days")
+UtilizedAssetRow = namedtuple("UtilizedAssetRow", "id name category assignments days")
+
+# join views have no model class, so "model" mode falls back to named rows
+ROW_MAPPERS = {
+    "tuple": {},
+    "named": {
+        "asset": AssetRow._make,
+        "employee": EmployeeRow._make,
+        "assignment": AssignmentRow._make,
+        "active": ActiveAssignmentRow._make,
+        "open": OpenAssignmentRow._make,
+        "history": HistoryRow._make,
+        "utilization": UtilizationRow._make,
+        "change": ChangeRow._make,
+        "idle": IdleAssetRow._make,
+        "utilized": UtilizedAssetRow._make,
+    },
+    "model": {
+        "asset": Asset.from_row,
+        "employee": Employee.from_row,
+        "assignment": Assignment.from_row,
+        "active": ActiveAssignmentRow._make,
+        "open": OpenAssignmentRow._make,
+        "history": HistoryRow._make,
+        "utilization": UtilizationRow._make,
+        "change": ChangeRow._make,
+        "idle": IdleAssetRow._make,
+        "utilized": UtilizedAssetRow._make,
+    },
+}
 
 
 def setup_database(db_name: str) -> None:
-    with sql.connect(db_name) as conn:
-        cursor = conn.cursor()
-        cursor.execute("PRAGMA foreign_keys = ON;")
-
-        cursor.execute("""CREATE TABLE IF NOT EXISTS assets(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            category TEXT,
-            status TEXT DEFAULT 'AVAILABLE'
-            )""")
-
-        cursor.execute("""CREATE TABLE IF NOT EXISTS employees(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            department TEXT,
-            is_active INTEGER DEFAULT 1
-            )""")
-
-        cursor.execute("""CREATE TABLE IF NOT EXISTS assignments(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            asset_id INTEGER,
-            employee_id INTEGER,
-            assigned_date TEXT,
-            return_date TEXT,
-            FOREIGN KEY (asset_id) REFERENCES assets(id),
-            FOREIGN KEY (employee_id) REFERENCES employees(id)
-            )""")
+    with closing(sql.connect(db_name)) as conn:
+        # the common case on every CLI launch: one pragma read, no DDL
+        if get_version(conn) == SCHEMA_VERSION:
+            return
+
+        conn.execute("PRAGMA foreign_keys = ON;")
+        migrate(conn)
+
+
+@dataclass
+class BulkResult:
+    inserted: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class OffboardResult:
+    offboarded: list[int] = field(default_factory=list)
+    reclaimed: list[tuple[int, int]] = field(default_factory=list)
+    missing: list[int] = field(default_factory=list)
+
+
+def model_from_record(
+    model: type,
+    record: Any,
+    required: tuple[str, ...],
+    optional: tuple[str, ...] = (),
+    int_fields: tuple[str, ...] = (),
+) -> Any:
+    if isinstance(record, model):
+        return record
+
+    if not isinstance(record, Mapping):
+        raise ValueError(f"Expected a mapping or {model.__name__}, got{type(record)}")
+
+    kwargs = {}
+    for key in required + optional:
+        value = record.get(key)
+
+        if value is None or value == "":
+            if key in required:
+                raise ValueError(f"Missing required field '{key}'")
+            continue
+
+        if key in int_fields:
+            if isinstance(value, str) and value.strip().isdigit():
+                value = int(value)
+        elif not isinstance(value, str):
+            value = str(value)
+
+        kwargs[key] = value
+
+    return model(**kwargs)
+
+
+def _overlap_clauses(
+    prefix: str, start: str | None, end: str | None
+) -> tuple[list[str], dict]:
+    # an assignment overlaps [start, end] if it began by the end and was
+    # still open, or returned, on or after the start
+    clauses: list[str] = []
+    params: dict = {}
+
+    if end is not None:
+        params["end"] = _checked_date(end)
+        clauses.append(f"{prefix}assigned_date <= :end")
+
+    if start is not None:
+        params["start"] = _checked_date(start)
+        clauses.append(
+            f"({prefix}return_date IS NULL OR {prefix}return_date >= :start)"
+        )
+
+    return clauses, params
+
+
+def _checked_date(value: str) -> str:
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValueError("Dates must be in YYYY-MM-DD format (e.g., 2025-01-30)")
+    return parsed
+
+
+def _fts_query(text: str) -> str:
+    # every word becomes a quoted prefix term, so punctuation in user input
+    # cannot be read as FTS5 syntax and "dell lat" matches "Dell Latitude"
+    terms = _SEARCH_TERM_RE.findall(text)
+    if not terms:
+        raise ValueError("Search query must contain letters or digits.")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _new_asset(asset: Asset) -> Asset:
+    if asset.status not in MANUAL_STATUSES:
+        raise ValueError(
+            f"Invalid Status: '{asset.status}'. New assets must be one of "
+            f"{list(MANUAL_STATUSES)}; assign them to mark them ASSIGNED."
+        )
+    return asset
+
+
+def _check_positive(value: int, label: str) -> None:
+    # SQLite reads a negative LIMIT as "no limit", and a zero page would
+    # never advance the keyset cursor
+    if value < 1:
+        raise ValueError(f"{label} must be at least 1.")
+
+
+def _chunks(records: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 class Database_manager:
-    def __init__(self, db_name: str) -> None:
+    def __init__(
+        self,
+        db_name: str,
+        pooled: bool = False,
+        journal_mode: str | None = None,
+        synchronous: str | None = None,
+        cache_size: int | None = None,
+        mmap_size: int | None = None,
+        busy_timeout: float = 5.0,
+        row_type: str = "tuple",
+        lookup_cache: int = 0,
+        instrumentation: "Instrumentation | None" = None,
+    ) -> None:
+        if row_type not in ROW_TYPES:
+            raise ValueError(f"Invalid row type: '{row_type}'. Must be one of {ROW_TYPES}")
+
+        if lookup_cache and not pooled:
+            raise ValueError("lookup_cache requires pooled=True")
+
         self.db_name = db_name
+        self.pooled = pooled
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size = cache_size
+        self.mmap_size = mmap_size
+        self.busy_timeout = busy_timeout
+        self.row_type = row_type
+        self._mappers = ROW_MAPPERS[row_type]
+        self._cache = LRUCache(lookup_cache) if lookup_cache else None
+        # the change log seq the cache is known to be current with, and the
+        # (start, end] seq ranges this manager's own commits produced
+        self._cache_seq: int | None = None
+        self._own_changes: dict[int, int] = {}
+        self._seq_lock = threading.Lock()
 
-    def add_assets(self, asset: Asset) -> None:
-        with sql.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        self._local = threading.local()
+        self._pool: list[sql.Connection] = []
+        self._pool_lock = threading.Lock()
+
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            self._instrument_methods()
+
+    def __enter__(self) -> "Database_manager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _instrument_methods(self) -> None:
+        # wrap the public API on this instance only; uninstrumented managers
+        # keep calling the plain methods with no overhead
+        for name in dir(type(self)):
+            if name.startswith("_") or name in UNINSTRUMENTED_METHODS:
+                continue
+            setattr(self, name, self._timed(name, getattr(self, name)))
+
+    def _timed(self, name: str, method):
+        instrumentation = self.instrumentation
+
+        def timed_generator(rows: Iterator, start: float) -> Iterator:
+            count = 0
+            try:
+                for row in rows:
+                    count += 1
+                    yield row
+            finally:
+                instrumentation.record_method(name, time.perf_counter() - start, count)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                instrumentation.record_method(name, time.perf_counter() - start)
+                raise
+
+            if isinstance(result, Iterator):
+                return timed_generator(result, start)
+
+            if isinstance(result, list):
+                rows = len(result)
+            else:
+                rows = int(name.startswith("get_") and result is not None)
+            instrumentation.record_method(name, time.perf_counter() - start, rows)
+            return result
+
+        return wrapper
+
+    def _open_connection(self) -> sql.Connection:
+        start = time.perf_counter()
+        factory = sql.Connection
+
+        if self.instrumentation is not None:
+            from src.instrumentation import InstrumentedConnection
+
+            factory = InstrumentedConnection
+
+        # pooled connections may be closed by close() from any thread
+        conn = sql.connect(
+            self.db_name,
+            timeout=self.busy_timeout,
+            check_same_thread=not self.pooled,
+            factory=factory,
+        )
+
+        if self.instrumentation is not None:
+            conn.instrumentation = self.instrumentation
+
+        if self.journal_mode is not None:
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        if self.synchronous is not None:
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        if self.cache_size is not None:
+            conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        if self.mmap_size is not None:
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+
+        if self.instrumentation is not None:
+            self.instrumentation.record_method("connect", time.perf_counter() - start)
+
+        return conn
+
+    def _pooled_connection(self) -> sql.Connection:
+        conn = getattr(self._local, "conn", None)
+
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+            with self._pool_lock:
+                self._pool.append(conn)
 
+        return conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[sql.Connection]:
+        if self.pooled:
+            conn = self._pooled_connection()
+            with conn:
+                yield conn
+            return
+
+        conn = self._open_connection()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _row(self, kind: str, row: tuple | None) -> Any:
+        mapper = self._mappers.get(kind)
+        return row if mapper is None or row is None else mapper(row)
+
+    def _row_id(self, row: Any) -> int:
+        return row.id if self._mappers else row[0]
+
+    def _rows(self, kind: str, rows: list) -> list:
+        mapper = self._mappers.get(kind)
+        return rows if mapper is None else list(map(mapper, rows))
+
+    def _cached(self, key: tuple, load) -> Any:
+        if self._cache is None:
+            return load()
+
+        self._check_data_version()
+        found, value = self._cache.get(key)
+        if found:
+            return value
+
+        generation = self._cache.generation
+        value = load()
+        if value is not None:
+            self._cache.put(key, value, generation)
+        return value
+
+    def _check_data_version(self) -> None:
+        # data_version moves when another connection commits, including this
+        # manager's connections in other threads. Those writes already went
+        # through _invalidate, so the cache is only cleared when the change
+        # log holds entries none of them wrote
+        conn = self._pooled_connection()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if getattr(self._local, "data_version", None) == version:
+            return
+        self._local.data_version = version
+
+        seq = self._change_seq(conn)
+        with self._seq_lock:
+            if self._cache_seq is None:
+                self._cache_seq = seq
+            elif seq != self._cache_seq:
+                self._cache.clear()
+                self._cache_seq = seq
+                self._own_changes.clear()
+
+    def _change_seq(self, conn: sql.Connection) -> int | None:
+        if self._cache is None:
+            return None
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'changes'").fetchone()
+        return row[0] if row else 0
+
+    def _record_own_changes(self, start: int | None, end: int | None) -> None:
+        # called with the write lock still held, so (start, end] is ours
+        if start is None or start == end:
+            return
+
+        with self._seq_lock:
+            self._own_changes[start] = end
+            while self._cache_seq in self._own_changes:
+                self._cache_seq = self._own_changes.pop(self._cache_seq)
+
+    def _invalidate(self, *keys: tuple) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(*keys)
+
+    def cache_stats(self) -> dict | None:
+        return None if self._cache is None else self._cache.stats()
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+
+        for conn in pool:
+            conn.close()
+
+        # connections owned by other threads are closed above; a fresh
+        # thread-local namespace makes every thread reconnect lazily
+        self._local = threading.local()
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sql.Cursor]:
+        with self._connect() as conn:
+            self._begin_immediate(conn)
+            start = self._change_seq(conn)
+            yield conn.cursor()
+            self._record_own_changes(start, self._change_seq(conn))
+
+    def _begin_immediate(self, conn: sql.Connection) -> None:
+        # take the write lock up front so concurrent writers queue here
+        # instead of failing mid-transaction when upgrading a read lock
+        delay = BUSY_RETRY_DELAY
+
+        for attempt in range(BUSY_RETRIES + 1):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sql.OperationalError as e:
+                if "locked" not in str(e) or attempt == BUSY_RETRIES:
+                    raise
+                import random
+
+                time.sleep(delay * (1 + random.random()))
+                delay *= 2
+
+    def add_assets(self, asset: Asset) -> int:
+        _new_asset(asset)
+
+        with self._write_transaction() as cursor:
             cursor.execute(
                 "INSERT INTO assets(name,category,status) VALUES(:name,:cat,:status)",
                 {"name": asset.name, "cat": asset.category, "status": asset.status},
             )
+            return cursor.lastrowid
 
-    def add_employees(self, emp: Employee) -> None:
-        with sql.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-
+    def add_employees(self, emp: Employee) -> int:
+        with self._write_transaction() as cursor:
             cursor.execute(
                 "INSERT INTO employees(name,department) VALUES(:name,:dept)",
                 {"name": emp.name, "dept": emp.department},
             )
+            return cursor.lastrowid
 
     def assign_asset(self, assign: Assignment) -> None:
-        with sql.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        self._precheck_assign(assign)
 
-            cursor.execute(
-                "SELECT is_active FROM employees WHERE id=:emp_id",
-                {"emp_id": assign.employee_id},
-            )
-            result = cursor.fetchone()
+        with self._write_transaction() as cursor:
+            self._assign(cursor, assign)
 
-            if result is None:
-                raise ValueError(f"Employee ID {assign.employee_id} does not exist.")
+        self._invalidate(("asset", assign.asset_id), ("active",))
 
-            if result[0] == 0:
-                raise ValueError(
-                    f"Cannot assign asset to Employee {assign.employee_id} because they are offboarded/inactive."
-                )
+    def _precheck_assign(self, assign: Assignment) -> None:
+        # reject from coherent cache entries without taking the write lock;
+        # the conditional UPDATE in _assign stays the source of truth
+        if self._cache is None:
+            return
 
-            cursor.execute(
-                "SELECT status FROM assets WHERE id=:asset_id",
-                {"asset_id": assign.asset_id},
+        self._check_data_version()
+        found, emp = self._cache.peek(("employee", assign.employee_id))
+        if found and emp[3] == 0:
+            raise ValueError(
+                f"Cannot assign asset to Employee {assign.employee_id} because they are offboarded/inactive."
             )
-            asset_result = cursor.fetchone()
 
-            if asset_result is None:
-                raise ValueError(f"Asset ID {assign.asset_id} does not exist.")
+        found, asset = self._cache.peek(("asset", assign.asset_id))
+        if found and asset[3] != "AVAILABLE":
+            raise ValueError(
+                f"Asset {assign.asset_id} is currently '{asset[3]}'. Only AVAILABLE assets can be assigned"
+            )
 
-            current_status = asset_result[0]
+    def _assign(self, cursor: sql.Cursor, assign: Assignment) -> None:
+        cursor.execute(
+            """UPDATE assets SET status='ASSIGNED'
+            WHERE id=:asset_id AND status='AVAILABLE'
+            AND EXISTS(SELECT 1 FROM employees WHERE id=:emp_id AND is_active=1)""",
+            {"asset_id": assign.asset_id, "emp_id": assign.employee_id},
+        )
 
-            if current_status != "AVAILABLE":
-                raise ValueError(
-                    f"Asset {assign.asset_id} is currently '{current_status}'. Only AVAILABLE assets can be assigned"
-                )
+        if cursor.rowcount == 0:
+            self._raise_assign_error(cursor, assign)
 
-            cursor.execute(
-                "INSERT INTO assignments(asset_id,employee_id,assigned_date) VALUES(:asset,:emp,:assig)",
-                {
-                    "asset": assign.asset_id,
-                    "emp": assign.employee_id,
-                    "assig": assign.assigned_date,
-                },
-            )
+        cursor.execute(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date) VALUES(:asset,:emp,:assig)",
+            {
+                "asset": assign.asset_id,
+                "emp": assign.employee_id,
+                "assig": assign.assigned_date,
+            },
+        )
 
-            cursor.execute(
-                "UPDATE assets SET status='ASSIGNED' WHERE id=:asset_id",
-                {"asset_id": assign.asset_id},
+    def _raise_assign_error(self, cursor: sql.Cursor, assign: Assignment) -> None:
+        cursor.execute(
+            "SELECT is_active FROM employees WHERE id=:emp_id",
+            {"emp_id": assign.employee_id},
+        )
+        result = cursor.fetchone()
+
+        if result is None:
+            raise ValueError(f"Employee ID {assign.employee_id} does not exist.")
+
+        if result[0] == 0:
+            raise ValueError(
+                f"Cannot assign asset to Employee {assign.employee_id} because they are offboarded/inactive."
             )
 
+        cursor.execute(
+            "SELECT status FROM assets WHERE id=:asset_id",
+            {"asset_id": assign.asset_id},
+        )
+        asset_result = cursor.fetchone()
+
+        if asset_result is None:
+            raise ValueError(f"Asset ID {assign.asset_id} does not exist.")
+
+        raise ValueError(
+            f"Asset {assign.asset_id} is currently '{asset_result[0]}'. Only AVAILABLE assets can be assigned"
+        )
+
     def return_asset(self, asset_id: int, return_date: str) -> None:
-        with sql.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        with self._write_transaction() as cursor:
+            self._return(cursor, asset_id, return_date)
 
-            cursor.execute(
-                """UPDATE assignments
-                SET return_date=:re_dt 
-                WHERE asset_id=:asset AND return_date IS NULL""",
-                {"re_dt": return_date, "asset": asset_id},
-            )
+        self._invalidate(("asset", asset_id), ("active",))
+
+    def _return(self, cursor: sql.Cursor, asset_id: int, return_date: str) -> None:
+        return_date = _checked_date(return_date)
+
+        cursor.execute(
+            """UPDATE assignments
+            SET return_date=:re_dt
+            WHERE asset_id=:asset AND return_date IS NULL""",
+            {"re_dt": return_date, "asset": asset_id},
+        )
 
+        if cursor.rowcount == 0:
             cursor.execute(
-                "UPDATE assets SET status='AVAILABLE' WHERE id=:asset_id ",
-                {"asset_id": asset_id},
+                "SELECT 1 FROM assets WHERE id=:asset_id", {"asset_id": asset_id}
             )
-
-            if cursor.rowcount == 0:
+            if cursor.fetchone() is None:
                 raise ValueError(f"Asset {asset_id} does not exist.")
 
-    def update_asset_status(self, asset_id: int, new_status: str) -> None:
-        valid_statuses = ["AVAILABLE", "ASSIGNED", "MAINTENANCE", "RETIRED"]
+            raise ValueError(f"Asset {asset_id} is not currently assigned.")
+
+        cursor.execute(
+            "UPDATE assets SET status='AVAILABLE' WHERE id=:asset_id",
+            {"asset_id": asset_id},
+        )
 
+    def group_commit(
+        self, max_ops: int = 100, max_delay_ms: float = 5.0
+    ) -> "GroupCommitter":
+        from src.group_commit import GroupCommitter
+
+        return GroupCommitter(self, max_ops=max_ops, max_delay_ms=max_delay_ms)
+
+    def update_asset_status(self, asset_id: int, new_status: str) -> None:
         if new_status == "ASSIGNED":
             raise ValueError(
                 "   Cannot manually set status to ASSIGNED.\n"
@@ -131,14 +600,21 @@ class Database_manager:
                 "   so it can be properly linked to an employee.\n"
             )
 
-        if new_status not in valid_statuses:
+        if new_status not in ASSET_STATUSES:
             raise ValueError(
-                f"Invalid Status: '{new_status}'. Must be one of {valid_statuses}"
+                f"Invalid Status: '{new_status}'. Must be one of {list(ASSET_STATUSES)}"
             )
 
-        with sql.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        if self._cache is not None:
+            self._check_data_version()
+            found, asset = self._cache.peek(("asset", asset_id))
+            if found and asset[3] == "ASSIGNED":
+                raise ValueError(
+                    f"Cannot change status to {new_status}. Asset {asset_id} is currently ASSIGNED. "
+                    "Please return the asset from the employee first."
+                )
 
+        with self._write_transaction() as cursor:
             cursor.execute(
                 "SELECT status FROM assets WHERE id=:asset_id", {"asset_id": asset_id}
             )
@@ -160,30 +636,301 @@ class Database_manager:
                 {"stat": new_status, "asset_id": asset_id},
             )
 
-    def offboard_employee(self, employee_id: int) -> None:
-        with sql.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        self._invalidate(("asset", asset_id))
 
-            cursor.execute(
-                "UPDATE employees SET is_active=0 WHERE id=:id", {"id": employee_id}
+    def offboard_employee(
+        self,
+        employee_id: int,
+        reclaim: bool = False,
+        return_date: str | None = None,
+        reclaim_status: str = "AVAILABLE",
+    ) -> OffboardResult:
+        with self._write_transaction() as cursor:
+            result = self._offboard(
+                cursor, [employee_id], reclaim, return_date, reclaim_status
             )
-            if cursor.rowcount == 0:
+            if result.missing:
                 raise ValueError(f"Employee ID {employee_id} not found.")
 
+        self._invalidate_offboarded(result)
+        return result
+
+    def bulk_offboard(
+        self,
+        employee_ids: Iterable[int],
+        reclaim: bool = True,
+        return_date: str | None = None,
+        reclaim_status: str = "AVAILABLE",
+    ) -> OffboardResult:
+        with self._write_transaction() as cursor:
+            result = self._offboard(
+                cursor, employee_ids, reclaim, return_date, reclaim_status
+            )
+
+        self._invalidate_offboarded(result)
+        return result
+
+    def _offboard(
+        self,
+        cursor: sql.Cursor,
+        employee_ids: Iterable[int],
+        reclaim: bool,
+        return_date: str | None,
+        reclaim_status: str,
+    ) -> OffboardResult:
+        if reclaim_status not in RECLAIM_STATUSES:
+            raise ValueError(
+                f"Invalid Status: '{reclaim_status}'. Must be one of {list(RECLAIM_STATUSES)}"
+            )
+
+        import json
+
+        return_date = get_today() if return_date is None else _checked_date(return_date)
+        # the id list goes in as one JSON parameter, so each step below is a
+        # single set-based statement however many people are offboarded
+        ids = json.dumps(list(dict.fromkeys(int(i) for i in employee_ids)))
+        result = OffboardResult()
+
+        cursor.execute(
+            """UPDATE employees SET is_active=0
+            WHERE id IN (SELECT value FROM json_each(:ids))
+            RETURNING id""",
+            {"ids": ids},
+        )
+        result.offboarded = sorted(row[0] for row in cursor.fetchall())
+
+        found = set(result.offboarded)
+        result.missing = [i for i in json.loads(ids) if i not in found]
+
+        if not reclaim or not found:
+            return result
+
+        cursor.execute(
+            """UPDATE assignments SET return_date=:re_dt
+            WHERE return_date IS NULL
+            AND employee_id IN (SELECT value FROM json_each(:ids))
+            RETURNING employee_id, asset_id""",
+            {"re_dt": return_date, "ids": ids},
+        )
+        result.reclaimed = sorted(cursor.fetchall())
+
+        cursor.execute(
+            """UPDATE assets SET status=:stat
+            WHERE id IN (SELECT value FROM json_each(:assets))
+            AND status='ASSIGNED'""",
+            {
+                "stat": reclaim_status,
+                "assets": json.dumps([asset for _, asset in result.reclaimed]),
+            },
+        )
+
+        return result
+
+    def _invalidate_offboarded(self, result: OffboardResult) -> None:
+        keys = [("employee", employee_id) for employee_id in result.offboarded]
+        keys += [("asset", asset_id) for _, asset_id in result.reclaimed]
+
+        if result.reclaimed:
+            keys.append(("active",))
+
+        self._invalidate(*keys)
+
+    def bulk_add_assets(
+        self, records: Iterable, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return self._bulk_insert(
+            records,
+            chunk_size,
+            lambda r: _new_asset(
+                model_from_record(Asset, r, ("name", "category"), ("status",))
+            ),
+            "assets",
+            ("name", "category", "status"),
+            lambda a: (a.name, a.category, a.status),
+        )
+
+    def bulk_add_employees(
+        self, records: Iterable, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return self._bulk_insert(
+            records,
+            chunk_size,
+            lambda r: model_from_record(
+                Employee, r, ("name", "department"), ("is_active",), ("is_active",)
+            ),
+            "employees",
+            ("name", "department", "is_active"),
+            lambda e: (e.name, e.department, e.is_active),
+        )
+
+    def _bulk_insert(
+        self, records, chunk_size, build, table, columns, to_params
+    ) -> BulkResult:
+        _check_positive(chunk_size, "Chunk size")
+        result = BulkResult()
+        row_num = 0
+        catch_up = bulk_insert_sql(table)
+        # rows go to a trigger-free temp table first and then into the real
+        # one with a single INSERT ... SELECT, which evaluates the insert
+        # trigger's pause check far more cheaply than one statement per row
+        names = ", ".join(columns)
+        stage = f"temp.bulk_{table}"
+
+        with self._connect() as conn:
+            conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS bulk_{table}({names})")
+
+            for chunk in _chunks(records, chunk_size):
+                self._begin_immediate(conn)
+                start = self._change_seq(conn)
+                last_id = conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0]
+                # the pause row never outlives this transaction, so other
+                # writers always see the insert triggers active
+                conn.execute("INSERT INTO search_index_paused VALUES (?)", (table,))
+                params = []
+
+                for record in chunk:
+                    row_num += 1
+                    try:
+                        params.append(to_params(build(record)))
+                    except (ValueError, TypeError) as e:
+                        result.errors.append((row_num, str(e)))
+
+                conn.executemany(
+                    f"INSERT INTO {stage} VALUES ({', '.join('?' * len(columns))})", params
+                )
+                conn.execute(f"INSERT INTO {table}({names}) SELECT {names} FROM {stage} ORDER BY rowid")
+                conn.execute(f"DELETE FROM {stage}")
+                for statement in catch_up:
+                    conn.execute(statement, (last_id or 0,))
+                conn.execute("DELETE FROM search_index_paused WHERE name=?", (table,))
+                self._record_own_changes(start, self._change_seq(conn))
+                conn.commit()
+                result.inserted += len(params)
+
+        return result
+
+    def bulk_assign(
+        self, records: Iterable, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        _check_positive(chunk_size, "Chunk size")
+        result = BulkResult()
+        row_num = 0
+        assigned: list[tuple] = []
+
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            for chunk in _chunks(records, chunk_size):
+                self._begin_immediate(conn)
+                start = self._change_seq(conn)
+
+                for record in chunk:
+                    row_num += 1
+                    try:
+                        assign = model_from_record(
+                            Assignment,
+                            record,
+                            ("asset_id", "employee_id"),
+                            ("assigned_date",),
+                            ("asset_id", "employee_id"),
+                        )
+                        # checks run before any write, so a rejected row
+                        # leaves nothing behind in the open transaction
+                        self._assign(cursor, assign)
+                        result.inserted += 1
+                        assigned.append(("asset", assign.asset_id))
+                    except (ValueError, TypeError) as e:
+                        result.errors.append((row_num, str(e)))
+
+                self._record_own_changes(start, self._change_seq(conn))
+                conn.commit()
+                self._invalidate(("active",), *assigned)
+                assigned.clear()
+
+        return result
+
     def get_all_assets(self) -> list:
-        with sql.connect(self.db_name) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM assets")
-            return cursor.fetchall()
+            return self._rows("asset", cursor.fetchall())
 
     def get_all_employees(self) -> list:
-        with sql.connect(self.db_name) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM employees")
-            return cursor.fetchall()
+            return self._rows("employee", cursor.fetchall())
+
+    def get_asset(self, asset_id: int) -> Any:
+        row = self._cached(
+            ("asset", asset_id),
+            lambda: self._fetch_one("SELECT * FROM assets WHERE id=?", asset_id),
+        )
+        return self._row("asset", row)
+
+    def get_employee(self, employee_id: int) -> Any:
+        row = self._cached(
+            ("employee", employee_id),
+            lambda: self._fetch_one("SELECT * FROM employees WHERE id=?", employee_id),
+        )
+        return self._row("employee", row)
+
+    def _fetch_one(self, query: str, row_id: int) -> tuple | None:
+        with self._connect() as conn:
+            return conn.execute(query, (row_id,)).fetchone()
+
+    def load_snapshot(self) -> "Snapshot":
+        from src.snapshot import load_snapshot
+
+        with self._connect() as conn:
+            # one read transaction, so all three tables come from the same
+            # committed state even while writers keep going
+            conn.execute("BEGIN")
+            return load_snapshot(conn, get_today())
+
+    def search_assets(
+        self, query: str, limit: int = 20, status: str | None = None
+    ) -> list:
+        where, params = "", {}
+        if status is not None:
+            where, params = "AND a.status = :status", {"status": status.strip().upper()}
+
+        return self._search("asset", "assets", query, limit, where, params)
+
+    def search_employees(
+        self, query: str, limit: int = 20, active: bool | None = None
+    ) -> list:
+        where, params = "", {}
+        if active is not None:
+            where, params = "AND a.is_active = :active", {"active": int(active)}
+
+        return self._search("employee", "employees", query, limit, where, params)
+
+    def _search(
+        self, kind: str, table: str, query: str, limit: int, where: str, params: dict
+    ) -> list:
+        # every match is ranked, so the cost grows with how many rows a term
+        # matches; the sorter only keeps the best :limit. CROSS JOIN keeps
+        # the index as the outer loop; names weigh ten times the
+        # category/department column
+        _check_positive(limit, "Limit")
+        sql_query = f"""SELECT a.*
+            FROM {table}_fts CROSS JOIN {table} AS a ON a.id = {table}_fts.rowid
+            WHERE {table}_fts MATCH :match AND rank MATCH 'bm25(10.0, 1.0)' {where}
+            ORDER BY rank, a.id
+            LIMIT :limit"""
+        params = {**params, "match": _fts_query(query), "limit": limit}
+
+        with self._connect() as conn:
+            return self._rows(kind, conn.execute(sql_query, params).fetchall())
 
     def get_active_assignments(self) -> list[tuple[str, str, str]]:
-        with sql.connect(self.db_name) as conn:
+        # the cache holds raw tuples; callers always get their own list
+        rows = self._cached(("active",), self._load_active_assignments)
+        return list(self._rows("active", rows))
+
+    def _load_active_assignments(self) -> list[tuple[str, str, str]]:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -195,3 +942,379 @@ class Database_manager:
                            """)
 
             return cursor.fetchall()
+
+    def get_inventory_summary(self) -> dict:
+        with self._connect() as conn:
+            assets = conn.execute(
+                "SELECT category, status, count FROM inventory_summary WHERE count > 0"
+            ).fetchall()
+            departments = conn.execute(
+                "SELECT department, category, assigned FROM department_summary WHERE assigned > 0"
+            ).fetchall()
+
+        summary: dict = {"assets": {}, "assigned_by_department": {}}
+
+        for category, status, count in assets:
+            summary["assets"].setdefault(category, {})[status] = count
+
+        for department, category, assigned in departments:
+            summary["assigned_by_department"].setdefault(department, {})[category] = assigned
+
+        return summary
+
+    def check_inventory_summary(self, rebuild: bool = False) -> list[tuple]:
+        # compares the trigger-maintained counters with a full recount;
+        # rebuild=True rewrites them from the recount in the same transaction
+        # each mismatch is (table, *key, stored, actual); tables with several
+        # value columns compare them as one tuple, and a missing row as None
+        checks = (
+            ("inventory_summary", "category, status, count", INVENTORY_SUMMARY_QUERY, 2),
+            ("department_summary", "department, category, assigned", DEPARTMENT_SUMMARY_QUERY, 2),
+            (
+                "asset_stats",
+                "asset_id, assignments, assigned_days, open_since, last_returned",
+                ASSET_STATS_QUERY,
+                1,
+            ),
+        )
+        mismatches = []
+
+        with self._write_transaction() as cursor:
+            for table, columns, recount, width in checks:
+                single = columns.count(",") == width
+
+                def by_key(rows: list) -> dict:
+                    return {row[:width]: row[width] if single else row[width:] for row in rows}
+
+                stored = by_key(cursor.execute(f"SELECT {columns} FROM {table}").fetchall())
+                actual = by_key(cursor.execute(recount).fetchall())
+                missing = 0 if single else None
+
+                for key in sorted(stored.keys() | actual.keys()):
+                    if stored.get(key, missing) != actual.get(key, missing):
+                        mismatches.append(
+                            (table, *key, stored.get(key, missing), actual.get(key, missing))
+                        )
+
+                if rebuild:
+                    cursor.execute(f"DELETE FROM {table}")
+                    cursor.execute(f"INSERT INTO {table}({columns}) {recount}")
+
+        return mismatches
+
+    def page_assets(
+        self,
+        after_id: int = 0,
+        limit: int = PAGE_SIZE,
+        status: str | None = None,
+        category: str | None = None,
+    ) -> list:
+        filters = {
+            "status": status.strip().upper() if status else None,
+            "category": category.strip().title() if category else None,
+        }
+        return self._page(
+            "asset", "SELECT * FROM assets", "id", filters, after_id, limit
+        )
+
+    def iter_assets(
+        self,
+        batch_size: int = PAGE_SIZE,
+        status: str | None = None,
+        category: str | None = None,
+    ) -> Iterator[tuple]:
+        return self._iter_pages(
+            self.page_assets, batch_size, status=status, category=category
+        )
+
+    def page_employees(
+        self,
+        after_id: int = 0,
+        limit: int = PAGE_SIZE,
+        department: str | None = None,
+        active: bool | None = None,
+    ) -> list:
+        filters = {
+            "department": department.strip().upper() if department else None,
+            "is_active": None if active is None else int(bool(active)),
+        }
+        return self._page(
+            "employee", "SELECT * FROM employees", "id", filters, after_id, limit
+        )
+
+    def iter_employees(
+        self,
+        batch_size: int = PAGE_SIZE,
+        department: str | None = None,
+        active: bool | None = None,
+    ) -> Iterator[tuple]:
+        return self._iter_pages(
+            self.page_employees, batch_size, department=department, active=active
+        )
+
+    def page_active_assignments(
+        self,
+        after_id: int = 0,
+        limit: int = PAGE_SIZE,
+        department: str | None = None,
+        category: str | None = None,
+    ) -> list[tuple[int, str, str, str]]:
+        filters = {
+            "e.department": department.strip().upper() if department else None,
+            "ase.category": category.strip().title() if category else None,
+        }
+        return self._page(
+            "open",
+            """SELECT assign.id,e.name,ase.name,assign.assigned_date
+            FROM assignments AS assign
+            JOIN assets AS ase ON ase.id=assign.asset_id
+            JOIN employees AS e ON e.id=assign.employee_id""",
+            "assign.id",
+            filters,
+            after_id,
+            limit,
+            where=["assign.return_date IS NULL"],
+        )
+
+    def iter_active_assignments(
+        self,
+        batch_size: int = PAGE_SIZE,
+        department: str | None = None,
+        category: str | None = None,
+    ) -> Iterator[tuple[int, str, str, str]]:
+        return self._iter_pages(
+            self.page_active_assignments,
+            batch_size,
+            department=department,
+            category=category,
+        )
+
+    def asset_history(
+        self, asset_id: int, start: str | None = None, end: str | None = None
+    ) -> list:
+        return self._history("asset_id", asset_id, start, end)
+
+    def employee_history(
+        self, employee_id: int, start: str | None = None, end: str | None = None
+    ) -> list:
+        return self._history("employee_id", employee_id, start, end)
+
+    def _history(
+        self, column: str, row_id: int, start: str | None, end: str | None
+    ) -> list:
+        clauses, params = _overlap_clauses("", start, end)
+        clauses.insert(0, f"{column}=:row_id")
+        params["row_id"] = row_id
+
+        query = f"""SELECT * FROM assignments WHERE {' AND '.join(clauses)}
+            ORDER BY assigned_date, id"""
+
+        with self._connect() as conn:
+            return self._rows("assignment", conn.execute(query, params).fetchall())
+
+    def page_history(
+        self,
+        after_id: int = 0,
+        limit: int = PAGE_SIZE,
+        start: str | None = None,
+        end: str | None = None,
+        asset_id: int | None = None,
+        employee_id: int | None = None,
+    ) -> list:
+        where, params = _overlap_clauses("assign.", start, end)
+        filters = {"assign.asset_id": asset_id, "assign.employee_id": employee_id}
+
+        return self._page(
+            "history",
+            """SELECT assign.id,assign.asset_id,ase.name,ase.category,
+            assign.employee_id,e.name,e.department,assign.assigned_date,assign.return_date
+            FROM assignments AS assign
+            JOIN assets AS ase ON ase.id=assign.asset_id
+            JOIN employees AS e ON e.id=assign.employee_id""",
+            "assign.id",
+            filters,
+            after_id,
+            limit,
+            where=where,
+            where_params=params,
+        )
+
+    def iter_history(
+        self,
+        batch_size: int = PAGE_SIZE,
+        start: str | None = None,
+        end: str | None = None,
+        asset_id: int | None = None,
+        employee_id: int | None = None,
+    ) -> Iterator[tuple]:
+        return self._iter_pages(
+            self.page_history,
+            batch_size,
+            start=start,
+            end=end,
+            asset_id=asset_id,
+            employee_id=employee_id,
+        )
+
+    def utilization(self, start: str, end: str, category: str | None = None) -> list:
+        clauses, params = _overlap_clauses("assign.", start, end)
+        params["today"] = get_today()
+
+        window = (date.fromisoformat(params["end"]) - date.fromisoformat(params["start"])).days
+        if window <= 0:
+            raise ValueError("End date must be after start date.")
+
+        if category:
+            clauses.append("ase.category=:category")
+            params["category"] = category.strip().title()
+
+        # open assignments count up to today, and everything is clipped to
+        # the [start, end) window before summing days
+        query = f"""SELECT ase.id, ase.name, ase.category, COUNT(*),
+            SUM(
+                julianday(MIN(COALESCE(assign.return_date, :today), :end))
+                - julianday(MAX(assign.assigned_date, :start))
+            ) AS days
+            FROM assignments AS assign
+            JOIN assets AS ase ON ase.id=assign.asset_id
+            WHERE {' AND '.join(clauses)}
+            GROUP BY ase.id
+            ORDER BY ase.id"""
+
+        with self._connect() as conn:
+            rows = [
+                (*row[:4], max(0, int(row[4])), round(max(0, row[4]) / window, 4))
+                for row in conn.execute(query, params).fetchall()
+            ]
+
+        return self._rows("utilization", rows)
+
+    def idle_assets(
+        self, days: int, status: str | None = None, limit: int | None = None
+    ) -> list:
+        # assets not out on assignment whose last return is at least `days`
+        # old, longest idle first; never-assigned assets come first of all
+        if days < 0:
+            raise ValueError("Days must be zero or more.")
+
+        today = date.fromisoformat(get_today()).toordinal()
+        params = {"cutoff": today - days, "limit": -1 if limit is None else limit}
+        status_clause = ""
+        if status:
+            status_clause = "AND ase.status=:status"
+            params["status"] = status.strip().upper()
+
+        query = f"""SELECT ase.id, ase.name, ase.category, ase.status, stats.last_returned
+            FROM asset_stats AS stats
+            JOIN assets AS ase ON ase.id=stats.asset_id
+            WHERE stats.open_since IS NULL AND COALESCE(stats.last_returned, 0) <= :cutoff
+            {status_clause}
+            ORDER BY COALESCE(stats.last_returned, 0), stats.asset_id
+            LIMIT :limit"""
+
+        with self._connect() as conn:
+            rows = [
+                (
+                    *row[:4],
+                    None if row[4] is None else date.fromordinal(row[4]).isoformat(),
+                    None if row[4] is None else today - row[4],
+                )
+                for row in conn.execute(query, params).fetchall()
+            ]
+
+        return self._rows("idle", rows)
+
+    def top_utilized(self, n: int = 10) -> list:
+        # closed history and the running open assignment are ranked by two
+        # partial indexes; the top n of each is all the final merge needs
+        if n < 1:
+            raise ValueError("N must be at least 1.")
+
+        params = {"n": n, "today": date.fromisoformat(get_today()).toordinal()}
+        query = """SELECT ase.id, ase.name, ase.category, stats.assignments, top.days
+            FROM (
+                SELECT * FROM (
+                    SELECT asset_id, assigned_days AS days FROM asset_stats
+                    WHERE open_since IS NULL
+                    ORDER BY assigned_days DESC LIMIT :n
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT asset_id, assigned_days - open_since + :today FROM asset_stats
+                    WHERE open_since IS NOT NULL
+                    ORDER BY assigned_days - open_since DESC LIMIT :n
+                )
+            ) AS top
+            JOIN asset_stats AS stats ON stats.asset_id=top.asset_id
+            JOIN assets AS ase ON ase.id=top.asset_id
+            ORDER BY top.days DESC, ase.id
+            LIMIT :n"""
+
+        with self._connect() as conn:
+            return self._rows("utilized", conn.execute(query, params).fetchall())
+
+    def changes_since(
+        self, seq: int = 0, limit: int = PAGE_SIZE, table: str | None = None
+    ) -> list:
+        if table is not None and table not in CHANGE_COLUMNS:
+            raise ValueError(f"Unknown table: '{table}'. Must be one of {list(CHANGE_COLUMNS)}")
+
+        return self._page(
+            "change",
+            "SELECT seq, table_name, row_id, op, data, changed_at FROM changes",
+            "seq",
+            {"table_name": table},
+            seq,
+            limit,
+        )
+
+    def last_change_seq(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+
+    def _page(
+        self,
+        kind: str,
+        select: str,
+        id_column: str,
+        filters: dict,
+        after_id: int,
+        limit: int,
+        where: list[str] | None = None,
+        where_params: dict | None = None,
+    ) -> list:
+        _check_positive(limit, "Limit")
+        clauses = list(where or [])
+        clauses.append(f"{id_column} > :after_id")
+        params = {"after_id": after_id, "limit": limit, **(where_params or {})}
+
+        for column, value in filters.items():
+            if value is None:
+                continue
+            key = column.replace(".", "_")
+            clauses.append(f"{column}=:{key}")
+            params[key] = value
+
+        query = f"{select} WHERE {' AND '.join(clauses)} ORDER BY {id_column} LIMIT :limit"
+
+        with self._connect() as conn:
+            return self._rows(kind, conn.execute(query, params).fetchall())
+
+    def _iter_pages(self, page, batch_size: int, **filters) -> Iterator[tuple]:
+        # checked here rather than on the first next(), so a bad batch size
+        # fails where the iterator is created
+        _check_positive(batch_size, "Batch size")
+        return self._pages(page, batch_size, filters)
+
+    def _pages(self, page, batch_size: int, filters: dict) -> Iterator[tuple]:
+        # keyset pagination: each batch is a short, separate read, so no
+        # transaction is held open while the caller consumes rows
+        after_id = 0
+
+        while True:
+            rows = page(after_id=after_id, limit=batch_size, **filters)
+            yield from rows
+
+            if len(rows) < batch_size:
+                return
+            after_id = self._row_id(rows[-1])
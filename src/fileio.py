@@ -0,0 +1,74 @@
+import os
+from typing import Iterable, Iterator, Sequence, TextIO
+
+FORMATS = ("csv", "jsonl")
+WRITE_FORMATS = (*FORMATS, "json")
+
+
+def detect_format(path: str, fmt: str | None = None) -> str:
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip(".").lower()
+        if fmt in ("json", "ndjson"):
+            fmt = "jsonl"
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: '{fmt}'. Must be one of {FORMATS}")
+
+    return fmt
+
+
+def read_records(path: str, fmt: str | None = None) -> Iterator[dict]:
+    fmt = detect_format(path, fmt)
+
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            import csv
+
+            yield from csv.DictReader(f)
+            return
+
+        import json
+
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def write_records(
+    rows: Iterable, f: TextIO, fmt: str, fieldnames: Sequence[str]
+) -> int:
+    if fmt not in WRITE_FORMATS:
+        raise ValueError(
+            f"Unsupported format: '{fmt}'. Must be one of {WRITE_FORMATS}"
+        )
+
+    # csv and json load here rather than at import, which keeps them off
+    # the path of CLI commands that never read or write files
+    import csv
+    import json
+
+    count = 0
+
+    if fmt == "json":
+        # a JSON array written element by element, so nothing is buffered
+        f.write("[")
+        for row in rows:
+            f.write(",\n" if count else "\n")
+            f.write(json.dumps(dict(zip(fieldnames, row))))
+            count += 1
+        f.write("\n]\n" if count else "]\n")
+        return count
+
+    if fmt == "csv":
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    for row in rows:
+        f.write(json.dumps(dict(zip(fieldnames, row))) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,138 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from src.models import Assignment
+
+
+class GroupCommitter:
+    def __init__(self, db: Any, max_ops: int = 100, max_delay_ms: float = 5.0) -> None:
+        if max_ops <= 0:
+            raise ValueError(f"max_ops must be positive, got {max_ops}")
+
+        self.db = db
+        self.max_ops = max_ops
+        self.max_delay = max_delay_ms / 1000
+        self.batches = 0
+
+        # (kind, args, future, time queued)
+        self._queue: list[tuple[str, tuple, Future, float]] = []
+        self._closed = False
+        self._flush_requested = False
+        self._inflight = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="db-group-commit", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "GroupCommitter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def submit_assign(self, assign: Assignment) -> Future:
+        return self._submit("assign", (assign,))
+
+    def submit_return(self, asset_id: int, return_date: str) -> Future:
+        return self._submit("return", (asset_id, return_date))
+
+    def _submit(self, kind: str, args: tuple) -> Future:
+        future: Future = Future()
+
+        with self._cond:
+            if self._closed:
+                raise ValueError("Group committer is closed.")
+
+            self._queue.append((kind, args, future, time.monotonic()))
+
+            if len(self._queue) == 1 or len(self._queue) >= self.max_ops:
+                self._cond.notify_all()
+
+        return future
+
+    def flush(self) -> None:
+        with self._cond:
+            # only queued ops need hurrying; an empty queue would leave the
+            # flag set with no batch to clear it
+            if self._queue:
+                self._flush_requested = True
+                self._cond.notify_all()
+            while self._queue or self._inflight:
+                self._cond.wait()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+
+                if not self._queue:
+                    return
+
+                # wait for a full batch, the oldest op's deadline, or a flush
+                while (
+                    len(self._queue) < self.max_ops
+                    and not self._closed
+                    and not self._flush_requested
+                ):
+                    remaining = self._queue[0][3] + self.max_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._queue[: self.max_ops]
+                del self._queue[: self.max_ops]
+                # ops queued after this swap wait for their own deadline
+                if not self._queue:
+                    self._flush_requested = False
+                self._inflight = True
+
+            self._commit(batch)
+
+            with self._cond:
+                self._inflight = False
+                self._cond.notify_all()
+
+    def _commit(self, batch: list[tuple[str, tuple, Future, float]]) -> None:
+        outcomes: list[tuple[Future, Exception | None]] = []
+        touched: list[tuple] = [("active",)]
+
+        try:
+            with self.db._write_transaction() as cursor:
+                for kind, args, future, _ in batch:
+                    # each op sees the effects of the ones queued before it
+                    cursor.execute("SAVEPOINT op")
+                    try:
+                        if kind == "assign":
+                            self.db._assign(cursor, *args)
+                            touched.append(("asset", args[0].asset_id))
+                        else:
+                            self.db._return(cursor, *args)
+                            touched.append(("asset", args[0]))
+                        outcomes.append((future, None))
+                    except ValueError as e:
+                        cursor.execute("ROLLBACK TO op")
+                        outcomes.append((future, e))
+                    cursor.execute("RELEASE op")
+        except Exception as e:
+            for _, _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.db._invalidate(*touched)
+
+        for future, error in outcomes:
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
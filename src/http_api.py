@@ -0,0 +1,356 @@
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlsplit
+
+from src.database import PAGE_SIZE, Database_manager
+from src.models import Asset, Assignment, Employee, get_today
+
+MAX_BODY = 1 << 20
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        db_name: str,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        readers: int = 4,
+        **options: Any,
+    ) -> None:
+        options.setdefault("journal_mode", "WAL")
+        options.setdefault("synchronous", "NORMAL")
+        options.setdefault("row_type", "named")
+        self.db = Database_manager(db_name, pooled=True, **options)
+
+        # each HTTP request gets a fresh thread, but the database is only
+        # touched from these long-lived ones, so connections are reused: one
+        # writer serialises writes while WAL readers run beside it
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="api-writer")
+        self._readers = ThreadPoolExecutor(readers, thread_name_prefix="api-reader")
+
+        super().__init__((host, port), ApiHandler)
+
+    def read(self, fn: Callable, *args: Any, **kwargs: Any) -> tuple[Any, float, float]:
+        return self._run(self._readers, fn, args, kwargs)
+
+    def write(self, fn: Callable, *args: Any, **kwargs: Any) -> tuple[Any, float, float]:
+        return self._run(self._writer, fn, args, kwargs)
+
+    def _run(
+        self, pool: ThreadPoolExecutor, fn: Callable, args: tuple, kwargs: dict
+    ) -> tuple[Any, float, float]:
+        # returns (result, seconds queued, seconds in the database)
+        queued = time.perf_counter()
+
+        def call() -> tuple[Any, float, float]:
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            return result, start - queued, time.perf_counter() - start
+
+        return pool.submit(call).result()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        self.db.close()
+
+
+def _json_row(row: Any) -> Any:
+    return row._asdict() if hasattr(row, "_asdict") else row
+
+
+def _int(value: str | None, name: str, default: int | None = None) -> int | None:
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise HttpError(400, f"{name} must be an integer.") from None
+
+
+def _flag(value: str | None) -> bool | None:
+    if value is None:
+        return None
+    return value.lower() in ("1", "true", "yes")
+
+
+def _limit(query: dict, default: int = PAGE_SIZE) -> int:
+    # SQLite reads a negative LIMIT as "no limit", so it is refused here
+    # rather than trimmed by min() alone
+    limit = _int(query.get("limit"), "limit", default)
+    if limit < 1:
+        raise HttpError(400, "limit must be at least 1.")
+    return min(limit, PAGE_SIZE)
+
+
+def _page(query: dict) -> dict:
+    return {
+        "after_id": _int(query.get("after_id"), "after_id", 0),
+        "limit": _limit(query),
+    }
+
+
+def _found(row: Any, what: str, row_id: int) -> Any:
+    if row is None:
+        raise HttpError(404, f"{what} ID {row_id} not found.")
+    return row
+
+
+def _field(body: dict, name: str) -> Any:
+    if name not in body:
+        raise HttpError(400, f"Missing field: '{name}'.")
+    return body[name]
+
+
+def _bool_field(body: dict, name: str, default: bool) -> bool:
+    # bool("false") is True, so only real JSON booleans are accepted
+    value = body.get(name, default)
+    if not isinstance(value, bool):
+        raise HttpError(400, f"{name} must be true or false.")
+    return value
+
+
+# (method, path pattern, handler); handlers take (server, match, query, body)
+# and return (status, payload, seconds queued, seconds in the database)
+ROUTES: list[tuple[str, re.Pattern, Callable]] = []
+
+
+def route(method: str, pattern: str) -> Callable:
+    def register(handler: Callable) -> Callable:
+        ROUTES.append((method, re.compile(f"^{pattern}$"), handler))
+        return handler
+
+    return register
+
+
+def _listing(rows: list) -> dict:
+    items = [_json_row(row) for row in rows]
+    return {"items": items, "next_after_id": rows[-1][0] if rows else None}
+
+
+@route("GET", "/assets")
+def list_assets(server: ApiServer, match, query: dict, body) -> tuple:
+    rows, wait, run = server.read(
+        server.db.page_assets,
+        status=query.get("status"),
+        category=query.get("category"),
+        **_page(query),
+    )
+    return 200, _listing(rows), wait, run
+
+
+@route("GET", r"/assets/(\d+)")
+def get_asset(server: ApiServer, match, query: dict, body) -> tuple:
+    asset_id = int(match[1])
+    row, wait, run = server.read(server.db.get_asset, asset_id)
+    return 200, _json_row(_found(row, "Asset", asset_id)), wait, run
+
+
+@route("POST", "/assets")
+def add_asset(server: ApiServer, match, query: dict, body: dict) -> tuple:
+    asset = Asset(name=_field(body, "name"), category=_field(body, "category"))
+    asset_id, wait, run = server.write(server.db.add_assets, asset)
+    return 201, {"id": asset_id}, wait, run
+
+
+@route("POST", r"/assets/(\d+)/status")
+def set_status(server: ApiServer, match, query: dict, body: dict) -> tuple:
+    status = str(_field(body, "status")).strip().upper()
+    _, wait, run = server.write(server.db.update_asset_status, int(match[1]), status)
+    return 200, {"id": int(match[1]), "status": status}, wait, run
+
+
+@route("POST", r"/assets/(\d+)/return")
+def return_asset(server: ApiServer, match, query: dict, body: dict) -> tuple:
+    return_date = body.get("return_date") or get_today()
+    _, wait, run = server.write(server.db.return_asset, int(match[1]), return_date)
+    return 200, {"id": int(match[1]), "return_date": return_date}, wait, run
+
+
+@route("GET", "/employees")
+def list_employees(server: ApiServer, match, query: dict, body) -> tuple:
+    rows, wait, run = server.read(
+        server.db.page_employees,
+        department=query.get("department"),
+        active=_flag(query.get("active")),
+        **_page(query),
+    )
+    return 200, _listing(rows), wait, run
+
+
+@route("GET", r"/employees/(\d+)")
+def get_employee(server: ApiServer, match, query: dict, body) -> tuple:
+    employee_id = int(match[1])
+    row, wait, run = server.read(server.db.get_employee, employee_id)
+    return 200, _json_row(_found(row, "Employee", employee_id)), wait, run
+
+
+@route("POST", "/employees")
+def add_employee(server: ApiServer, match, query: dict, body: dict) -> tuple:
+    emp = Employee(name=_field(body, "name"), department=_field(body, "department"))
+    employee_id, wait, run = server.write(server.db.add_employees, emp)
+    return 201, {"id": employee_id}, wait, run
+
+
+@route("POST", r"/employees/(\d+)/offboard")
+def offboard(server: ApiServer, match, query: dict, body: dict) -> tuple:
+    result, wait, run = server.write(
+        server.db.offboard_employee,
+        int(match[1]),
+        reclaim=_bool_field(body, "reclaim", True),
+        return_date=body.get("return_date"),
+        reclaim_status=body.get("reclaim_status", "AVAILABLE"),
+    )
+    return 200, {"reclaimed": [asset for _, asset in result.reclaimed]}, wait, run
+
+
+@route("GET", "/assignments")
+def list_assignments(server: ApiServer, match, query: dict, body) -> tuple:
+    rows, wait, run = server.read(
+        server.db.page_active_assignments,
+        department=query.get("department"),
+        category=query.get("category"),
+        **_page(query),
+    )
+    return 200, _listing(rows), wait, run
+
+
+@route("POST", "/assignments")
+def assign(server: ApiServer, match, query: dict, body: dict) -> tuple:
+    fields = {
+        "asset_id": _field(body, "asset_id"),
+        "employee_id": _field(body, "employee_id"),
+    }
+    if body.get("assigned_date"):
+        fields["assigned_date"] = body["assigned_date"]
+
+    _, wait, run = server.write(server.db.assign_asset, Assignment(**fields))
+    return 201, fields, wait, run
+
+
+@route("GET", "/search/(assets|employees)")
+def search(server: ApiServer, match, query: dict, body) -> tuple:
+    fn = server.db.search_assets if match[1] == "assets" else server.db.search_employees
+    rows, wait, run = server.read(
+        fn, _field(query, "q"), limit=_limit(query, 20)
+    )
+    return 200, {"items": [_json_row(row) for row in rows]}, wait, run
+
+
+@route("GET", "/summary")
+def summary(server: ApiServer, match, query: dict, body) -> tuple:
+    result, wait, run = server.read(server.db.get_inventory_summary)
+    return 200, result, wait, run
+
+
+@route("GET", "/changes")
+def changes(server: ApiServer, match, query: dict, body) -> tuple:
+    rows, wait, run = server.read(
+        server.db.changes_since,
+        _int(query.get("since"), "since", 0),
+        limit=_limit(query),
+        table=query.get("table"),
+    )
+    items = [{**row._asdict(), "data": json.loads(row.data or "null")} for row in rows]
+    return 200, {"items": items, "last_seq": rows[-1].seq if rows else None}, wait, run
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    # keep-alive, so a client can reuse one connection for many requests;
+    # headers and body go out as separate writes, and with Nagle on the body
+    # waits ~40ms for the client's delayed ACK
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: ApiServer
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        start = time.perf_counter()
+        wait = run = 0.0
+        url = urlsplit(self.path)
+
+        try:
+            body = self._read_body()
+            handler, match = self._route(method, url.path)
+            status, payload, wait, run = handler(
+                self.server, match, dict(parse_qsl(url.query)), body
+            )
+        except HttpError as e:
+            status, payload = e.status, {"error": str(e)}
+        except (ValueError, TypeError) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            self.log_error("%s %s failed: %r", method, url.path, e)
+            status, payload = 500, {"error": "Internal server error."}
+
+        data = json.dumps(payload).encode()
+        total = time.perf_counter() - start
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        # Server-Timing shows in browser dev tools; durations are in ms
+        self.send_header(
+            "Server-Timing",
+            f"queue;dur={wait * 1000:.3f}, db;dur={run * 1000:.3f}, total;dur={total * 1000:.3f}",
+        )
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        if length > MAX_BODY:
+            # the body is left unread, so the connection cannot carry
+            # another request
+            self.close_connection = True
+            raise HttpError(413, "Request body too large.")
+
+        try:
+            body = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError:
+            raise HttpError(400, "Request body must be JSON.") from None
+
+        if not isinstance(body, dict):
+            raise HttpError(400, "Request body must be a JSON object.")
+        return body
+
+    def _route(self, method: str, path: str) -> tuple[Callable, re.Match]:
+        allowed = False
+        for route_method, pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method == method:
+                return handler, match
+            allowed = True
+
+        if allowed:
+            raise HttpError(405, f"{method} is not allowed on {path}.")
+        raise HttpError(404, f"No endpoint at {path}.")
+
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        # one line per request on stderr would dominate the cost under load;
+        # errors still go through log_error
+        pass
@@ -0,0 +1,235 @@
+import json
+import logging
+import re
+import sqlite3 as sql
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger("asset_tracker.slow_query")
+
+# Prometheus-style latency buckets, in seconds
+BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_sql(query: str) -> str:
+    return _WHITESPACE_RE.sub(" ", query).strip()
+
+
+class Histogram:
+    def __init__(self) -> None:
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.rows = 0
+
+    def observe(self, seconds: float, rows: int = 0) -> None:
+        self.count += 1
+        self.sum += seconds
+        self.rows += rows
+
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def to_dict(self) -> dict:
+        cumulative, total = {}, 0
+        for bound, hits in zip(BUCKETS, self.buckets):
+            total += hits
+            cumulative[str(bound)] = total
+        cumulative["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.sum, 6),
+            "rows": self.rows,
+            "buckets": cumulative,
+        }
+
+
+class Instrumentation:
+    def __init__(self, slow_query_ms: float | None = 100.0) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.methods: dict[str, Histogram] = {}
+        self.statements: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record_method(self, name: str, seconds: float, rows: int = 0) -> None:
+        with self._lock:
+            self.methods.setdefault(name, Histogram()).observe(seconds, rows)
+
+    def record_statement(
+        self,
+        conn: sql.Connection,
+        query: str,
+        params: Any,
+        seconds: float,
+        rows: int = 0,
+    ) -> None:
+        key = normalize_sql(query)
+
+        with self._lock:
+            self.statements.setdefault(key, Histogram()).observe(seconds, rows)
+
+        if self.slow_query_ms is not None and seconds * 1000 >= self.slow_query_ms:
+            logger.warning(
+                "slow query (%.1f ms, %d rows): %s\n%s",
+                seconds * 1000,
+                rows,
+                key,
+                explain(conn, query, params),
+            )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "methods": {k: h.to_dict() for k, h in self.methods.items()},
+                "statements": {k: h.to_dict() for k, h in self.statements.items()},
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        data = self.snapshot()
+        lines: list[str] = []
+
+        for kind, label in (("methods", "method"), ("statements", "statement")):
+            metric = f"asset_tracker_{label}_duration_seconds"
+            lines.append(f"# HELP {metric} Latency of Database_manager {kind}.")
+            lines.append(f"# TYPE {metric} histogram")
+
+            for name, hist in data[kind].items():
+                value = _escape_label(name)
+                for bound, count in hist["buckets"].items():
+                    lines.append(f'{metric}_bucket{{{label}="{value}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_sum{{{label}="{value}"}} {hist["sum_seconds"]}')
+                lines.append(f'{metric}_count{{{label}="{value}"}} {hist["count"]}')
+
+            rows_metric = f"asset_tracker_{label}_rows_total"
+            lines.append(f"# TYPE {rows_metric} counter")
+            for name, hist in data[kind].items():
+                lines.append(f'{rows_metric}{{{label}="{_escape_label(name)}"}} {hist["rows"]}')
+
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str, fmt: str | None = None) -> None:
+        if fmt is None:
+            fmt = "json" if path.endswith(".json") else "prometheus"
+
+        if fmt not in ("json", "prometheus"):
+            raise ValueError(f"Unsupported metrics format: '{fmt}'. Must be json or prometheus")
+
+        text = self.to_json() if fmt == "json" else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def explain(conn: sql.Connection, query: str, params: Any) -> str:
+    if not normalize_sql(query).upper().startswith(("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")):
+        return "(no query plan)"
+
+    try:
+        # base-class execute so the EXPLAIN itself is not instrumented
+        rows = sql.Connection.execute(conn, f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+    except sql.Error as e:
+        return f"(query plan unavailable: {e})"
+
+    return "\n".join(f"  {row[3]}" for row in rows)
+
+
+class InstrumentedCursor(sql.Cursor):
+    # A statement's time covers execute() plus the fetches that step it;
+    # it is recorded once the result is exhausted, or the cursor moves on.
+    _query: str | None = None
+
+    def execute(self, query: str, params: Any = ()) -> "InstrumentedCursor":
+        self._finish()
+        self._query, self._params, self._rows = query, params, 0
+
+        start = time.perf_counter()
+        try:
+            super().execute(query, params)
+        finally:
+            self._elapsed = time.perf_counter() - start
+
+        if self.description is None:
+            self._finish()
+        return self
+
+    def executemany(self, query: str, seq: Any) -> "InstrumentedCursor":
+        self._finish()
+
+        start = time.perf_counter()
+        super().executemany(query, seq)
+        self.connection.instrumentation.record_statement(
+            self.connection, query, None, time.perf_counter() - start
+        )
+        return self
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._add(time.perf_counter() - start, row is not None)
+
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list:
+        size = self.arraysize if size is None else size
+        start = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._add(time.perf_counter() - start, len(rows))
+
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self) -> list:
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._add(time.perf_counter() - start, len(rows))
+        self._finish()
+        return rows
+
+    def close(self) -> None:
+        self._finish()
+        super().close()
+
+    def __del__(self) -> None:
+        self._finish()
+
+    def _add(self, seconds: float, rows: int) -> None:
+        if self._query is not None:
+            self._elapsed += seconds
+            self._rows += rows
+
+    def _finish(self) -> None:
+        if self._query is None:
+            return
+
+        query, self._query = self._query, None
+        self.connection.instrumentation.record_statement(
+            self.connection, query, self._params, self._elapsed, self._rows
+        )
+
+
+class InstrumentedConnection(sql.Connection):
+    instrumentation: Instrumentation
+
+    def cursor(self, factory: type = InstrumentedCursor) -> sql.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, query: str, params: Any = ()) -> sql.Cursor:
+        return self.cursor().execute(query, params)
+
+    def executemany(self, query: str, seq: Any) -> sql.Cursor:
+        return self.cursor().executemany(query, seq)
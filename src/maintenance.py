@@ -0,0 +1,299 @@
+import os
+import sqlite3 as sql
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Iterator
+
+from src.migrations import SCHEMA_VERSION, archive_asset_stats_sql, get_version, migrate
+
+BACKUP_PAGES = 256
+BACKUP_DELAY = 0.005
+BACKUP_RESTARTS = 3
+ARCHIVE_CHUNK = 5000
+
+
+@dataclass
+class MaintenanceReport:
+    path: str
+    timings: dict[str, float] = field(default_factory=dict)
+    stats: dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+
+class _BackupRestarted(Exception):
+    pass
+
+
+def _check(conn: sql.Connection, path: str) -> None:
+    result = conn.execute("PRAGMA quick_check").fetchone()[0]
+    if result != "ok":
+        raise ValueError(f"{path} failed its integrity check: {result}")
+
+    version = get_version(conn)
+    if version > SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} has schema version {version}, newer than supported version {SCHEMA_VERSION}."
+        )
+
+
+def _copy(
+    source: sql.Connection,
+    target: sql.Connection,
+    pages: int,
+    delay: float,
+    restarts: int,
+    report: MaintenanceReport,
+) -> None:
+    # copying a few pages per step releases the source's read lock between
+    # steps, so in rollback-journal mode writers are not shut out for the
+    # whole copy; a write from another connection restarts the copy, so
+    # after a few restarts the rest is taken in one step
+    def progress(status: int, remaining: int, total: int) -> None:
+        nonlocal last
+        report.stats["steps"] += 1
+        if remaining > last:
+            raise _BackupRestarted
+        last = remaining
+        time.sleep(delay)
+
+    report.stats.update(steps=0, restarts=0)
+    for _ in range(restarts):
+        last = float("inf")
+        try:
+            source.backup(target, pages=pages, progress=progress)
+            break
+        except _BackupRestarted:
+            report.stats["restarts"] += 1
+    else:
+        source.backup(target)
+
+    report.stats["pages"] = target.execute("PRAGMA page_count").fetchone()[0]
+
+
+def backup(
+    db_name: str,
+    dest: str,
+    pages: int = BACKUP_PAGES,
+    delay: float = BACKUP_DELAY,
+    restarts: int = BACKUP_RESTARTS,
+) -> MaintenanceReport:
+    # written beside dest and renamed, so dest is never a half-written file
+    report = MaintenanceReport(dest)
+    partial = f"{dest}.partial"
+    if os.path.exists(partial):
+        os.remove(partial)
+
+    with closing(sql.connect(db_name)) as source, closing(sql.connect(partial)) as target:
+        with report.phase("copy"):
+            _copy(source, target, pages, delay, restarts, report)
+        with report.phase("verify"):
+            _check(target, dest)
+
+    with report.phase("publish"):
+        os.replace(partial, dest)
+
+    return report
+
+
+def snapshot(db_name: str, directory: str, keep: int = 7) -> MaintenanceReport:
+    # VACUUM INTO reads one consistent state and writes it compacted; in WAL
+    # mode writers carry on meanwhile. Names sort by time, so the oldest
+    # ones past `keep` are pruned
+    if keep < 1:
+        raise ValueError("Keep at least one snapshot.")
+
+    os.makedirs(directory, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(db_name))[0]
+    dest = os.path.join(directory, f"{stem}-{datetime.now():%Y%m%d-%H%M%S-%f}.db")
+    report = MaintenanceReport(dest)
+
+    with closing(sql.connect(db_name)) as conn:
+        with report.phase("vacuum_into"):
+            conn.execute("VACUUM INTO ?", (dest,))
+
+    with report.phase("verify"), closing(sql.connect(dest)) as conn:
+        _check(conn, dest)
+        report.stats["bytes"] = os.path.getsize(dest)
+
+    with report.phase("prune"):
+        snapshots = sorted(
+            name
+            for name in os.listdir(directory)
+            if name.startswith(f"{stem}-") and name.endswith(".db")
+        )
+        old = snapshots[: max(0, len(snapshots) - keep)]
+        for name in old:
+            os.remove(os.path.join(directory, name))
+        report.stats["pruned"] = len(old)
+
+    return report
+
+
+def restore(
+    db_name: str,
+    source_path: str,
+    pages: int = BACKUP_PAGES,
+    delay: float = BACKUP_DELAY,
+) -> MaintenanceReport:
+    if not os.path.exists(source_path):
+        raise ValueError(f"Backup file not found: {source_path}")
+
+    report = MaintenanceReport(db_name)
+
+    with closing(sql.connect(source_path)) as source:
+        with report.phase("verify"):
+            _check(source, source_path)
+
+        # copied through SQLite rather than over the file, so open
+        # connections and the WAL see the restored state, not a torn one
+        with closing(sql.connect(db_name)) as target:
+            with report.phase("copy"):
+                _copy(source, target, pages, delay, BACKUP_RESTARTS, report)
+            with report.phase("migrate"):
+                migrate(target)
+
+    return report
+
+
+def compact(
+    db_name: str,
+    archive_path: str,
+    years: int,
+    today: date | None = None,
+    vacuum: bool = True,
+    chunk_size: int = ARCHIVE_CHUNK,
+) -> MaintenanceReport:
+    if years < 1:
+        raise ValueError("Keep at least one year of history.")
+
+    today = today or date.today()
+    try:
+        cutoff = today.replace(year=today.year - years)
+    except ValueError:
+        cutoff = today.replace(year=today.year - years, day=28)
+
+    report = MaintenanceReport(db_name)
+    report.stats["bytes_before"] = os.path.getsize(db_name)
+
+    with closing(sql.connect(db_name, isolation_level=None)) as conn:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS archive.assignments(
+            id INTEGER PRIMARY KEY,
+            asset_id INTEGER,
+            employee_id INTEGER,
+            assigned_date TEXT,
+            return_date TEXT
+            )"""
+        )
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS archive.changes(
+            seq INTEGER PRIMARY KEY,
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            data TEXT,
+            changed_at TEXT NOT NULL
+            )"""
+        )
+
+        with report.phase("archive"):
+            report.stats["archived"] = _archive(conn, cutoff.isoformat(), chunk_size)
+            report.stats["changes_archived"] = _archive_changes(
+                conn, cutoff.isoformat(), chunk_size
+            )
+
+        conn.execute("DETACH DATABASE archive")
+
+        if vacuum:
+            with report.phase("vacuum"):
+                conn.execute("VACUUM")
+
+    report.stats["bytes_after"] = os.path.getsize(db_name)
+    return report
+
+
+def _archive(conn: sql.Connection, cutoff: str, chunk_size: int) -> int:
+    # short chunks keep the write lock free for live assign/return calls.
+    # Each chunk is copied and committed before it is deleted, because
+    # commits across attached WAL databases are not atomic; a crash in
+    # between leaves rows in both files, which the next run settles
+    archived = 0
+    after_id = 0
+
+    while True:
+        ids = [
+            row[0]
+            for row in conn.execute(
+                """SELECT id FROM assignments
+                WHERE id > ? AND return_date IS NOT NULL AND return_date < ?
+                ORDER BY id LIMIT ?""",
+                (after_id, cutoff, chunk_size),
+            )
+        ]
+        if not ids:
+            return archived
+
+        ranged = "id BETWEEN ? AND ? AND return_date IS NOT NULL AND return_date < ?"
+        params = (ids[0], ids[-1], cutoff)
+
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            f"INSERT OR IGNORE INTO archive.assignments SELECT * FROM main.assignments WHERE {ranged}",
+            params,
+        )
+        conn.execute("COMMIT")
+
+        # the archived totals land in the same transaction as the delete,
+        # so asset_stats keeps the history either way; the pause row makes
+        # the change log record 'archive' rather than 'delete'
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("INSERT INTO search_index_paused VALUES ('archive')")
+        conn.execute(archive_asset_stats_sql(ranged), params)
+        deleted = conn.execute(f"DELETE FROM main.assignments WHERE {ranged}", params).rowcount
+        conn.execute("DELETE FROM search_index_paused WHERE name = 'archive'")
+        conn.execute("COMMIT")
+
+        archived += deleted
+        after_id = ids[-1]
+
+
+def _archive_changes(conn: sql.Connection, cutoff: str, chunk_size: int) -> int:
+    # nothing else trims the change log. Entries older than the cutoff move
+    # to the archive the same way, so a consumer further behind than that
+    # has to start over from a full copy
+    archived = 0
+
+    while True:
+        last = conn.execute(
+            """SELECT MAX(seq) FROM (
+                SELECT seq FROM changes WHERE changed_at < ? ORDER BY seq LIMIT ?
+            )""",
+            (cutoff, chunk_size),
+        ).fetchone()[0]
+        if last is None:
+            return archived
+
+        ranged = "seq <= ? AND changed_at < ?"
+        params = (last, cutoff)
+
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            f"INSERT OR IGNORE INTO archive.changes SELECT * FROM main.changes WHERE {ranged}",
+            params,
+        )
+        conn.execute("COMMIT")
+
+        conn.execute("BEGIN IMMEDIATE")
+        archived += conn.execute(f"DELETE FROM main.changes WHERE {ranged}", params).rowcount
+        conn.execute("COMMIT")
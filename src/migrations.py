@@ -0,0 +1,601 @@
+import sqlite3 as sql
+
+INVENTORY_SUMMARY_QUERY = """SELECT COALESCE(category, ''), COALESCE(status, ''), COUNT(*)
+    FROM assets GROUP BY 1, 2"""
+
+DEPARTMENT_SUMMARY_QUERY = """SELECT COALESCE(e.department, ''), COALESCE(a.category, ''), COUNT(*)
+    FROM assignments AS assign
+    JOIN employees AS e ON e.id = assign.employee_id
+    JOIN assets AS a ON a.id = assign.asset_id
+    WHERE assign.return_date IS NULL
+    GROUP BY 1, 2"""
+
+# julianday('0001-01-01') is 1721425.5, so this turns julianday() into the
+# proleptic Gregorian ordinal that date.toordinal() uses
+JULIAN_ORDINAL_OFFSET = 1721424.5
+
+
+def day_number_sql(expr: str) -> str:
+    return f"CAST(julianday({expr}) - {JULIAN_ORDINAL_OFFSET} AS INTEGER)"
+
+
+def _max_sql(a: str, b: str) -> str:
+    # MAX() of two values where either may be NULL
+    return f"MAX(COALESCE({a}, {b}), COALESCE({b}, {a}))"
+
+
+def _asset_stats_query(where: str, archived: bool = True) -> str:
+    # closed assignments add their length; the open one, if any, is kept as
+    # open_since so its running days can be added at read time. Rows moved
+    # out by compact live on as totals in asset_stats_archived
+    if not archived:
+        return f"""SELECT ase.id, COUNT(assign.id),
+        COALESCE(SUM({day_number_sql("assign.return_date")} - {day_number_sql("assign.assigned_date")}), 0),
+        MAX(CASE WHEN assign.return_date IS NULL THEN {day_number_sql("assign.assigned_date")} END),
+        {day_number_sql("MAX(assign.return_date)")}
+    FROM assets AS ase
+    LEFT JOIN assignments AS assign ON assign.asset_id = ase.id
+    {where}
+    GROUP BY ase.id"""
+
+    return f"""SELECT ase.id, COUNT(assign.id) + COALESCE(arch.assignments, 0),
+        COALESCE(SUM({day_number_sql("assign.return_date")} - {day_number_sql("assign.assigned_date")}), 0)
+            + COALESCE(arch.assigned_days, 0),
+        MAX(CASE WHEN assign.return_date IS NULL THEN {day_number_sql("assign.assigned_date")} END),
+        {_max_sql(day_number_sql("MAX(assign.return_date)"), "arch.last_returned")}
+    FROM assets AS ase
+    LEFT JOIN asset_stats_archived AS arch ON arch.asset_id = ase.id
+    LEFT JOIN assignments AS assign ON assign.asset_id = ase.id
+    {where}
+    GROUP BY ase.id"""
+
+
+ASSET_STATS_QUERY = _asset_stats_query("")
+
+
+def _recount_asset_stats_sql(asset_id: str, archived: bool = True) -> str:
+    # rare edits (corrected dates, deleted rows) recount just that asset
+    # from its own history, which the (asset_id, assigned_date) index serves
+    return f"""INSERT OR REPLACE INTO asset_stats(
+        asset_id, assignments, assigned_days, open_since, last_returned
+    ) {_asset_stats_query(f"WHERE ase.id = {asset_id}", archived)};"""
+
+
+def _asset_stats_recount_triggers(archived: bool = True) -> list[str]:
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS trg_asset_stats_assignment_update
+            AFTER UPDATE OF asset_id, assigned_date, return_date ON assignments
+            WHEN NOT (
+                OLD.return_date IS NULL AND NEW.return_date IS NOT NULL
+                AND OLD.assigned_date IS NEW.assigned_date AND OLD.asset_id = NEW.asset_id
+            )
+            AND (
+                OLD.asset_id IS NOT NEW.asset_id OR OLD.assigned_date IS NOT NEW.assigned_date
+                OR OLD.return_date IS NOT NEW.return_date
+            )
+            BEGIN
+                {_recount_asset_stats_sql("OLD.asset_id", archived)}
+                {_recount_asset_stats_sql("NEW.asset_id", archived)}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_asset_stats_assignment_delete
+            AFTER DELETE ON assignments
+            BEGIN
+                {_recount_asset_stats_sql("OLD.asset_id", archived)}
+            END""",
+    ]
+
+
+def archive_asset_stats_sql(where: str) -> str:
+    # run before compact deletes closed rows, so the recount their delete
+    # triggers adds the archived totals back and nothing is lost
+    return f"""INSERT INTO asset_stats_archived(asset_id, assignments, assigned_days, last_returned)
+        SELECT asset_id, COUNT(*),
+            SUM({day_number_sql("return_date")} - {day_number_sql("assigned_date")}),
+            {day_number_sql("MAX(return_date)")}
+        FROM assignments
+        WHERE {where}
+        GROUP BY asset_id
+        ON CONFLICT(asset_id) DO UPDATE SET
+            assignments = assignments + excluded.assignments,
+            assigned_days = assigned_days + excluded.assigned_days,
+            last_returned = {_max_sql("last_returned", "excluded.last_returned")}"""
+
+
+def _pad_date_sql(column: str) -> str:
+    # older releases stored dates like 2024-2-9; zero-pad them so that
+    # date ranges can be compared as text and served from indexes
+    rest = f"substr({column}, 6)"
+    month = f"CAST(substr({rest}, 1, instr({rest}, '-') - 1) AS INTEGER)"
+    day = f"CAST(substr({rest}, instr({rest}, '-') + 1) AS INTEGER)"
+    return f"""UPDATE assignments
+    SET {column} = printf('%s-%02d-%02d', substr({column}, 1, 4), {month}, {day})
+    WHERE length({column}) < 10 AND {column} LIKE '____-%-%'"""
+
+
+def _fts_insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    new = ", ".join(f"NEW.{c}" for c in columns)
+    return f"INSERT INTO {table}_fts(rowid, {', '.join(columns)}) VALUES (NEW.id, {new});"
+
+
+def _fts_trigger_sql(table: str, *columns: str) -> list[str]:
+    # only the indexed columns fire the update trigger, so status and
+    # is_active changes never touch the search index
+    fts = f"{table}_fts"
+    names = ", ".join(columns)
+    old = ", ".join(f"OLD.{c}" for c in columns)
+    delete = f"""INSERT INTO {fts}({fts}, rowid, {names})
+                VALUES ('delete', OLD.id, {old});"""
+    insert = _fts_insert_sql(table, columns)
+
+    return [
+        # bulk imports pause the insert trigger for their own transaction and
+        # index each chunk with one INSERT ... SELECT, which is ~5x faster
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert
+            AFTER INSERT ON {table}
+            WHEN NOT EXISTS (SELECT 1 FROM search_index_paused WHERE name = '{table}')
+            BEGIN
+                {insert}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                {delete}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{fts}_update
+            AFTER UPDATE OF {names} ON {table}
+            BEGIN
+                {delete}
+                {insert}
+            END""",
+    ]
+
+
+CHANGE_COLUMNS = {
+    "assets": ("id", "name", "category", "status"),
+    "employees": ("id", "name", "department", "is_active"),
+    "assignments": ("id", "asset_id", "employee_id", "assigned_date", "return_date"),
+}
+
+
+def change_row_sql(table: str, ref: str = "") -> str:
+    # the row as JSON, so a consumer can apply a change without reading it back
+    prefix = f"{ref}." if ref else ""
+    pairs = ", ".join(f"'{c}', {prefix}{c}" for c in CHANGE_COLUMNS[table])
+    return f"json_object({pairs})"
+
+
+def _change_log_sql(table: str, op: str, ref: str, data: str) -> str:
+    return f"""INSERT INTO changes(table_name, row_id, op, data)
+                VALUES ('{table}', {ref}.id, '{op}', {data});"""
+
+
+def _change_trigger_sql(table: str) -> list[str]:
+    columns = CHANGE_COLUMNS[table]
+    changed = " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in columns)
+
+    def log(op: str, ref: str, data: str) -> str:
+        return _change_log_sql(table, op, ref, data)
+
+    return [
+        # bulk imports pause this trigger like the search one and log each
+        # chunk with a single INSERT ... SELECT
+        f"""CREATE TRIGGER IF NOT EXISTS trg_changes_{table}_insert
+            AFTER INSERT ON {table}
+            WHEN NOT EXISTS (SELECT 1 FROM search_index_paused WHERE name = '{table}')
+            BEGIN
+                {log("insert", "NEW", change_row_sql(table, "NEW"))}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_changes_{table}_update
+            AFTER UPDATE ON {table}
+            WHEN {changed}
+            BEGIN
+                {log("update", "NEW", change_row_sql(table, "NEW"))}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_changes_{table}_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                {log("delete", "OLD", "NULL")}
+            END""",
+    ]
+
+
+SEARCH_COLUMNS = {"assets": ("name", "category"), "employees": ("name", "department")}
+
+# everything an insert into these tables keeps in step, row by row
+_ROW_INSERT_SQL = {
+    "assets": [
+        _fts_insert_sql("assets", SEARCH_COLUMNS["assets"]),
+        _change_log_sql("assets", "insert", "NEW", change_row_sql("assets", "NEW")),
+        """INSERT INTO inventory_summary(category, status, count)
+                VALUES (COALESCE(NEW.category, ''), COALESCE(NEW.status, ''), 1)
+                ON CONFLICT(category, status) DO UPDATE SET count = count + 1;""",
+        "INSERT OR IGNORE INTO asset_stats(asset_id) VALUES (NEW.id);",
+    ],
+    "employees": [
+        _fts_insert_sql("employees", SEARCH_COLUMNS["employees"]),
+        _change_log_sql("employees", "insert", "NEW", change_row_sql("employees", "NEW")),
+    ],
+}
+
+
+def _insert_trigger_sql(table: str) -> str:
+    # bulk imports pause this for their own transaction and catch up each
+    # chunk with bulk_insert_sql(); one trigger with one pause check per
+    # table, since every check costs about a microsecond per row
+    body = "\n                ".join(_ROW_INSERT_SQL[table])
+    return f"""CREATE TRIGGER IF NOT EXISTS trg_{table}_insert
+            AFTER INSERT ON {table}
+            WHEN NOT EXISTS (SELECT 1 FROM search_index_paused WHERE name = '{table}')
+            BEGIN
+                {body}
+            END"""
+
+
+def bulk_insert_sql(table: str) -> list[str]:
+    # the set-based form of _ROW_INSERT_SQL for rows with id > ?, one
+    # statement per derived table
+    columns = ", ".join(SEARCH_COLUMNS[table])
+    statements = [
+        f"""INSERT INTO {table}_fts(rowid, {columns})
+            SELECT id, {columns} FROM {table} WHERE id > ?""",
+        f"""INSERT INTO changes(table_name, row_id, op, data)
+            SELECT '{table}', id, 'insert', {change_row_sql(table)}
+            FROM {table} WHERE id > ? ORDER BY id""",
+    ]
+    if table == "assets":
+        statements += [
+            """INSERT INTO inventory_summary(category, status, count)
+            SELECT COALESCE(category, ''), COALESCE(status, ''), COUNT(*)
+            FROM assets WHERE id > ? GROUP BY 1, 2
+            ON CONFLICT(category, status) DO UPDATE SET count = count + excluded.count""",
+            "INSERT OR IGNORE INTO asset_stats(asset_id) SELECT id FROM assets WHERE id > ?",
+        ]
+    return statements
+
+
+# Each entry upgrades the schema to its version; PRAGMA user_version
+# records the last one applied so existing databases upgrade in place.
+MIGRATIONS: list[tuple[int, list[str]]] = [
+    (
+        1,
+        [
+            """CREATE TABLE IF NOT EXISTS assets(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            category TEXT,
+            status TEXT DEFAULT 'AVAILABLE'
+            )""",
+            """CREATE TABLE IF NOT EXISTS employees(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT,
+            department TEXT,
+            is_active INTEGER DEFAULT 1
+            )""",
+            """CREATE TABLE IF NOT EXISTS assignments(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            asset_id INTEGER,
+            employee_id INTEGER,
+            assigned_date TEXT,
+            return_date TEXT,
+            FOREIGN KEY (asset_id) REFERENCES assets(id),
+            FOREIGN KEY (employee_id) REFERENCES employees(id)
+            )""",
+        ],
+    ),
+    (
+        2,
+        [
+            """CREATE INDEX IF NOT EXISTS idx_assignments_open_asset
+            ON assignments(asset_id) WHERE return_date IS NULL""",
+            """CREATE INDEX IF NOT EXISTS idx_assignments_open_employee
+            ON assignments(employee_id) WHERE return_date IS NULL""",
+            "CREATE INDEX IF NOT EXISTS idx_assets_status ON assets(status)",
+            "CREATE INDEX IF NOT EXISTS idx_assets_category ON assets(category)",
+            "CREATE INDEX IF NOT EXISTS idx_employees_active ON employees(is_active)",
+            """CREATE INDEX IF NOT EXISTS idx_employees_department
+            ON employees(department)""",
+        ],
+    ),
+    (
+        3,
+        [
+            # close duplicate open assignments left by racing writers so
+            # the unique index can be built; the newest one is kept open
+            """UPDATE assignments
+            SET return_date=(
+                SELECT MAX(newer.assigned_date) FROM assignments AS newer
+                WHERE newer.asset_id=assignments.asset_id AND newer.return_date IS NULL
+            )
+            WHERE return_date IS NULL AND id NOT IN (
+                SELECT MAX(id) FROM assignments WHERE return_date IS NULL GROUP BY asset_id
+            )""",
+            "DROP INDEX IF EXISTS idx_assignments_open_asset",
+            """CREATE UNIQUE INDEX IF NOT EXISTS uq_assignments_open_asset
+            ON assignments(asset_id) WHERE return_date IS NULL""",
+        ],
+    ),
+    (
+        4,
+        [
+            # dashboard counters kept exact by triggers, so reads never scan
+            """CREATE TABLE IF NOT EXISTS inventory_summary(
+            category TEXT NOT NULL,
+            status TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (category, status)
+            ) WITHOUT ROWID""",
+            """CREATE TABLE IF NOT EXISTS department_summary(
+            department TEXT NOT NULL,
+            category TEXT NOT NULL,
+            assigned INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (department, category)
+            ) WITHOUT ROWID""",
+            """CREATE TRIGGER IF NOT EXISTS trg_summary_asset_insert
+            AFTER INSERT ON assets
+            BEGIN
+                INSERT INTO inventory_summary(category, status, count)
+                VALUES (COALESCE(NEW.category, ''), COALESCE(NEW.status, ''), 1)
+                ON CONFLICT(category, status) DO UPDATE SET count = count + 1;
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_summary_asset_delete
+            AFTER DELETE ON assets
+            BEGIN
+                UPDATE inventory_summary SET count = count - 1
+                WHERE category = COALESCE(OLD.category, '') AND status = COALESCE(OLD.status, '');
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_summary_asset_update
+            AFTER UPDATE OF status, category ON assets
+            WHEN OLD.status IS NOT NEW.status OR OLD.category IS NOT NEW.category
+            BEGIN
+                UPDATE inventory_summary SET count = count - 1
+                WHERE category = COALESCE(OLD.category, '') AND status = COALESCE(OLD.status, '');
+                INSERT INTO inventory_summary(category, status, count)
+                VALUES (COALESCE(NEW.category, ''), COALESCE(NEW.status, ''), 1)
+                ON CONFLICT(category, status) DO UPDATE SET count = count + 1;
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_summary_assignment_open
+            AFTER INSERT ON assignments
+            WHEN NEW.return_date IS NULL
+            BEGIN
+                INSERT INTO department_summary(department, category, assigned)
+                SELECT COALESCE(e.department, ''), COALESCE(a.category, ''), 1
+                FROM employees AS e, assets AS a
+                WHERE e.id = NEW.employee_id AND a.id = NEW.asset_id
+                ON CONFLICT(department, category) DO UPDATE SET assigned = assigned + 1;
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_summary_assignment_close
+            AFTER UPDATE OF return_date ON assignments
+            WHEN OLD.return_date IS NULL AND NEW.return_date IS NOT NULL
+            BEGIN
+                UPDATE department_summary SET assigned = assigned - 1
+                WHERE department = (SELECT COALESCE(department, '') FROM employees WHERE id = OLD.employee_id)
+                AND category = (SELECT COALESCE(category, '') FROM assets WHERE id = OLD.asset_id);
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_summary_assignment_delete
+            AFTER DELETE ON assignments
+            WHEN OLD.return_date IS NULL
+            BEGIN
+                UPDATE department_summary SET assigned = assigned - 1
+                WHERE department = (SELECT COALESCE(department, '') FROM employees WHERE id = OLD.employee_id)
+                AND category = (SELECT COALESCE(category, '') FROM assets WHERE id = OLD.asset_id);
+            END""",
+            "DELETE FROM inventory_summary",
+            "DELETE FROM department_summary",
+            "INSERT INTO inventory_summary(category, status, count) "
+            + INVENTORY_SUMMARY_QUERY,
+            "INSERT INTO department_summary(department, category, assigned) "
+            + DEPARTMENT_SUMMARY_QUERY,
+        ],
+    ),
+    (
+        5,
+        [
+            _pad_date_sql("assigned_date"),
+            _pad_date_sql("return_date"),
+            """CREATE INDEX IF NOT EXISTS idx_assignments_asset_date
+            ON assignments(asset_id, assigned_date)""",
+            """CREATE INDEX IF NOT EXISTS idx_assignments_employee_date
+            ON assignments(employee_id, assigned_date)""",
+            """CREATE INDEX IF NOT EXISTS idx_assignments_assigned_date
+            ON assignments(assigned_date)""",
+        ],
+    ),
+    (
+        6,
+        [
+            # external-content indexes: the text lives only in the base
+            # tables and the 2/3-character prefix indexes serve "dell lat"
+            # style queries without scanning the whole term list
+            """CREATE TABLE IF NOT EXISTS search_index_paused(
+            name TEXT PRIMARY KEY
+            ) WITHOUT ROWID""",
+            """CREATE VIRTUAL TABLE IF NOT EXISTS assets_fts USING fts5(
+            name, category, content='assets', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )""",
+            """CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5(
+            name, department, content='employees', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )""",
+            *_fts_trigger_sql("assets", "name", "category"),
+            *_fts_trigger_sql("employees", "name", "department"),
+            "INSERT INTO assets_fts(assets_fts) VALUES('rebuild')",
+            "INSERT INTO employees_fts(employees_fts) VALUES('rebuild')",
+        ],
+    ),
+    (
+        7,
+        [
+            # append-only change log; AUTOINCREMENT keeps seq increasing even
+            # after old entries are pruned, and writers commit one at a time,
+            # so a reader never sees a lower seq appear behind a higher one
+            """CREATE TABLE IF NOT EXISTS changes(
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            op TEXT NOT NULL,
+            data TEXT,
+            changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+            )""",
+            *_change_trigger_sql("assets"),
+            *_change_trigger_sql("employees"),
+            *_change_trigger_sql("assignments"),
+        ],
+    ),
+    (
+        8,
+        [
+            # per-asset utilization kept current by triggers; dates are day
+            # numbers (date.toordinal()) so reads do integer arithmetic only
+            """CREATE TABLE IF NOT EXISTS asset_stats(
+            asset_id INTEGER PRIMARY KEY,
+            assignments INTEGER NOT NULL DEFAULT 0,
+            assigned_days INTEGER NOT NULL DEFAULT 0,
+            open_since INTEGER,
+            last_returned INTEGER
+            )""",
+            # never-assigned assets count as idle since day 0
+            """CREATE INDEX IF NOT EXISTS idx_asset_stats_idle
+            ON asset_stats(COALESCE(last_returned, 0)) WHERE open_since IS NULL""",
+            """CREATE INDEX IF NOT EXISTS idx_asset_stats_closed_days
+            ON asset_stats(assigned_days) WHERE open_since IS NULL""",
+            # for an open asset, total days = (assigned_days - open_since) + today
+            """CREATE INDEX IF NOT EXISTS idx_asset_stats_open_days
+            ON asset_stats(assigned_days - open_since) WHERE open_since IS NOT NULL""",
+            """CREATE TRIGGER IF NOT EXISTS trg_asset_stats_asset_insert
+            AFTER INSERT ON assets
+            BEGIN
+                INSERT OR IGNORE INTO asset_stats(asset_id) VALUES (NEW.id);
+            END""",
+            """CREATE TRIGGER IF NOT EXISTS trg_asset_stats_asset_delete
+            AFTER DELETE ON assets
+            BEGIN
+                DELETE FROM asset_stats WHERE asset_id = OLD.id;
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS trg_asset_stats_assignment_insert
+            AFTER INSERT ON assignments
+            BEGIN
+                INSERT INTO asset_stats(asset_id, assignments, assigned_days, open_since, last_returned)
+                VALUES (
+                    NEW.asset_id,
+                    1,
+                    COALESCE({day_number_sql("NEW.return_date")} - {day_number_sql("NEW.assigned_date")}, 0),
+                    CASE WHEN NEW.return_date IS NULL THEN {day_number_sql("NEW.assigned_date")} END,
+                    {day_number_sql("NEW.return_date")}
+                )
+                ON CONFLICT(asset_id) DO UPDATE SET
+                    assignments = assignments + 1,
+                    assigned_days = assigned_days + excluded.assigned_days,
+                    open_since = COALESCE(excluded.open_since, open_since),
+                    last_returned = MAX(
+                        COALESCE(last_returned, excluded.last_returned),
+                        COALESCE(excluded.last_returned, last_returned)
+                    );
+            END""",
+            # the common update: an open assignment is returned
+            f"""CREATE TRIGGER IF NOT EXISTS trg_asset_stats_assignment_return
+            AFTER UPDATE OF return_date ON assignments
+            WHEN OLD.return_date IS NULL AND NEW.return_date IS NOT NULL
+            AND OLD.assigned_date IS NEW.assigned_date AND OLD.asset_id = NEW.asset_id
+            BEGIN
+                UPDATE asset_stats SET
+                    assigned_days = assigned_days
+                        + {day_number_sql("NEW.return_date")} - {day_number_sql("NEW.assigned_date")},
+                    open_since = NULL,
+                    last_returned = MAX(
+                        COALESCE(last_returned, {day_number_sql("NEW.return_date")}),
+                        {day_number_sql("NEW.return_date")}
+                    )
+                WHERE asset_id = NEW.asset_id;
+            END""",
+            *_asset_stats_recount_triggers(archived=False),
+            "DELETE FROM asset_stats",
+            """INSERT INTO asset_stats(asset_id, assignments, assigned_days, open_since, last_returned)
+            """ + _asset_stats_query("", archived=False),
+        ],
+    ),
+    (
+        9,
+        [
+            # totals of assignments that compact moved to the archive file
+            """CREATE TABLE IF NOT EXISTS asset_stats_archived(
+            asset_id INTEGER PRIMARY KEY,
+            assignments INTEGER NOT NULL DEFAULT 0,
+            assigned_days INTEGER NOT NULL DEFAULT 0,
+            last_returned INTEGER
+            )""",
+            "DROP TRIGGER IF EXISTS trg_asset_stats_asset_delete",
+            """CREATE TRIGGER IF NOT EXISTS trg_asset_stats_asset_delete
+            AFTER DELETE ON assets
+            BEGIN
+                DELETE FROM asset_stats WHERE asset_id = OLD.id;
+                DELETE FROM asset_stats_archived WHERE asset_id = OLD.id;
+            END""",
+            "DROP TRIGGER IF EXISTS trg_asset_stats_assignment_update",
+            "DROP TRIGGER IF EXISTS trg_asset_stats_assignment_delete",
+            *_asset_stats_recount_triggers(),
+        ],
+    ),
+    (
+        10,
+        [
+            "DROP TRIGGER IF EXISTS trg_assets_fts_insert",
+            "DROP TRIGGER IF EXISTS trg_changes_assets_insert",
+            "DROP TRIGGER IF EXISTS trg_summary_asset_insert",
+            "DROP TRIGGER IF EXISTS trg_asset_stats_asset_insert",
+            _insert_trigger_sql("assets"),
+            "DROP TRIGGER IF EXISTS trg_employees_fts_insert",
+            "DROP TRIGGER IF EXISTS trg_changes_employees_insert",
+            _insert_trigger_sql("employees"),
+        ],
+    ),
+    (
+        11,
+        [
+            # compact marks its own deletes, so consumers can tell history
+            # moved to the archive file from rows that were removed
+            "DROP TRIGGER IF EXISTS trg_changes_assignments_delete",
+            """CREATE TRIGGER IF NOT EXISTS trg_changes_assignments_delete
+            AFTER DELETE ON assignments
+            BEGIN
+                INSERT INTO changes(table_name, row_id, op, data)
+                VALUES ('assignments', OLD.id, CASE
+                    WHEN EXISTS (SELECT 1 FROM search_index_paused WHERE name = 'archive')
+                    THEN 'archive' ELSE 'delete' END, NULL);
+            END""",
+        ],
+    ),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(conn: sql.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sql.Connection) -> int:
+    current = get_version(conn)
+
+    if current > SCHEMA_VERSION:
+        raise ValueError(
+            f"Database schema version {current} is newer than supported version {SCHEMA_VERSION}."
+        )
+
+    for version, statements in MIGRATIONS:
+        if version <= current:
+            continue
+
+        conn.execute("BEGIN")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version={version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        current = version
+
+    return current
@@ -1,12 +1,39 @@
+import re
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import date
+from itertools import compress, repeat
+from operator import not_
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+# strptime("%Y-%m-%d") also accepts single-digit months and days
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+_ASCII_DIGIT_RE = re.compile(r"[0-9]")
 
 
 def get_today():
     return date.today().strftime("%Y-%m-%d")
 
 
-@dataclass
+def parse_date(value: str) -> str | None:
+    # returns the zero-padded ISO form so stored dates sort and compare as text
+    match = _DATE_RE.fullmatch(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3])).isoformat()
+    except ValueError:
+        return None
+
+
+def has_digit(text: str) -> bool:
+    if text.isascii():
+        return _ASCII_DIGIT_RE.search(text) is not None
+
+    return any(char.isdigit() for char in text)
+
+
+@dataclass(slots=True)
 class Asset:
     name: str
     category: str
@@ -35,8 +62,15 @@ class Asset:
         if self.category.isdigit():
             raise ValueError("Category cannot be just numbers.")
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "Asset":
+        # trusted rows straight from the assets table skip re-validation
+        asset = object.__new__(cls)
+        asset.id, asset.name, asset.category, asset.status = row
+        return asset
+
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     name: str
     department: str
@@ -56,7 +90,7 @@ class Employee:
         if self.id is not None and not isinstance(self.id, int):
             raise ValueError(f"ID must be a number, got{type(self.id)}")
 
-        if any(char.isdigit() for char in self.name):
+        if has_digit(self.name):
             raise ValueError(
                 f"Employee name cannot contain numbers. You typed: '{self.name}'"
             )
@@ -71,8 +105,14 @@ class Employee:
                 f"Invalid Active Status: {self.is_active}. Must be 1 (Active) or 0 (Inactive)"
             )
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "Employee":
+        emp = object.__new__(cls)
+        emp.id, emp.name, emp.department, emp.is_active = row
+        return emp
 
-@dataclass
+
+@dataclass(slots=True)
 class Assignment:
     asset_id: int
     employee_id: int
@@ -92,13 +132,218 @@ class Assignment:
                 f"Employee ID must be a number, got{type(self.employee_id)}"
             )
 
-        try:
-            datetime.strptime(self.assigned_date, "%Y-%m-%d")
-            if self.return_date:
-                datetime.strptime(self.return_date, "%Y-%m-%d")
-        except ValueError:
+        assigned_date = parse_date(self.assigned_date)
+        return_date = parse_date(self.return_date) if self.return_date else None
+
+        if assigned_date is None or (self.return_date and return_date is None):
             raise ValueError("Dates must be in YYYY-MM-DD format (e.g., 2025-01-30)")
 
+        self.assigned_date = assigned_date
+        self.return_date = return_date
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Assignment":
+        assign = object.__new__(cls)
+        (
+            assign.id,
+            assign.asset_id,
+            assign.employee_id,
+            assign.assigned_date,
+            assign.return_date,
+        ) = row
+        return assign
+
+
+@dataclass(slots=True)
+class ValidatedBatch:
+    # columns are normalized the way the models normalize them; errors are
+    # (row index, message) with the model's own ValueError text, one per
+    # failing row, and valid[i] is 0 for those rows
+    columns: dict[str, list]
+    valid: bytearray
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    def rows(self, *names: str) -> Iterator[tuple]:
+        return compress(zip(*(self.columns[name] for name in names)), self.valid)
+
+
+class _Checks:
+    # each rule makes one pass over a column through map(), so per-row work
+    # stays in C; Python only runs for rows that fail. Rules are applied in
+    # __post_init__ order and a row keeps its first failure, as the model would
+    def __init__(self, **columns: Sequence | None) -> None:
+        # rows() zips the columns, so a short one would drop rows silently
+        lengths = {name: len(column) for name, column in columns.items() if column is not None}
+        if len(set(lengths.values())) > 1:
+            sizes = ", ".join(f"{name}={size}" for name, size in lengths.items())
+            raise ValueError(f"Columns must all have the same length, got {sizes}.")
+
+        self.size = next(iter(lengths.values()))
+        self.valid = bytearray(b"\x01") * self.size
+        self.errors: dict[int, str] = {}
+
+    def fail(
+        self, column: Sequence, failing: Iterable, message: str | Callable[[Any], str]
+    ) -> None:
+        for i in compress(range(self.size), failing):
+            if self.valid[i]:
+                self.valid[i] = 0
+                self.errors[i] = message if isinstance(message, str) else message(column[i])
+
+    def integers(self, column: Sequence, label: str) -> None:
+        self.fail(
+            column,
+            map(not_, map(isinstance, column, repeat(int))),
+            lambda value: f"{label} must be a number, got{type(value)}",
+        )
+
+    def optional_ids(self, column: Sequence | None) -> None:
+        if column is not None:
+            self.fail(
+                column,
+                (value is not None and not isinstance(value, int) for value in column),
+                lambda value: f"ID must be a number, got{type(value)}",
+            )
+
+    def batch(self, **columns: list) -> ValidatedBatch:
+        return ValidatedBatch(columns, self.valid, sorted(self.errors.items()))
+
+
+def _memo_map(fn: Callable, column: Sequence) -> list:
+    # categories, statuses and dates repeat a lot, so fn runs once per
+    # distinct value and the column is filled by dict lookups
+    try:
+        lookup = {value: fn(value) for value in set(column)}
+    except TypeError:
+        return list(map(fn, column))
+    return list(map(lookup.__getitem__, column))
+
+
+def _text(column: Sequence, case: Callable[[str], str], memo: bool = False) -> list:
+    if memo:
+        return _memo_map(lambda value: case(value.strip()), column)
+    return list(map(case, map(str.strip, column)))
+
+
+def _digit_rows(names: list[str]) -> Iterable:
+    # the digits that occur anywhere in the column make up one character
+    # class, so each row is a single regex search; a column without any
+    # digit is settled by the first search alone
+    joined = "\x00".join(names)
+    if joined.isascii():
+        pattern = _ASCII_DIGIT_RE
+    else:
+        digits = "".join(re.escape(char) for char in set(joined) if char.isdigit())
+        pattern = re.compile(f"[{digits}]") if digits else None
+
+    if pattern is None or pattern.search(joined) is None:
+        return ()
+    return map(pattern.search, names)
+
+
+def validate_assets(
+    names: Sequence[str],
+    categories: Sequence[str],
+    statuses: Sequence[str] | None = None,
+    ids: Sequence | None = None,
+) -> ValidatedBatch:
+    checks = _Checks(names=names, categories=categories, statuses=statuses, ids=ids)
+    names = _text(names, str.title)
+    categories = _text(categories, str.title, memo=True)
+    statuses = (
+        ["AVAILABLE"] * len(names) if statuses is None else _text(statuses, str.upper, memo=True)
+    )
+
+    checks.fail(names, map(not_, names), "Asset name cant be empty")
+    checks.fail(categories, map(not_, categories), "Category cannot be empty")
+    checks.optional_ids(ids)
+    checks.fail(
+        names,
+        map(str.isdigit, names),
+        "Asset name cannot be just numbers (e.g. '23'). Try 'Laptop 23' instead.",
+    )
+    checks.fail(categories, map(str.isdigit, categories), "Category cannot be just numbers.")
+
+    return checks.batch(name=names, category=categories, status=statuses)
+
+
+def validate_employees(
+    names: Sequence[str],
+    departments: Sequence[str],
+    is_active: Sequence | None = None,
+    ids: Sequence | None = None,
+) -> ValidatedBatch:
+    checks = _Checks(names=names, departments=departments, is_active=is_active, ids=ids)
+    names = _text(names, str.title)
+    departments = _text(departments, str.upper, memo=True)
+
+    checks.fail(names, map(not_, names), "Employee name cant be empty")
+    checks.fail(departments, map(not_, departments), "Department name cant be empty")
+    checks.optional_ids(ids)
+    checks.fail(
+        names,
+        _digit_rows(names),
+        lambda name: f"Employee name cannot contain numbers. You typed: '{name}'",
+    )
+    checks.fail(
+        departments,
+        map(str.isdigit, departments),
+        lambda department: f"Department cannot be just numbers (You typed: '{department}')",
+    )
+    if is_active is None:
+        is_active = [1] * len(names)
+    else:
+        checks.fail(
+            is_active,
+            map(not_, map((1, 0).__contains__, is_active)),
+            lambda value: f"Invalid Active Status: {value}. Must be 1 (Active) or 0 (Inactive)",
+        )
+
+    return checks.batch(name=names, department=departments, is_active=list(is_active))
+
+
+def validate_assignments(
+    asset_ids: Sequence,
+    employee_ids: Sequence,
+    assigned_dates: Sequence[str] | None = None,
+    return_dates: Sequence[str | None] | None = None,
+    ids: Sequence | None = None,
+) -> ValidatedBatch:
+    checks = _Checks(
+        asset_ids=asset_ids,
+        employee_ids=employee_ids,
+        assigned_dates=assigned_dates,
+        return_dates=return_dates,
+        ids=ids,
+    )
+    message = "Dates must be in YYYY-MM-DD format (e.g., 2025-01-30)"
+
+    checks.optional_ids(ids)
+    checks.integers(asset_ids, "Asset ID")
+    checks.integers(employee_ids, "Employee ID")
+
+    if assigned_dates is None:
+        assigned_dates = [get_today()] * len(asset_ids)
+    parsed = _memo_map(parse_date, assigned_dates)
+    checks.fail(parsed, map(not_, parsed), message)
+
+    if return_dates is None:
+        returned = [None] * len(asset_ids)
+    else:
+        returned = _memo_map(lambda value: parse_date(value) if value else None, return_dates)
+        checks.fail(
+            returned,
+            (value and day is None for value, day in zip(return_dates, returned)),
+            message,
+        )
+
+    return checks.batch(
+        asset_id=list(asset_ids),
+        employee_id=list(employee_ids),
+        assigned_date=parsed,
+        return_date=returned,
+    )
+
 
 if __name__ == "__main__":
     try:
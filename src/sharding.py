@@ -0,0 +1,219 @@
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+from src.database import (
+    BULK_CHUNK_SIZE,
+    PAGE_SIZE,
+    BulkResult,
+    Database_manager,
+    OffboardResult,
+    setup_database,
+)
+from src.models import Asset, Assignment, Employee
+
+# shard i hands out ids in ((i + 1) * SPAN, (i + 2) * SPAN], so an id alone
+# names its site; ids up to SPAN were created before the file was sharded
+# and only the caller knows which site they belong to
+SHARD_ID_SPAN = 10**12
+SHARDED_TABLES = ("assets", "employees", "assignments")
+
+
+class ShardedDatabaseManager:
+    def __init__(self, shards: Mapping[str, str], **options: Any) -> None:
+        # sites keep their position for good: new sites go at the end, since
+        # the position decides the id range
+        if not shards:
+            raise ValueError("At least one shard is required.")
+
+        options.setdefault("journal_mode", "WAL")
+        options.setdefault("synchronous", "NORMAL")
+        self.sites = list(shards)
+        self.shards: dict[str, Database_manager] = {}
+
+        try:
+            for index, (site, db_name) in enumerate(shards.items()):
+                setup_database(db_name)
+                self.shards[site] = Database_manager(db_name, pooled=True, **options)
+                self._reserve_ids(site, index)
+        except Exception:
+            for db in self.shards.values():
+                db.close()
+            raise
+
+        # sqlite3 releases the GIL while a statement runs, so threads are
+        # enough to read every shard at once
+        self._pool = ThreadPoolExecutor(len(self.shards), thread_name_prefix="shard")
+
+    def __enter__(self) -> "ShardedDatabaseManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        for db in self.shards.values():
+            db.close()
+
+    def _reserve_ids(self, site: str, index: int) -> None:
+        low = (index + 1) * SHARD_ID_SPAN
+
+        with self.shards[site]._write_transaction() as cursor:
+            for table in SHARDED_TABLES:
+                cursor.execute("SELECT seq FROM sqlite_sequence WHERE name=?", (table,))
+                row = cursor.fetchone()
+
+                if row is None:
+                    cursor.execute(
+                        "INSERT INTO sqlite_sequence(name, seq) VALUES (?, ?)", (table, low)
+                    )
+                elif row[0] <= SHARD_ID_SPAN:
+                    # not sharded yet; existing rows keep their ids
+                    cursor.execute("UPDATE sqlite_sequence SET seq=? WHERE name=?", (low, table))
+                elif not low <= row[0] <= low + SHARD_ID_SPAN:
+                    raise ValueError(
+                        f"Shard '{site}' holds {table} ids outside its range. "
+                        "Sites must keep their original order."
+                    )
+
+    def site_for_id(self, row_id: int) -> str:
+        index = (row_id - 1) // SHARD_ID_SPAN - 1
+        if not 0 <= index < len(self.sites):
+            raise ValueError(
+                f"ID {row_id} does not belong to a shard's range; pass site= to route it."
+            )
+        return self.sites[index]
+
+    def shard(self, site: str) -> Database_manager:
+        if site not in self.shards:
+            raise ValueError(f"Unknown site: '{site}'. Must be one of {self.sites}")
+        return self.shards[site]
+
+    def _route(self, row_id: int, site: str | None) -> Database_manager:
+        return self.shard(site if site is not None else self.site_for_id(row_id))
+
+    def _fan_out(self, call: Callable[[Database_manager], Any]) -> list:
+        futures = [self._pool.submit(call, db) for db in self.shards.values()]
+        return [future.result() for future in futures]
+
+    def add_assets(self, asset: Asset, site: str) -> int:
+        return self.shard(site).add_assets(asset)
+
+    def add_employees(self, emp: Employee, site: str) -> int:
+        return self.shard(site).add_employees(emp)
+
+    def bulk_add_assets(
+        self, records: Iterable, site: str, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return self.shard(site).bulk_add_assets(records, chunk_size)
+
+    def bulk_add_employees(
+        self, records: Iterable, site: str, chunk_size: int = BULK_CHUNK_SIZE
+    ) -> BulkResult:
+        return self.shard(site).bulk_add_employees(records, chunk_size)
+
+    def assign_asset(self, assign: Assignment, site: str | None = None) -> None:
+        if site is None:
+            site = self.site_for_id(assign.asset_id)
+            if self.site_for_id(assign.employee_id) != site:
+                raise ValueError(
+                    f"Asset {assign.asset_id} and Employee {assign.employee_id} belong to different sites."
+                )
+
+        self.shard(site).assign_asset(assign)
+
+    def return_asset(self, asset_id: int, return_date: str, site: str | None = None) -> None:
+        self._route(asset_id, site).return_asset(asset_id, return_date)
+
+    def update_asset_status(
+        self, asset_id: int, new_status: str, site: str | None = None
+    ) -> None:
+        self._route(asset_id, site).update_asset_status(asset_id, new_status)
+
+    def offboard_employee(
+        self, employee_id: int, site: str | None = None, **kwargs: Any
+    ) -> OffboardResult:
+        return self._route(employee_id, site).offboard_employee(employee_id, **kwargs)
+
+    def get_asset(self, asset_id: int, site: str | None = None) -> Any:
+        return self._route(asset_id, site).get_asset(asset_id)
+
+    def get_employee(self, employee_id: int, site: str | None = None) -> Any:
+        return self._route(employee_id, site).get_employee(employee_id)
+
+    def get_active_assignments(self) -> list:
+        return list(chain.from_iterable(self._fan_out(lambda db: db.get_active_assignments())))
+
+    def get_inventory_summary(self) -> dict:
+        total: dict = {"assets": {}, "assigned_by_department": {}}
+
+        for summary in self._fan_out(lambda db: db.get_inventory_summary()):
+            for section, groups in summary.items():
+                for group, counts in groups.items():
+                    merged = total[section].setdefault(group, {})
+                    for key, count in counts.items():
+                        merged[key] = merged.get(key, 0) + count
+
+        return total
+
+    def search_assets(self, query: str, limit: int = 20, status: str | None = None) -> list:
+        return self._search(lambda db: db.search_assets(query, limit, status), limit)
+
+    def search_employees(
+        self, query: str, limit: int = 20, active: bool | None = None
+    ) -> list:
+        return self._search(lambda db: db.search_employees(query, limit, active), limit)
+
+    def _search(self, call: Callable, limit: int) -> list:
+        # bm25 scores from separate indexes are not comparable, so shards
+        # take turns: every site's best match, then every site's second...
+        ranked = (enumerate(rows) for rows in self._fan_out(call))
+        merged = heapq.merge(*ranked, key=itemgetter(0))
+        return [row for _, row in islice(merged, limit)]
+
+    def iter_assets(self, batch_size: int = PAGE_SIZE, **filters: Any) -> Iterator:
+        return self._merge_pages("page_assets", batch_size, filters)
+
+    def iter_employees(self, batch_size: int = PAGE_SIZE, **filters: Any) -> Iterator:
+        return self._merge_pages("page_employees", batch_size, filters)
+
+    def iter_active_assignments(self, batch_size: int = PAGE_SIZE, **filters: Any) -> Iterator:
+        return self._merge_pages("page_active_assignments", batch_size, filters)
+
+    def _merge_pages(self, page: str, batch_size: int, filters: dict) -> Iterator:
+        # each shard streams in id order, so a k-way merge on the id yields
+        # one id-ordered stream holding at most two pages per shard; ties
+        # between pre-shard ids go to the earlier site
+        streams = [
+            chain.from_iterable(self._prefetch(getattr(db, page), db._row_id, batch_size, filters))
+            for db in self.shards.values()
+        ]
+        row_id = next(iter(self.shards.values()))._row_id
+        return heapq.merge(*streams, key=row_id)
+
+    def _prefetch(
+        self, page: Callable, row_id: Callable, batch_size: int, filters: dict
+    ) -> Iterator[list]:
+        # the first page is requested here rather than inside the generator,
+        # so every shard starts reading before the merge asks for a row
+        future = self._pool.submit(page, after_id=0, limit=batch_size, **filters)
+
+        def pages() -> Iterator[list]:
+            nonlocal future
+            while True:
+                batch = future.result()
+                if len(batch) == batch_size:
+                    # fetch the next page while the caller works through this one
+                    future = self._pool.submit(
+                        page, after_id=row_id(batch[-1]), limit=batch_size, **filters
+                    )
+
+                yield batch
+
+                if len(batch) < batch_size:
+                    return
+
+        return pages()
@@ -0,0 +1,230 @@
+import sqlite3 as sql
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from itertools import compress, repeat
+from operator import itemgetter, sub
+from typing import Any, Iterable
+
+from src.migrations import day_number_sql
+
+SNAPSHOT_CHUNK = 50_000
+
+
+class Table:
+    def __init__(self, columns: dict[str, array], labels: dict[str, list[str]]) -> None:
+        # labels[name][code] is the value behind a dictionary-encoded column
+        self.columns = columns
+        self.labels = labels
+        self._codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in labels.items()
+        }
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.itemsize * len(col) for col in self.columns.values())
+
+    def decode(self, name: str, code: int) -> Any:
+        return self.labels[name][code] if name in self.labels else code
+
+    def select(self, **where: Any) -> bytes:
+        # one byte per row, 1 where every equality filter holds; the masks are
+        # ANDed as big integers so combining filters costs no per-row Python
+        selected = -1
+
+        for name, value in where.items():
+            column = self.columns[name]
+            if name in self.labels:
+                value = self._codes[name].get(value, -1)
+
+            mask = bytes(map(value.__eq__, column))
+            selected &= int.from_bytes(mask, "little")
+
+        return selected.to_bytes(len(self), "little") if where else b"\x01" * len(self)
+
+    def count_by(self, *by: str, **where: Any) -> dict:
+        keys = self._keys(by)
+        if where:
+            keys = compress(keys, self.select(**where))
+
+        return {self._decode_key(by, key): n for key, n in Counter(keys).items()}
+
+    def sum_by(self, values: Iterable[int], *by: str, **where: Any) -> dict:
+        # returns key -> (rows, total)
+        keys = self._keys(by)
+        if where:
+            selected = self.select(**where)
+            keys = compress(keys, selected)
+            values = compress(values, selected)
+
+        counts: dict = {}
+        totals: dict = {}
+        for key, value in zip(keys, values):
+            if key in totals:
+                counts[key] += 1
+                totals[key] += value
+            else:
+                counts[key] = 1
+                totals[key] = value
+
+        return {
+            self._decode_key(by, key): (counts[key], total)
+            for key, total in totals.items()
+        }
+
+    def _keys(self, by: tuple[str, ...]) -> Iterable:
+        if not by:
+            raise ValueError("Group by at least one column.")
+
+        columns = [self.columns[name] for name in by]
+        return columns[0] if len(columns) == 1 else zip(*columns)
+
+    def _decode_key(self, by: tuple[str, ...], key: Any) -> Any:
+        if len(by) == 1:
+            return self.decode(by[0], key)
+        return tuple(self.decode(name, code) for name, code in zip(by, key))
+
+
+@dataclass
+class Snapshot:
+    assets: Table
+    employees: Table
+    assignments: Table
+    today: int
+
+    @property
+    def nbytes(self) -> int:
+        return self.assets.nbytes + self.employees.nbytes + self.assignments.nbytes
+
+    def count_assets(self, *by: str, **where: Any) -> dict:
+        return self.assets.count_by(*by, **where)
+
+    def count_assignments(self, *by: str, **where: Any) -> dict:
+        return self.assignments.count_by(*by, **where)
+
+    def mean_duration(self, *by: str, **where: Any) -> dict:
+        # open assignments count up to the day the snapshot was taken
+        sums = self.assignments.sum_by(self.assignments["days"], *by, **where)
+        return {key: total / rows for key, (rows, total) in sums.items()}
+
+
+def _code_type(index: dict) -> str:
+    return "H" if len(index) <= 0xFFFF else "I"
+
+
+def _distinct(conn: sql.Connection, query: str) -> dict[str, int]:
+    values = [row[0] for row in conn.execute(query)]
+    return {value: code for code, value in enumerate(values)}
+
+
+def _lookup(table: Table, name: str, ids: array) -> tuple[array, list[str]]:
+    # a dense id -> code array keeps the per-row lookup in C. SQLite only
+    # enforces foreign keys on connections that turn them on, so an id may
+    # have no row; it gets the '' code, as a LEFT JOIN with COALESCE would
+    labels = list(table.labels[name])
+    if "" not in labels:
+        labels.append("")
+    missing = labels.index("")
+    typecode = _code_type(labels)
+
+    codes = table[name]
+    row_ids = table["id"]
+    low = min(min(row_ids, default=0), min(ids, default=0))
+    high = max(max(row_ids, default=0), max(ids, default=0))
+
+    if high - low > 4 * len(row_ids):
+        # sparse ids, e.g. sharded ranges next to pre-shard rows
+        by_id = dict(zip(row_ids, codes))
+        return array(typecode, map(by_id.get, ids, repeat(missing))), labels
+
+    by_id = array(typecode, [missing]) * (high - low + 1)
+    for row_id, code in zip(row_ids, codes):
+        by_id[row_id - low] = code
+    return array(typecode, map(by_id.__getitem__, map(low.__rsub__, ids))), labels
+
+
+def _load_table(
+    conn: sql.Connection,
+    query: str,
+    params: dict,
+    spec: list[tuple[str, str, dict | None]],
+) -> Table:
+    columns = {name: array(typecode) for name, typecode, _ in spec}
+    getters = [(columns[name], itemgetter(i), index) for i, (name, _, index) in enumerate(spec)]
+    cursor = conn.execute(query, params)
+
+    # fetched in chunks and appended column by column, so the full row
+    # tuples never exist at once
+    while rows := cursor.fetchmany(SNAPSHOT_CHUNK):
+        for column, getter, index in getters:
+            values = map(getter, rows)
+            column.extend(values if index is None else map(index.__getitem__, values))
+
+    labels = {name: list(index) for name, _, index in spec if index is not None}
+    return Table(columns, labels)
+
+
+def load_snapshot(conn: sql.Connection, today: str) -> Snapshot:
+    categories = _distinct(
+        conn, "SELECT DISTINCT COALESCE(category, '') FROM assets ORDER BY 1"
+    )
+    statuses = _distinct(conn, "SELECT DISTINCT COALESCE(status, '') FROM assets ORDER BY 1")
+    departments = _distinct(
+        conn, "SELECT DISTINCT COALESCE(department, '') FROM employees ORDER BY 1"
+    )
+
+    assets = _load_table(
+        conn,
+        "SELECT id, COALESCE(category, ''), COALESCE(status, '') FROM assets",
+        {},
+        [
+            ("id", "q", None),
+            ("category", _code_type(categories), categories),
+            ("status", _code_type(statuses), statuses),
+        ],
+    )
+    employees = _load_table(
+        conn,
+        "SELECT id, COALESCE(department, ''), is_active FROM employees",
+        {},
+        [
+            ("id", "q", None),
+            ("department", _code_type(departments), departments),
+            ("is_active", "b", None),
+        ],
+    )
+    assignments = _load_table(
+        conn,
+        f"""SELECT asset_id, employee_id,
+            {day_number_sql("assigned_date")},
+            {day_number_sql("COALESCE(return_date, :today)")},
+            return_date IS NULL
+        FROM assignments""",
+        {"today": today},
+        [
+            ("asset_id", "q", None),
+            ("employee_id", "q", None),
+            ("assigned", "i", None),
+            ("end", "i", None),
+            ("open", "b", None),
+        ],
+    )
+    # category and department come from the tables already in memory rather
+    # than a join, which would make SQLite build every row twice as wide
+    columns = assignments.columns
+    columns["category"], categories = _lookup(assets, "category", columns["asset_id"])
+    columns["department"], departments = _lookup(
+        employees, "department", columns["employee_id"]
+    )
+    columns["days"] = array("i", map(sub, columns["end"], columns["assigned"]))
+    assignments = Table(columns, {"category": categories, "department": departments})
+
+    today_ordinal = conn.execute(f"SELECT {day_number_sql(':today')}", {"today": today}).fetchone()[0]
+    return Snapshot(assets, employees, assignments, today_ordinal)
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from src.async_database import AsyncDatabaseManager
+from src.database import setup_database
+from src.models import Asset, Assignment, Employee
+
+
+@pytest.fixture
+def db_name(tmp_path):
+    name = str(tmp_path / "async.db")
+    setup_database(name)
+    return name
+
+
+def test_async_writes_and_reads(db_name):
+    async def scenario():
+        async with AsyncDatabaseManager(db_name) as db:
+            await db.add_assets(Asset(name="dell", category="laptop"))
+            await db.add_employees(Employee(name="Bob", department="IT"))
+            await db.assign_asset(
+                Assignment(asset_id=1, employee_id=1, assigned_date="2025-01-01")
+            )
+
+            return await db.get_active_assignments(), await db.get_asset(1)
+
+    active, asset = asyncio.run(scenario())
+
+    assert active == [("Bob", "Dell", "2025-01-01")]
+    assert asset[3] == "ASSIGNED"
+
+
+def test_async_errors_propagate(db_name):
+    async def scenario():
+        async with AsyncDatabaseManager(db_name) as db:
+            await db.assign_asset(Assignment(asset_id=1, employee_id=1))
+
+    with pytest.raises(ValueError, match="does not exist"):
+        asyncio.run(scenario())
+
+
+def test_concurrent_assigns_are_serialised(db_name):
+    async def scenario():
+        async with AsyncDatabaseManager(db_name, readers=2, max_pending=4) as db:
+            await db.bulk_add_assets([{"name": "Laptop", "category": "Tech"}])
+            await db.bulk_add_employees([{"name": "Bob", "department": "IT"}] * 20)
+
+            results = await asyncio.gather(
+                *(
+                    db.assign_asset(Assignment(asset_id=1, employee_id=emp_id))
+                    for emp_id in range(1, 21)
+                ),
+                return_exceptions=True,
+            )
+            return results, [row async for row in db.iter_employees(batch_size=3)]
+
+    results, employees = asyncio.run(scenario())
+
+    assert sum(r is None for r in results) == 1
+    assert all(isinstance(r, ValueError) for r in results if r is not None)
+    assert len(employees) == 20
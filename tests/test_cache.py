@@ -0,0 +1,34 @@
+import pytest
+from src.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1, cache.generation)
+    cache.put("b", 2, cache.generation)
+    cache.get("a")
+    cache.put("c", 3, cache.generation)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_put_after_invalidation_is_dropped():
+    cache = LRUCache(4)
+    generation = cache.generation
+    cache.invalidate("a")
+    cache.put("a", "stale", generation)
+
+    assert cache.peek("a") == (False, None)
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError, match="must be positive"):
+        LRUCache(0)
@@ -0,0 +1,61 @@
+import multiprocessing as mp
+import random
+import sqlite3 as sql
+from contextlib import closing
+
+from src.database import Database_manager, setup_database
+from src.models import Assignment
+
+ASSETS = 4
+EMPLOYEES = 4
+
+
+def hammer(db_name: str, seed: int, rounds: int) -> int:
+    rng = random.Random(seed)
+    assigned = 0
+
+    with Database_manager(db_name, pooled=True, journal_mode="WAL") as db:
+        for _ in range(rounds):
+            asset_id = rng.randint(1, ASSETS)
+            try:
+                if rng.random() < 0.6:
+                    employee_id = rng.randint(1, EMPLOYEES)
+                    db.assign_asset(Assignment(asset_id=asset_id, employee_id=employee_id))
+                    assigned += 1
+                else:
+                    db.return_asset(asset_id, "2025-01-01")
+            except ValueError:
+                pass
+
+    return assigned
+
+
+def test_concurrent_assign_return_never_double_assigns(tmp_path):
+    db_name = str(tmp_path / "stress.db")
+    setup_database(db_name)
+
+    with Database_manager(db_name) as db:
+        db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(ASSETS)])
+        db.bulk_add_employees([{"name": "Bob", "department": "IT"}] * EMPLOYEES)
+
+    ctx = mp.get_context("spawn")
+    with ctx.Pool(4) as pool:
+        assigned = sum(
+            pool.starmap(hammer, [(db_name, seed, 150) for seed in range(4)])
+        )
+
+    with closing(sql.connect(db_name)) as conn:
+        total = conn.execute("SELECT COUNT(*) FROM assignments").fetchone()[0]
+        open_per_asset = conn.execute(
+            "SELECT MAX(c) FROM (SELECT COUNT(*) AS c FROM assignments WHERE return_date IS NULL GROUP BY asset_id)"
+        ).fetchone()[0]
+        mismatched = conn.execute(
+            """SELECT COUNT(*) FROM assets AS a
+            WHERE (a.status='ASSIGNED') != EXISTS(
+                SELECT 1 FROM assignments WHERE asset_id=a.id AND return_date IS NULL
+            )"""
+        ).fetchone()[0]
+
+    assert assigned == total
+    assert open_per_asset in (None, 1)
+    assert mismatched == 0
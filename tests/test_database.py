@@ -1,6 +1,7 @@
 import pytest
 import os
 import gc
+import threading
 from src.database import Database_manager, setup_database
 from src.models import Asset, Employee, Assignment
 
@@ -92,3 +93,699 @@ def test_assign_already_assigned_asset_fails(db):
 
     with pytest.raises(ValueError, match="Only AVAILABLE assets can be assigned"):
         db.assign_asset(assign2)
+
+
+@pytest.fixture
+def pooled_db(db):
+    manager = Database_manager(
+        TEST_DB, pooled=True, journal_mode="WAL", synchronous="NORMAL"
+    )
+
+    yield manager
+
+    manager.close()
+
+
+def test_pooled_connection_is_reused(pooled_db):
+    pooled_db.add_assets(Asset(name="dell", category="laptop"))
+    pooled_db.add_employees(Employee(name="Bob", department="IT"))
+
+    assert len(pooled_db._pool) == 1
+    assert len(pooled_db.get_all_assets()) == 1
+    assert len(pooled_db.get_all_employees()) == 1
+
+
+def test_pooled_connection_applies_pragmas(pooled_db):
+    with pooled_db._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_pooled_connections_are_thread_local(pooled_db):
+    pooled_db.add_assets(Asset(name="dell", category="laptop"))
+
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(len(pooled_db.get_all_assets()))
+    )
+    worker.start()
+    worker.join()
+
+    assert results == [1]
+    assert len(pooled_db._pool) == 2
+
+
+def test_context_manager_closes_pool(db):
+    with Database_manager(TEST_DB, pooled=True) as manager:
+        manager.add_assets(Asset(name="dell", category="laptop"))
+        conn = manager._pooled_connection()
+
+    assert manager._pool == []
+
+    with pytest.raises(Exception):
+        conn.execute("SELECT 1")
+
+    assert len(manager.get_all_assets()) == 1
+    manager.close()
+
+
+def test_bulk_add_assets_reports_invalid_rows(db):
+    rows = [
+        {"name": "dell", "category": "laptop"},
+        {"name": "123", "category": "laptop"},
+        Asset(name="hp", category="laptop", status="maintenance"),
+        {"name": "lenovo"},
+        {"name": "asus", "category": "laptop"},
+    ]
+
+    result = db.bulk_add_assets(rows, chunk_size=2)
+
+    assert result.inserted == 3
+    assert [row for row, _ in result.errors] == [2, 4]
+    assert "cannot be just numbers" in result.errors[0][1]
+    assert "category" in result.errors[1][1]
+
+    assets = db.get_all_assets()
+    assert [a[1] for a in assets] == ["Dell", "Hp", "Asus"]
+    assert assets[1][3] == "MAINTENANCE"
+
+
+def test_assets_cannot_be_added_as_assigned(db):
+    rows = [
+        {"name": "dell", "category": "laptop", "status": "assigned"},
+        {"name": "hp", "category": "laptop", "status": "lost"},
+        {"name": "lg", "category": "monitor", "status": "retired"},
+    ]
+
+    result = db.bulk_add_assets(rows)
+
+    assert result.inserted == 1
+    assert [row for row, _ in result.errors] == [1, 2]
+    assert result.errors[0][1] == (
+        "Invalid Status: 'ASSIGNED'. New assets must be one of "
+        "['AVAILABLE', 'MAINTENANCE', 'RETIRED']; assign them to mark them ASSIGNED."
+    )
+    assert "Invalid Status: 'LOST'" in result.errors[1][1]
+
+    with pytest.raises(ValueError, match="New assets must be one of"):
+        db.add_assets(Asset(name="dell", category="laptop", status="assigned"))
+
+    with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+        db.bulk_add_assets(rows, chunk_size=0)
+    with pytest.raises(ValueError, match="Chunk size must be at least 1"):
+        db.bulk_assign([], chunk_size=-1)
+
+
+def test_bulk_add_assets_fills_derived_tables_per_chunk(db):
+    db.add_assets(Asset(name="hp", category="laptop"))
+    rows = [{"name": f"dell {i}", "category": "laptop"} for i in range(5)]
+    rows.append({"name": "lg", "category": "monitor", "status": "retired"})
+
+    assert db.bulk_add_assets(rows, chunk_size=2).inserted == 6
+    db.add_assets(Asset(name="asus", category="monitor"))
+
+    assert db.check_inventory_summary() == []
+    assert [a[0] for a in db.search_assets("dell")] == [2, 3, 4, 5, 6]
+    assert [c[2] for c in db.changes_since(0)] == list(range(1, 9))
+
+
+def test_bulk_add_employees_parses_csv_values(db):
+    rows = [
+        {"name": "bob", "department": "it", "is_active": "0"},
+        {"name": "al1ce", "department": "it"},
+    ]
+
+    result = db.bulk_add_employees(rows)
+
+    assert result.inserted == 1
+    assert result.errors[0][0] == 2
+    assert db.get_all_employees() == [(1, "Bob", "IT", 0)]
+
+
+def test_bulk_assign_validates_against_db_state(db):
+    db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(3)])
+    db.bulk_add_employees([{"name": "Bob", "department": "IT"}])
+
+    rows = [
+        {"asset_id": "1", "employee_id": "1", "assigned_date": "2025-01-01"},
+        {"asset_id": "1", "employee_id": "1"},
+        {"asset_id": "2", "employee_id": "9"},
+        {"asset_id": "x", "employee_id": "1"},
+        {"asset_id": 3, "employee_id": 1},
+    ]
+
+    result = db.bulk_assign(rows)
+
+    assert result.inserted == 2
+    assert [row for row, _ in result.errors] == [2, 3, 4]
+    assert "Only AVAILABLE assets can be assigned" in result.errors[0][1]
+    assert len(db.get_active_assignments()) == 2
+
+
+def test_page_assets_uses_keyset_pagination(db):
+    db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(5)])
+
+    first = db.page_assets(limit=2)
+    second = db.page_assets(after_id=first[-1][0], limit=2)
+    last = db.page_assets(after_id=second[-1][0], limit=2)
+
+    assert [a[0] for a in first + second + last] == [1, 2, 3, 4, 5]
+    assert db.page_assets(after_id=5) == []
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_page_and_batch_sizes_must_be_positive(db, size):
+    db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(3)])
+
+    with pytest.raises(ValueError, match="Limit must be at least 1"):
+        db.page_assets(limit=size)
+    with pytest.raises(ValueError, match="Limit must be at least 1"):
+        db.changes_since(0, limit=size)
+    with pytest.raises(ValueError, match="Batch size must be at least 1"):
+        db.iter_assets(batch_size=size)
+
+
+def test_iter_assets_filters_and_streams_in_batches(db):
+    rows = [{"name": f"Laptop {i}", "category": "Tech"} for i in range(7)]
+    rows += [{"name": "Desk", "category": "furniture", "status": "retired"}]
+    db.bulk_add_assets(rows)
+    db.update_asset_status(3, "MAINTENANCE")
+
+    available = list(db.iter_assets(batch_size=2, status="available"))
+
+    assert len(available) == 6
+    assert 3 not in [a[0] for a in available]
+    assert [a[1] for a in db.iter_assets(category=" furniture ")] == ["Desk"]
+
+
+def test_iter_employees_filters_by_department_and_active(db):
+    db.bulk_add_employees(
+        [
+            {"name": "Alice", "department": "it"},
+            {"name": "Bob", "department": "hr"},
+            {"name": "Carol", "department": "it"},
+        ]
+    )
+    db.offboard_employee(3)
+
+    assert [e[1] for e in db.iter_employees(batch_size=1, department="IT")] == [
+        "Alice",
+        "Carol",
+    ]
+    assert [e[1] for e in db.iter_employees(active=False)] == ["Carol"]
+
+
+def test_iter_active_assignments_filters_by_department(db):
+    db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(3)])
+    db.bulk_add_employees(
+        [{"name": "Alice", "department": "it"}, {"name": "Bob", "department": "hr"}]
+    )
+    db.bulk_assign(
+        [
+            {"asset_id": 1, "employee_id": 1},
+            {"asset_id": 2, "employee_id": 2},
+            {"asset_id": 3, "employee_id": 1},
+        ]
+    )
+    db.return_asset(1, "2025-02-01")
+
+    rows = list(db.iter_active_assignments(batch_size=1, department="it"))
+
+    assert [(r[1], r[2]) for r in rows] == [("Alice", "Laptop 2")]
+    assert len(list(db.iter_active_assignments())) == 2
+
+
+def test_return_unassigned_asset_fails_without_side_effects(db):
+    db.add_assets(Asset(name="Desk", category="Furniture"))
+    db.update_asset_status(1, "MAINTENANCE")
+
+    with pytest.raises(ValueError, match="not currently assigned"):
+        db.return_asset(1, "2025-01-01")
+
+    assert db.get_all_assets()[0][3] == "MAINTENANCE"
+
+    with pytest.raises(ValueError, match="does not exist"):
+        db.return_asset(99, "2025-01-01")
+
+
+def test_assign_to_inactive_employee_leaves_asset_available(db):
+    db.add_assets(Asset(name="Laptop", category="Tech"))
+    db.add_employees(Employee(name="Bob", department="IT"))
+    db.offboard_employee(1)
+
+    with pytest.raises(ValueError, match="offboarded/inactive"):
+        db.assign_asset(Assignment(asset_id=1, employee_id=1))
+
+    assert db.get_all_assets()[0][3] == "AVAILABLE"
+    assert db.get_active_assignments() == []
+
+
+def test_assign_return_cycle(db):
+    db.add_assets(Asset(name="Laptop", category="Tech"))
+    db.add_employees(Employee(name="Alice", department="IT"))
+    db.add_employees(Employee(name="Bob", department="IT"))
+
+    db.assign_asset(Assignment(asset_id=1, employee_id=1))
+    db.return_asset(1, "2025-01-02")
+    db.assign_asset(Assignment(asset_id=1, employee_id=2))
+
+    assert [row[0] for row in db.get_active_assignments()] == ["Bob"]
+    assert db.get_all_assets()[0][3] == "ASSIGNED"
+
+
+def test_named_rows_support_attributes_and_indexing(db):
+    db.add_assets(Asset(name="dell", category="laptop"))
+    db.add_employees(Employee(name="Bob", department="IT"))
+    db.assign_asset(Assignment(asset_id=1, employee_id=1, assigned_date="2025-01-01"))
+
+    named = Database_manager(TEST_DB, row_type="named")
+
+    asset = named.get_all_assets()[0]
+    assert asset.name == asset[1] == "Dell"
+    assert asset.status == "ASSIGNED"
+    assert named.get_all_employees()[0].department == "IT"
+    assert named.get_active_assignments()[0].employee == "Bob"
+    assert next(named.iter_active_assignments()).asset == "Dell"
+
+
+def test_model_rows_return_models(db):
+    db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(3)])
+    db.add_employees(Employee(name="Bob", department="IT"))
+
+    models = Database_manager(TEST_DB, row_type="model")
+
+    assets = list(models.iter_assets(batch_size=2))
+    assert assets[2] == Asset(name="Laptop 2", category="Tech", id=3)
+    assert models.page_employees()[0] == Employee(name="Bob", department="IT", id=1)
+
+
+def test_invalid_row_type_is_rejected():
+    with pytest.raises(ValueError, match="Invalid row type"):
+        Database_manager(TEST_DB, row_type="dict")
+
+
+@pytest.fixture
+def cached_db(db):
+    manager = Database_manager(TEST_DB, pooled=True, lookup_cache=16)
+
+    yield manager
+
+    manager.close()
+
+
+def test_cached_lookups_count_hits_and_misses(cached_db):
+    cached_db.add_assets(Asset(name="dell", category="laptop"))
+
+    assert cached_db.get_asset(1) == (1, "Dell", "Laptop", "AVAILABLE")
+    assert cached_db.get_asset(1) == (1, "Dell", "Laptop", "AVAILABLE")
+    assert cached_db.get_asset(2) is None
+
+    stats = cached_db.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 1)
+
+
+def test_writers_invalidate_cached_entries(cached_db):
+    cached_db.add_assets(Asset(name="dell", category="laptop"))
+    cached_db.add_employees(Employee(name="Bob", department="IT"))
+    cached_db.get_asset(1)
+    cached_db.get_employee(1)
+    assert cached_db.get_active_assignments() == []
+
+    cached_db.assign_asset(Assignment(asset_id=1, employee_id=1, assigned_date="2025-01-01"))
+    assert cached_db.get_asset(1)[3] == "ASSIGNED"
+    assert cached_db.get_active_assignments() == [("Bob", "Dell", "2025-01-01")]
+
+    cached_db.return_asset(1, "2025-01-02")
+    cached_db.offboard_employee(1)
+    assert cached_db.get_asset(1)[3] == "AVAILABLE"
+    assert cached_db.get_employee(1)[3] == 0
+    assert cached_db.get_active_assignments() == []
+
+
+def test_cache_rejects_from_cached_state(cached_db):
+    cached_db.add_assets(Asset(name="dell", category="laptop"))
+    cached_db.add_employees(Employee(name="Bob", department="IT"))
+    cached_db.offboard_employee(1)
+    cached_db.get_employee(1)
+
+    with pytest.raises(ValueError, match="offboarded/inactive"):
+        cached_db.assign_asset(Assignment(asset_id=1, employee_id=1))
+
+
+def test_cache_sees_writes_from_other_connections(cached_db):
+    cached_db.add_assets(Asset(name="dell", category="laptop"))
+    assert cached_db.get_asset(1)[3] == "AVAILABLE"
+
+    Database_manager(TEST_DB).update_asset_status(1, "RETIRED")
+
+    assert cached_db.get_asset(1)[3] == "RETIRED"
+
+
+def test_cache_survives_writes_from_its_own_threads(cached_db):
+    cached_db.add_assets(Asset(name="dell", category="laptop"))
+    cached_db.add_assets(Asset(name="hp", category="laptop"))
+    cached_db.add_employees(Employee(name="Bob", department="IT"))
+    cached_db.get_asset(2)
+    cached_db.get_employee(1)
+
+    def write() -> None:
+        cached_db.assign_asset(Assignment(asset_id=1, employee_id=1))
+        cached_db.bulk_add_assets([{"name": "lg", "category": "monitor"}])
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    thread.join()
+
+    assert cached_db.get_asset(1)[3] == "ASSIGNED"
+    assert cached_db.cache_stats()["size"] == 3
+
+    # a commit from outside the manager still clears everything
+    Database_manager(TEST_DB).update_asset_status(2, "RETIRED")
+    assert cached_db.get_employee(1)[3] == 1
+    assert cached_db.get_asset(2)[3] == "RETIRED"
+    assert cached_db.cache_stats()["size"] == 2
+
+
+def test_lookup_cache_requires_pooled_mode():
+    with pytest.raises(ValueError, match="requires pooled=True"):
+        Database_manager(TEST_DB, lookup_cache=10)
+
+
+def test_inventory_summary_tracks_writes(db):
+    db.bulk_add_assets(
+        [
+            {"name": "Dell", "category": "laptop"},
+            {"name": "Hp", "category": "laptop"},
+            {"name": "Lg", "category": "monitor"},
+        ]
+    )
+    db.bulk_add_employees(
+        [{"name": "Alice", "department": "it"}, {"name": "Bob", "department": "hr"}]
+    )
+    db.assign_asset(Assignment(asset_id=1, employee_id=1))
+    db.assign_asset(Assignment(asset_id=3, employee_id=2))
+    db.return_asset(3, "2025-02-01")
+    db.update_asset_status(2, "MAINTENANCE")
+
+    summary = db.get_inventory_summary()
+
+    assert summary["assets"] == {
+        "Laptop": {"ASSIGNED": 1, "MAINTENANCE": 1},
+        "Monitor": {"AVAILABLE": 1},
+    }
+    assert summary["assigned_by_department"] == {"IT": {"Laptop": 1}}
+    assert db.check_inventory_summary() == []
+
+
+def test_check_inventory_summary_rebuilds_drift(db):
+    db.add_assets(Asset(name="Dell", category="laptop"))
+
+    with db._connect() as conn:
+        conn.execute("UPDATE inventory_summary SET count=7")
+
+    assert db.check_inventory_summary() == [
+        ("inventory_summary", "Laptop", "AVAILABLE", 7, 1)
+    ]
+    assert len(db.check_inventory_summary(rebuild=True)) == 1
+    assert db.check_inventory_summary() == []
+    assert db.get_inventory_summary()["assets"] == {"Laptop": {"AVAILABLE": 1}}
+
+
+@pytest.fixture
+def history_db(db):
+    db.bulk_add_assets([{"name": "Dell", "category": "laptop"}, {"name": "Lg", "category": "monitor"}])
+    db.bulk_add_employees(
+        [{"name": "Alice", "department": "it"}, {"name": "Bob", "department": "hr"}]
+    )
+    db.assign_asset(Assignment(asset_id=1, employee_id=1, assigned_date="2025-01-01"))
+    db.return_asset(1, "2025-01-31")
+    db.assign_asset(Assignment(asset_id=1, employee_id=2, assigned_date="2025-03-01"))
+    db.return_asset(1, "2025-03-11")
+    db.assign_asset(Assignment(asset_id=2, employee_id=1, assigned_date="2025-02-15"))
+    return db
+
+
+def test_asset_history_filters_by_overlap(history_db):
+    assert [row[2] for row in history_db.asset_history(1)] == [1, 2]
+    assert [row[2] for row in history_db.asset_history(1, "2025-02-01", "2025-02-28")] == []
+    assert [row[2] for row in history_db.asset_history(1, "2025-01-31", "2025-03-01")] == [1, 2]
+
+
+def test_employee_history_includes_open_assignments(history_db):
+    rows = history_db.employee_history(1, start="2025-02-01")
+
+    assert [(row[1], row[4]) for row in rows] == [(2, None)]
+
+
+def test_iter_history_joins_names(history_db):
+    rows = list(history_db.iter_history(batch_size=1, end="2025-02-20"))
+
+    assert [(r[2], r[5], r[6]) for r in rows] == [
+        ("Dell", "Alice", "IT"),
+        ("Lg", "Alice", "IT"),
+    ]
+
+
+def test_utilization_clips_to_window(history_db):
+    rows = history_db.utilization("2025-01-01", "2025-04-01", category="laptop")
+
+    assert rows == [(1, "Dell", "Laptop", 2, 40, round(40 / 90, 4))]
+
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        history_db.utilization("2025/01/01", "2025-04-01")
+
+
+def test_return_date_must_be_valid(history_db):
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        history_db.return_asset(2, "yesterday")
+
+
+@pytest.fixture
+def staffed_db(db):
+    db.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(5)])
+    db.bulk_add_employees(
+        [
+            {"name": "Alice", "department": "IT"},
+            {"name": "Bob", "department": "HR"},
+            {"name": "Carol", "department": "IT"},
+        ]
+    )
+    db.bulk_assign(
+        [
+            {"asset_id": 1, "employee_id": 1, "assigned_date": "2025-01-01"},
+            {"asset_id": 2, "employee_id": 1, "assigned_date": "2025-01-01"},
+            {"asset_id": 3, "employee_id": 2, "assigned_date": "2025-01-01"},
+            {"asset_id": 4, "employee_id": 3, "assigned_date": "2025-01-01"},
+        ]
+    )
+    return db
+
+
+def test_offboard_employee_reclaims_assets(staffed_db):
+    result = staffed_db.offboard_employee(1, reclaim=True, return_date="2025-03-01")
+
+    assert result.offboarded == [1]
+    assert result.reclaimed == [(1, 1), (1, 2)]
+    assert [a[3] for a in staffed_db.get_all_assets()] == [
+        "AVAILABLE",
+        "AVAILABLE",
+        "ASSIGNED",
+        "ASSIGNED",
+        "AVAILABLE",
+    ]
+    assert [r[4] for r in staffed_db.employee_history(1)] == [
+        "2025-03-01",
+        "2025-03-01",
+    ]
+    assert staffed_db.check_inventory_summary() == []
+
+
+def test_offboard_employee_without_reclaim_keeps_assets(staffed_db):
+    result = staffed_db.offboard_employee(1)
+
+    assert result.reclaimed == []
+    assert staffed_db.get_employee(1)[3] == 0
+    assert staffed_db.get_asset(1)[3] == "ASSIGNED"
+
+    with pytest.raises(ValueError, match="Employee ID 9 not found"):
+        staffed_db.offboard_employee(9, reclaim=True)
+
+
+def test_bulk_offboard_reports_missing_and_sets_status(staffed_db):
+    result = staffed_db.bulk_offboard([2, 3, 3, 9], reclaim_status="MAINTENANCE")
+
+    assert result.offboarded == [2, 3]
+    assert result.reclaimed == [(2, 3), (3, 4)]
+    assert result.missing == [9]
+    assert staffed_db.get_asset(3)[3] == "MAINTENANCE"
+    assert staffed_db.get_asset(4)[3] == "MAINTENANCE"
+    assert len(staffed_db.get_active_assignments()) == 2
+    assert staffed_db.check_inventory_summary() == []
+
+
+def test_bulk_offboard_rejects_invalid_status_without_side_effects(staffed_db):
+    with pytest.raises(ValueError, match="Invalid Status"):
+        staffed_db.bulk_offboard([1], reclaim_status="RETIRED")
+
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        staffed_db.bulk_offboard([1], return_date="yesterday")
+
+    assert staffed_db.get_employee(1)[3] == 1
+    assert len(staffed_db.get_active_assignments()) == 4
+
+
+def test_bulk_offboard_invalidates_cache(cached_db, staffed_db):
+    assert cached_db.get_asset(1)[3] == "ASSIGNED"
+    assert len(cached_db.get_active_assignments()) == 4
+
+    cached_db.bulk_offboard([1])
+
+    assert cached_db.get_asset(1)[3] == "AVAILABLE"
+    assert cached_db.get_employee(1)[3] == 0
+    assert len(cached_db.get_active_assignments()) == 2
+
+
+def test_search_assets_ranks_prefix_matches(db):
+    db.bulk_add_assets(
+        [
+            {"name": "Dell Latitude 5440", "category": "Laptop"},
+            {"name": "Dell Ultrasharp", "category": "Monitor"},
+            {"name": "Latte Machine", "category": "Dell"},
+            {"name": "Lenovo Thinkpad", "category": "Laptop"},
+        ]
+    )
+
+    assert [a[0] for a in db.search_assets("dell lat")] == [1, 3]
+    # a name hit outranks a category hit; shorter names rank first
+    assert [a[0] for a in db.search_assets("dell")] == [2, 1, 3]
+    assert [a[0] for a in db.search_assets("5440")] == [1]
+    assert db.search_assets("dell", limit=1) == [(2, "Dell Ultrasharp", "Monitor", "AVAILABLE")]
+    assert db.search_assets('"think* (') == [
+        (4, "Lenovo Thinkpad", "Laptop", "AVAILABLE")
+    ]
+
+    with pytest.raises(ValueError, match="letters or digits"):
+        db.search_assets(" * ")
+
+
+def test_search_ranks_every_match(db):
+    db.bulk_add_assets(
+        {"name": f"Dell Latitude {i}", "category": "Laptop"} for i in range(1500)
+    )
+    db.add_assets(Asset(name="dell", category="laptop"))
+    db.update_asset_status(1501, "RETIRED")
+
+    assert db.search_assets("dell", limit=1)[0][0] == 1501
+    assert db.search_assets("dell", limit=1, status="retired")[0][0] == 1501
+    assert [a[0] for a in db.search_assets("dell", limit=3, status="available")] == [1, 2, 3]
+
+    for limit in (0, -1):
+        with pytest.raises(ValueError, match="Limit must be at least 1"):
+            db.search_assets("dell", limit=limit)
+
+
+def test_search_filters_and_follows_writes(db):
+    db.add_assets(Asset(name="Dell Latitude", category="Laptop"))
+    db.add_assets(Asset(name="Dell Xps", category="Laptop"))
+    db.add_employees(Employee(name="Alice Patel", department="IT"))
+    db.add_employees(Employee(name="Alicia Keys", department="HR"))
+    db.update_asset_status(2, "RETIRED")
+    db.offboard_employee(2)
+
+    assert [a[0] for a in db.search_assets("dell", status="retired")] == [2]
+    assert [e[0] for e in db.search_employees("ali")] == [1, 2]
+    assert [e[0] for e in db.search_employees("ali", active=True)] == [1]
+    assert [e[0] for e in db.search_employees("it")] == [1]
+
+
+def test_every_writer_appends_to_the_change_log(db):
+    db.add_assets(Asset(name="dell", category="laptop"))
+    db.add_employees(Employee(name="bob", department="it"))
+    db.assign_asset(Assignment(asset_id=1, employee_id=1, assigned_date="2025-01-02"))
+    db.return_asset(1, "2025-02-01")
+    db.update_asset_status(1, "RETIRED")
+    db.update_asset_status(1, "RETIRED")
+    db.offboard_employee(1)
+
+    changes = [(c[1], c[2], c[3]) for c in db.changes_since(0)]
+
+    assert changes == [
+        ("assets", 1, "insert"),
+        ("employees", 1, "insert"),
+        ("assets", 1, "update"),
+        ("assignments", 1, "insert"),
+        ("assignments", 1, "update"),
+        ("assets", 1, "update"),
+        ("assets", 1, "update"),
+        ("employees", 1, "update"),
+    ]
+    assert [c[0] for c in db.changes_since(0)] == list(range(1, 9))
+    assert db.last_change_seq() == 8
+    # the logged row is the state after the change
+    assert db.changes_since(4, limit=1)[0][4] == (
+        '{"id":1,"asset_id":1,"employee_id":1,'
+        '"assigned_date":"2025-01-02","return_date":"2025-02-01"}'
+    )
+
+
+def test_changes_since_pages_and_covers_bulk_imports(staffed_db):
+    logged = staffed_db.changes_since(0, limit=1000, table="assets")
+    inserts = [c[2] for c in logged if c[3] == "insert"]
+
+    assert inserts == [1, 2, 3, 4, 5]
+    assert [c[2] for c in staffed_db.changes_since(0, table="employees")] == [1, 2, 3]
+
+    seq, seen = 0, []
+    while page := staffed_db.changes_since(seq, limit=4):
+        seen += page
+        seq = page[-1][0]
+    assert seen == staffed_db.changes_since(0, limit=1000)
+
+    with pytest.raises(ValueError, match="Unknown table"):
+        staffed_db.changes_since(0, table="changes")
+
+
+def test_asset_stats_follow_every_write_path(history_db):
+    history_db.bulk_assign([{"asset_id": 1, "employee_id": 1, "assigned_date": "2025-04-01"}])
+    history_db.return_asset(2, "2025-02-25")
+    history_db.update_asset_status(2, "RETIRED")
+    assert history_db.check_inventory_summary() == []
+
+    with history_db._write_transaction() as cursor:
+        # a corrected date, a late-entered closed record, a deleted row
+        cursor.execute("UPDATE assignments SET assigned_date='2025-01-21' WHERE id=1")
+        cursor.execute(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(2,2,'2024-01-01','2024-01-31')"
+        )
+        cursor.execute("DELETE FROM assignments WHERE id=2")
+
+    assert history_db.check_inventory_summary() == []
+
+    with history_db._write_transaction() as cursor:
+        cursor.execute("UPDATE asset_stats SET assignments=9 WHERE asset_id=2")
+
+    mismatch = history_db.check_inventory_summary(rebuild=True)
+    assert [row[:2] for row in mismatch] == [("asset_stats", 2)]
+    assert history_db.check_inventory_summary() == []
+
+
+def test_idle_assets_and_top_utilized(history_db, monkeypatch):
+    monkeypatch.setattr("src.database.get_today", lambda: "2025-04-10")
+    history_db.add_assets(Asset(name="hp", category="laptop"))
+
+    assert history_db.idle_assets(30) == [
+        (3, "Hp", "Laptop", "AVAILABLE", None, None),
+        (1, "Dell", "Laptop", "AVAILABLE", "2025-03-11", 30),
+    ]
+    assert history_db.idle_assets(31) == [(3, "Hp", "Laptop", "AVAILABLE", None, None)]
+    assert history_db.idle_assets(0, status="assigned") == []
+
+    # Lg has been out since 2025-02-15: 54 running days beat Dell's 40 closed
+    assert history_db.top_utilized(2) == [
+        (2, "Lg", "Monitor", 1, 54),
+        (1, "Dell", "Laptop", 2, 40),
+    ]
+    assert history_db.top_utilized(1) == [(2, "Lg", "Monitor", 1, 54)]
+
+    with pytest.raises(ValueError, match="at least 1"):
+        history_db.top_utilized(0)
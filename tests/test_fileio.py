@@ -0,0 +1,39 @@
+import io
+
+import pytest
+from src.fileio import detect_format, read_records, write_records
+
+
+def test_detect_format_from_extension():
+    assert detect_format("assets.csv") == "csv"
+    assert detect_format("assets.ndjson") == "jsonl"
+    assert detect_format("assets.txt", "csv") == "csv"
+
+    with pytest.raises(ValueError, match="Unsupported format"):
+        detect_format("assets.xlsx")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_written_records_read_back(tmp_path, fmt):
+    path = tmp_path / f"rows.{fmt}"
+    rows = [(1, "Dell", "Laptop"), (2, "Lg", "Monitor")]
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        assert write_records(iter(rows), f, fmt, ("id", "name", "category")) == 2
+
+    records = list(read_records(str(path)))
+
+    assert [r["name"] for r in records] == ["Dell", "Lg"]
+    assert str(records[1]["id"]) == "2"
+
+
+def test_jsonl_skips_blank_lines(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"name": "Dell"}\n\n{"name": "Lg"}\n')
+
+    assert [r["name"] for r in read_records(str(path))] == ["Dell", "Lg"]
+
+
+def test_write_rejects_unknown_format():
+    with pytest.raises(ValueError, match="Unsupported format"):
+        write_records([], io.StringIO(), "xml", ("id",))
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+from src.database import Database_manager, setup_database
+from src.models import Assignment
+
+
+@pytest.fixture
+def db(tmp_path):
+    name = str(tmp_path / "group.db")
+    setup_database(name)
+
+    with Database_manager(name, pooled=True, lookup_cache=16) as manager:
+        manager.bulk_add_assets([{"name": f"Laptop {i}", "category": "Tech"} for i in range(3)])
+        manager.bulk_add_employees(
+            [{"name": "Alice", "department": "IT"}, {"name": "Bob", "department": "IT"}]
+        )
+        yield manager
+
+
+def test_ops_share_one_transaction_and_see_each_other(db):
+    with db.group_commit(max_ops=10, max_delay_ms=1000) as committer:
+        first = committer.submit_assign(Assignment(asset_id=1, employee_id=1))
+        second = committer.submit_assign(Assignment(asset_id=1, employee_id=2))
+        returned = committer.submit_return(1, "2025-01-02")
+        third = committer.submit_assign(Assignment(asset_id=1, employee_id=2))
+        committer.flush()
+
+    assert first.result() is None
+    with pytest.raises(ValueError, match="Only AVAILABLE assets can be assigned"):
+        second.result()
+    assert returned.result() is None
+    assert third.result() is None
+    assert committer.batches == 1
+    assert [row[0] for row in db.get_active_assignments()] == ["Bob"]
+
+
+def test_batches_split_at_max_ops(db):
+    with db.group_commit(max_ops=2, max_delay_ms=1000) as committer:
+        futures = [
+            committer.submit_assign(Assignment(asset_id=i, employee_id=1))
+            for i in (1, 2, 3)
+        ]
+        committer.flush()
+
+    assert [f.result() for f in futures] == [None, None, None]
+    assert committer.batches == 2
+
+
+def test_deadline_flushes_partial_batch(db):
+    with db.group_commit(max_ops=100, max_delay_ms=5) as committer:
+        future = committer.submit_return(3, "2025-01-01")
+
+        with pytest.raises(ValueError, match="not currently assigned"):
+            future.result(timeout=2)
+
+
+def test_flush_does_not_outlive_its_batch(db):
+    with db.group_commit(max_ops=10, max_delay_ms=500) as committer:
+        committer.flush()
+        first = committer.submit_assign(Assignment(asset_id=1, employee_id=1))
+        time.sleep(0.05)
+        second = committer.submit_assign(Assignment(asset_id=2, employee_id=1))
+        committer.flush()
+
+    assert first.result() is None and second.result() is None
+    assert committer.batches == 1
+
+
+def test_leftover_ops_keep_their_own_deadline(db):
+    with db.group_commit(max_ops=2, max_delay_ms=800) as committer:
+        commit = committer._commit
+
+        def slow_commit(batch):
+            if committer.batches < 2:
+                time.sleep(0.5)
+            commit(batch)
+
+        committer._commit = slow_commit
+        start = time.monotonic()
+        futures = [
+            committer.submit_assign(Assignment(asset_id=i, employee_id=1)) for i in (1, 2, 3)
+        ]
+        futures += [committer.submit_return(i, "2025-01-02") for i in (1, 2)]
+
+        # the last return waits out two slow batches. It was queued at the
+        # start, so it is due at 0.8s, not 0.8s after the second batch was
+        # taken at 0.5s, and goes as soon as that batch commits at 1.0s
+        futures[-1].result(timeout=5)
+        assert time.monotonic() - start < 1.15
+
+    assert committer.batches == 3
+
+
+def test_submit_after_close_fails(db):
+    committer = db.group_commit()
+    committer.close()
+
+    with pytest.raises(ValueError, match="closed"):
+        committer.submit_return(1, "2025-01-01")
@@ -0,0 +1,134 @@
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+from src.database import setup_database
+from src.http_api import MAX_BODY, ApiServer
+
+
+@pytest.fixture
+def api(tmp_path):
+    db_name = str(tmp_path / "api.db")
+    setup_database(db_name)
+    server = ApiServer(db_name, port=0, readers=2)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+
+    def request(method: str, path: str, body: dict | str | None = None) -> tuple:
+        if isinstance(body, dict):
+            body = json.dumps(body)
+        conn.request(method, path, body=body)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read()), response
+
+    request.address = server.server_address[:2]
+    yield request
+
+    conn.close()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_create_assign_and_return_over_one_connection(api):
+    assert api("POST", "/assets", {"name": "dell", "category": "laptop"})[:2] == (201, {"id": 1})
+    assert api("POST", "/employees", {"name": "bob", "department": "it"})[:2] == (201, {"id": 1})
+
+    assignment = {"asset_id": 1, "employee_id": 1, "assigned_date": "2025-01-02"}
+    assert api("POST", "/assignments", assignment)[:2] == (201, assignment)
+
+    status, body, _ = api("GET", "/assignments")
+    assert status == 200
+    assert body == {
+        "items": [{"id": 1, "employee": "Bob", "asset": "Dell", "assigned_date": "2025-01-02"}],
+        "next_after_id": 1,
+    }
+
+    status, body, _ = api("POST", "/assignments", {"asset_id": 1, "employee_id": 1})
+    assert status == 400
+    assert "Only AVAILABLE assets can be assigned" in body["error"]
+
+    assert api("POST", "/assets/1/return", {"return_date": "2025-02-01"})[0] == 200
+    assert api("GET", "/assets/1")[1] == {
+        "id": 1,
+        "name": "Dell",
+        "category": "Laptop",
+        "status": "AVAILABLE",
+    }
+
+
+def test_list_filters_and_pages(api):
+    for name in ("dell", "lenovo", "mac"):
+        api("POST", "/assets", {"name": name, "category": "laptop"})
+    api("POST", "/assets/2/status", {"status": "retired"})
+
+    _, body, _ = api("GET", "/assets?limit=1&after_id=1")
+    assert [a["id"] for a in body["items"]] == [2]
+    assert body["next_after_id"] == 2
+
+    _, body, _ = api("GET", "/assets?status=available")
+    assert [a["name"] for a in body["items"]] == ["Dell", "Mac"]
+
+    _, body, _ = api("GET", "/search/assets?q=len")
+    assert [a["id"] for a in body["items"]] == [2]
+
+
+def test_errors_map_to_status_codes(api):
+    assert api("GET", "/assets/7")[:2] == (404, {"error": "Asset ID 7 not found."})
+    assert api("GET", "/nope")[0] == 404
+    assert api("POST", "/summary")[0] == 405
+    assert api("GET", "/assets?limit=ten")[:2] == (400, {"error": "limit must be an integer."})
+    assert api("POST", "/assets", "{not json")[:2] == (400, {"error": "Request body must be JSON."})
+    assert api("POST", "/assets", {"name": "dell"})[:2] == (400, {"error": "Missing field: 'category'."})
+    assert api("POST", "/employees", {"name": "bob", "department": ""})[0] == 400
+
+
+def test_offboard_reclaim_must_be_a_boolean(api):
+    api("POST", "/assets", {"name": "dell", "category": "laptop"})
+    api("POST", "/employees", {"name": "bob", "department": "it"})
+    api("POST", "/assignments", {"asset_id": 1, "employee_id": 1})
+
+    status, body, _ = api("POST", "/employees/1/offboard", {"reclaim": "false"})
+    assert (status, body) == (400, {"error": "reclaim must be true or false."})
+    assert api("GET", "/employees/1")[1]["is_active"] == 1
+
+    assert api("POST", "/employees/1/offboard", {"reclaim": False})[1] == {"reclaimed": []}
+    assert api("GET", "/assets/1")[1]["status"] == "ASSIGNED"
+
+
+def test_oversized_body_closes_the_connection(api):
+    with socket.create_connection(api.address, timeout=5) as sock:
+        sock.sendall(
+            f"POST /assets HTTP/1.1\r\nHost: x\r\nContent-Length: {MAX_BODY + 1}\r\n\r\n".encode()
+        )
+        sock.sendall(b"x" * 1024)
+        response = b""
+        while chunk := sock.recv(65536):
+            response += chunk
+
+    # recv() only runs dry because the server closed its end
+    assert response.split(b" ")[1] == b"413"
+    assert b"Connection: close" in response
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/assets?limit=-1", "/employees?limit=0", "/changes?limit=-1", "/search/assets?q=a&limit=-1"],
+)
+def test_limits_below_one_are_rejected(api, path):
+    api("POST", "/assets", {"name": "dell", "category": "laptop"})
+
+    assert api("GET", path)[:2] == (400, {"error": "limit must be at least 1."})
+
+
+def test_responses_carry_timing_headers(api):
+    _, _, response = api("GET", "/summary")
+
+    timings = dict(
+        part.strip().split(";dur=") for part in response.getheader("Server-Timing").split(",")
+    )
+    assert set(timings) == {"queue", "db", "total"}
+    assert float(timings["total"]) >= float(timings["db"]) >= 0
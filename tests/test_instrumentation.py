@@ -0,0 +1,84 @@
+import json
+import logging
+
+import pytest
+from src.database import Database_manager, setup_database
+from src.instrumentation import Instrumentation, normalize_sql
+from src.models import Asset, Assignment, Employee
+
+
+@pytest.fixture
+def metrics():
+    return Instrumentation(slow_query_ms=None)
+
+
+@pytest.fixture
+def db(tmp_path, metrics):
+    name = str(tmp_path / "metrics.db")
+    setup_database(name)
+
+    with Database_manager(name, pooled=True, instrumentation=metrics) as manager:
+        yield manager
+
+
+def test_methods_record_latency_and_rows(db, metrics):
+    db.add_assets(Asset(name="dell", category="laptop"))
+    db.add_assets(Asset(name="hp", category="laptop"))
+    db.get_all_assets()
+    assert len(list(db.iter_assets(batch_size=1))) == 2
+
+    data = metrics.snapshot()["methods"]
+
+    assert data["add_assets"]["count"] == 2
+    assert data["get_all_assets"]["rows"] == 2
+    assert data["iter_assets"]["rows"] == 2
+    assert data["page_assets"]["count"] == 3
+    assert data["connect"]["count"] == 1
+
+
+def test_failed_calls_are_still_timed(db, metrics):
+    with pytest.raises(ValueError):
+        db.assign_asset(Assignment(asset_id=1, employee_id=1))
+
+    assert metrics.snapshot()["methods"]["assign_asset"]["count"] == 1
+
+
+def test_statements_record_rows_fetched(db, metrics):
+    db.bulk_add_employees([{"name": "Bob", "department": "IT"}] * 3)
+    db.get_all_employees()
+
+    statements = metrics.snapshot()["statements"]
+
+    assert statements["SELECT * FROM employees"]["rows"] == 3
+    assert statements["BEGIN IMMEDIATE"]["count"] == 1
+    assert any(key.startswith("INSERT INTO employees") for key in statements)
+
+
+def test_slow_statements_are_logged_with_plan(db, caplog):
+    metrics = Instrumentation(slow_query_ms=0)
+    slow_db = Database_manager(db.db_name, instrumentation=metrics)
+
+    with caplog.at_level(logging.WARNING, logger="asset_tracker.slow_query"):
+        slow_db.page_assets(status="AVAILABLE")
+
+    assert "USING INDEX idx_assets_status" in caplog.text
+
+
+def test_exports_json_and_prometheus(db, metrics, tmp_path):
+    db.add_employees(Employee(name="Bob", department="IT"))
+
+    json_path = tmp_path / "metrics.json"
+    prom_path = tmp_path / "metrics.prom"
+    metrics.export(str(json_path))
+    metrics.export(str(prom_path))
+
+    assert json.loads(json_path.read_text())["methods"]["add_employees"]["count"] == 1
+
+    text = prom_path.read_text()
+    assert "# TYPE asset_tracker_method_duration_seconds histogram" in text
+    assert 'asset_tracker_method_duration_seconds_count{method="add_employees"} 1' in text
+    assert 'le="+Inf"' in text
+
+
+def test_normalize_sql_collapses_whitespace():
+    assert normalize_sql("SELECT *\n   FROM  assets ") == "SELECT * FROM assets"
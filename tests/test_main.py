@@ -0,0 +1,189 @@
+import io
+import json
+
+import pytest
+import main as cli
+
+
+@pytest.fixture
+def run(tmp_path, capsys):
+    db_name = str(tmp_path / "cli.db")
+
+    def run(*argv: str, stdin: str | None = None) -> tuple[int, str, str]:
+        if stdin is not None:
+            argv = (*argv, "-")
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("sys.stdin", io.StringIO(stdin or ""))
+            code = cli.main(["--db", db_name, *argv])
+        out, err = capsys.readouterr()
+        return code, out, err
+
+    return run
+
+
+def test_add_commands_print_new_ids(run):
+    assert run("add-asset", "dell latitude", "laptop") == (0, "1\n", "")
+    assert run("add-asset", "lg ultrafine", "monitor")[1] == "2\n"
+    assert run("add-employee", "bob", "it")[1] == "1\n"
+
+
+def test_assign_return_and_errors_use_exit_codes(run):
+    run("add-asset", "dell", "laptop")
+    run("add-employee", "bob", "it")
+
+    assert run("assign", "1", "1", "--date", "2025-01-02")[0] == 0
+
+    code, _, err = run("assign", "1", "1")
+    assert code == 1
+    assert "Only AVAILABLE assets can be assigned" in err
+
+    assert run("return", "1", "--date", "2025-02-01")[0] == 0
+    assert run("set-status", "1", "retired")[0] == 0
+
+    code, out, _ = run("list-assets", "--format", "jsonl")
+    assert json.loads(out) == {
+        "id": 1,
+        "name": "Dell",
+        "category": "Laptop",
+        "status": "RETIRED",
+    }
+
+
+@pytest.mark.parametrize(
+    "fmt, expected",
+    [
+        ("csv", "id,name,department,is_active\r\n2,Carol,IT,1\r\n"),
+        ("json", '[\n{"id": 2, "name": "Carol", "department": "IT", "is_active": 1}\n]\n'),
+    ],
+)
+def test_list_employees_filters_and_formats(run, fmt, expected):
+    run("add-employee", "bob", "hr")
+    run("add-employee", "carol", "it")
+
+    assert run("list-employees", "--department", "it", "--active", "--format", fmt)[1] == expected
+
+
+def test_list_assignments_table(run):
+    run("add-asset", "dell", "laptop")
+    run("add-employee", "bob", "it")
+    run("assign", "1", "1", "--date", "2025-01-02")
+
+    lines = run("list-assignments")[1].splitlines()
+
+    assert lines[0] == cli.ASSIGNMENT_HEADER
+    assert lines[2].split(" | ") == ["Bob".ljust(20), "Dell".ljust(20), "2025-01-02".ljust(12)]
+
+
+def test_batch_runs_commands_in_one_process(run):
+    script = """
+# set up and move one laptop
+add-asset "Dell Latitude" Laptop
+add-employee Bob IT
+assign 1 1 --date 2025-01-02
+assign 1 1
+bogus
+list-assets --status assigned --format csv
+"""
+    code, out, err = run("batch", stdin=script)
+
+    assert code == 2
+    assert out.splitlines() == [
+        "1",
+        "1",
+        "id,name,category,status",
+        "1,Dell Latitude,Laptop,ASSIGNED",
+    ]
+    assert "Line 6: failed with exit code 1" in err
+    assert "Line 7: failed with exit code 2" in err
+    assert "Ran 6 commands, 2 failed" in err
+
+
+def test_batch_reports_sqlite_errors_and_rejects_serve(run, monkeypatch):
+    def locked(db, args):
+        raise cli.sql.OperationalError("database is locked")
+
+    monkeypatch.setattr(cli, "handle_search_command", locked)
+    script = "search assets dell\nserve --port 0\nbatch -\nadd-asset dell laptop\n"
+
+    code, out, err = run("batch", stdin=script)
+
+    assert code == 2
+    assert out == "1\n"
+    assert "ERROR: database is locked" in err
+    assert "ERROR: 'serve' cannot run inside a batch" in err
+    assert "ERROR: 'batch' cannot run inside a batch" in err
+    assert "Ran 4 commands, 3 failed" in err
+
+
+def test_batch_can_stop_on_first_error(run):
+    code, out, err = run("batch", "--stop-on-error", stdin="return 9\nadd-asset dell laptop\n")
+
+    assert code == 2
+    assert out == ""
+    assert "Ran 1 commands, 1 failed" in err
+
+
+def test_tail_streams_changes_and_reports_last_seq(run):
+    run("add-asset", "dell", "laptop")
+    run("add-employee", "bob", "it")
+    run("assign", "1", "1", "--date", "2025-01-02")
+
+    code, out, err = run("tail", "--since", "1", "--format", "jsonl", "--limit", "1")
+
+    assert code == 0
+    assert [(c["seq"], c["table_name"], c["op"]) for c in map(json.loads, out.splitlines())] == [
+        (2, "employees", "insert"),
+        (3, "assets", "update"),
+        (4, "assignments", "insert"),
+    ]
+    assert json.loads(out.splitlines()[0])["data"] == {
+        "id": 1,
+        "name": "Bob",
+        "department": "IT",
+        "is_active": 1,
+    }
+    assert "Last seq: 4" in err
+    assert run("tail", "--since", "4")[2] == "Last seq: 4\n"
+
+
+def test_import_reports_rejected_rows_and_checks_chunk_size(run, tmp_path, capsys):
+    path = tmp_path / "assets.csv"
+    path.write_text("name,category,status\ndell,laptop,\nhp,laptop,assigned\n")
+
+    code, out, err = run("import", "assets", str(path))
+
+    assert code == 2
+    assert out == "Imported 1 assets, 1 rejected\n"
+    assert err.startswith("Row 2: Invalid Status: 'ASSIGNED'.")
+
+    with pytest.raises(SystemExit) as exit_info:
+        run("import", "assets", str(path), "--chunk-size", "0")
+    assert exit_info.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("limit", ["0", "-5"])
+def test_tail_rejects_limits_below_one(run, capsys, limit):
+    with pytest.raises(SystemExit) as exit_info:
+        run("tail", "--limit", limit)
+
+    assert exit_info.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
+
+
+def test_backup_and_restore_commands_report_phase_timings(run, tmp_path):
+    dest = str(tmp_path / "copy.db")
+    run("add-asset", "dell", "laptop")
+
+    code, _, err = run("backup", dest)
+    assert code == 0
+    assert f"{dest}: steps=" in err
+    assert "copy" in err and "verify" in err
+
+    run("add-asset", "lg", "monitor")
+    assert run("restore", dest)[0] == 0
+    assert run("list-assets", "--format", "csv")[1].splitlines()[1:] == ["1,Dell,Laptop,AVAILABLE"]
+
+    code, _, err = run("restore", str(tmp_path / "nope.db"))
+    assert code == 1
+    assert "Backup file not found" in err
@@ -0,0 +1,168 @@
+import os
+import sqlite3 as sql
+import threading
+from contextlib import closing
+from datetime import date
+
+import pytest
+from src.database import Database_manager, setup_database
+from src.maintenance import backup, compact, restore, snapshot
+from src.models import Asset
+
+
+@pytest.fixture
+def db_name(tmp_path):
+    name = str(tmp_path / "live.db")
+    setup_database(name)
+    with Database_manager(name) as db:
+        db.bulk_add_assets({"name": f"Laptop {i}", "category": "Tech"} for i in range(200))
+        db.bulk_add_employees([{"name": "Alice", "department": "IT"}])
+    return name
+
+
+def count(path: str, table: str = "assets") -> int:
+    with closing(sql.connect(path)) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_backup_copies_in_steps_and_records_phases(db_name, tmp_path):
+    dest = str(tmp_path / "backup.db")
+
+    report = backup(db_name, dest, pages=2, delay=0)
+
+    assert count(dest) == 200
+    assert not os.path.exists(f"{dest}.partial")
+    assert report.stats["steps"] > 1
+    assert set(report.timings) == {"copy", "verify", "publish"}
+
+
+def test_backup_finishes_while_another_connection_writes(db_name, tmp_path):
+    dest = str(tmp_path / "backup.db")
+    stop = threading.Event()
+
+    def writer() -> None:
+        with Database_manager(db_name) as db:
+            while not stop.is_set():
+                db.add_assets(Asset(name="dell", category="laptop"))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        report = backup(db_name, dest, pages=1, delay=0.001, restarts=2)
+    finally:
+        stop.set()
+        thread.join()
+
+    # each restart gives up on the stepped copy; the last pass is one step
+    assert report.stats["restarts"] <= 2
+    assert 200 <= count(dest) <= count(db_name)
+
+
+def test_snapshot_keeps_the_newest(db_name, tmp_path):
+    directory = str(tmp_path / "snaps")
+
+    reports = [snapshot(db_name, directory, keep=2) for _ in range(3)]
+
+    assert sorted(os.listdir(directory)) == sorted(
+        os.path.basename(r.path) for r in reports[1:]
+    )
+    assert reports[-1].stats["pruned"] == 1
+    assert count(reports[-1].path) == 200
+
+    with pytest.raises(ValueError, match="at least one snapshot"):
+        snapshot(db_name, directory, keep=0)
+    assert len(os.listdir(directory)) == 2
+
+
+def test_restore_replaces_contents(db_name, tmp_path):
+    dest = str(tmp_path / "backup.db")
+    backup(db_name, dest)
+    with Database_manager(db_name) as db:
+        db.add_assets(Asset(name="dell", category="laptop"))
+
+    report = restore(db_name, dest)
+
+    assert count(db_name) == 200
+    assert set(report.timings) == {"verify", "copy", "migrate"}
+
+    with pytest.raises(ValueError, match="not found"):
+        restore(db_name, str(tmp_path / "missing.db"))
+
+
+def test_compact_archives_old_closed_assignments(db_name, tmp_path):
+    archive = str(tmp_path / "archive.db")
+    with closing(sql.connect(db_name)) as conn:
+        conn.executemany(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(?,?,?,?)",
+            [
+                (1, 1, "2019-01-01", "2019-06-01"),
+                (2, 1, "2020-01-01", "2023-06-30"),
+                (3, 1, "2023-01-01", "2023-07-02"),
+            ],
+        )
+        conn.commit()
+    with Database_manager(db_name) as db:
+        db.bulk_assign([{"asset_id": 4, "employee_id": 1, "assigned_date": "2018-01-01"}])
+
+    report = compact(db_name, archive, years=2, today=date(2025, 7, 1), chunk_size=1)
+
+    assert report.stats["archived"] == 2
+    with closing(sql.connect(db_name)) as conn:
+        assert [r[0] for r in conn.execute("SELECT asset_id FROM assignments ORDER BY id")] == [3, 4]
+    assert count(archive, "assignments") == 2
+    assert set(report.timings) == {"archive", "vacuum"}
+
+    # nothing left to move, and the archive holds no duplicates
+    assert compact(db_name, archive, years=2, today=date(2025, 7, 1)).stats["archived"] == 0
+    assert count(archive, "assignments") == 2
+
+
+def test_compact_logs_archive_not_delete_and_trims_old_changes(db_name, tmp_path):
+    archive = str(tmp_path / "archive.db")
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute("UPDATE changes SET changed_at = '2020-01-01T00:00:00.000Z' WHERE seq <= 150")
+        conn.executemany(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(?,?,?,?)",
+            [(1, 1, "2019-01-01", "2019-06-01"), (2, 1, "2024-01-01", "2024-06-01")],
+        )
+        conn.commit()
+
+    report = compact(db_name, archive, years=2, today=date(2025, 7, 1), chunk_size=40)
+
+    assert report.stats["changes_archived"] == 150
+    assert count(archive, "changes") == 150
+    with Database_manager(db_name) as db:
+        ops = [(c[1], c[3]) for c in db.changes_since(0, limit=1000)]
+        assert ("assignments", "delete") not in ops
+        assert ops[-1] == ("assignments", "archive")
+        assert db.changes_since(0, limit=1)[0][0] == 151
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute("DELETE FROM assignments")
+        conn.commit()
+        assert conn.execute("SELECT op FROM changes ORDER BY seq DESC LIMIT 1").fetchone() == ("delete",)
+
+
+def test_compact_keeps_utilization_stats(db_name, tmp_path, monkeypatch):
+    monkeypatch.setattr("src.database.get_today", lambda: "2025-07-01")
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(1,1,'2020-01-01','2021-12-31')"
+        )
+        conn.commit()
+
+    def stats(db: Database_manager) -> tuple:
+        idle = [row for row in db.idle_assets(1000) if row[0] == 1]
+        return db.top_utilized(1), idle
+
+    with Database_manager(db_name) as db:
+        before = stats(db)
+        assert before[0][0][3:] == (1, 730)
+        assert before[1][0][4:] == ("2021-12-31", 1278)
+
+    report = compact(db_name, str(tmp_path / "archive.db"), years=2, today=date(2025, 7, 1))
+
+    assert report.stats["archived"] == 1
+    with Database_manager(db_name) as db:
+        assert stats(db) == before
+        assert db.check_inventory_summary() == []
@@ -0,0 +1,240 @@
+import sqlite3 as sql
+from contextlib import closing
+from datetime import date
+
+import pytest
+from src.database import setup_database
+from src.migrations import SCHEMA_VERSION, get_version
+
+
+@pytest.fixture
+def conn(tmp_path):
+    db_name = str(tmp_path / "migrations.db")
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        yield conn
+
+
+def query_plan(conn: sql.Connection, query: str) -> str:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+    return "\n".join(row[3] for row in rows)
+
+
+def test_fresh_database_is_at_latest_version(conn):
+    assert get_version(conn) == SCHEMA_VERSION
+
+
+def test_setup_is_idempotent(tmp_path):
+    db_name = str(tmp_path / "twice.db")
+    setup_database(db_name)
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        assert get_version(conn) == SCHEMA_VERSION
+
+
+def test_legacy_database_is_upgraded_in_place(tmp_path):
+    db_name = str(tmp_path / "legacy.db")
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute(
+            "CREATE TABLE assets(id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, category TEXT, status TEXT DEFAULT 'AVAILABLE')"
+        )
+        conn.execute("INSERT INTO assets(name,category) VALUES('Dell','Laptop')")
+        conn.commit()
+
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        assert get_version(conn) == SCHEMA_VERSION
+        assert conn.execute("SELECT name FROM assets").fetchall() == [("Dell",)]
+        assert conn.execute("SELECT * FROM inventory_summary").fetchall() == [
+            ("Laptop", "AVAILABLE", 1)
+        ]
+        assert "idx_assets_status" in query_plan(
+            conn, "SELECT * FROM assets WHERE status='AVAILABLE'"
+        )
+
+
+def test_newer_schema_is_rejected(tmp_path):
+    db_name = str(tmp_path / "future.db")
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION + 1}")
+
+    with pytest.raises(ValueError, match="newer than supported"):
+        setup_database(db_name)
+
+
+def test_return_asset_uses_open_assignment_index(conn):
+    plan = query_plan(
+        conn,
+        "UPDATE assignments SET return_date='2025-01-01' WHERE asset_id=1 AND return_date IS NULL",
+    )
+    assert "USING INDEX uq_assignments_open_asset" in plan
+
+
+def test_active_assignments_scan_only_open_rows(conn):
+    plan = query_plan(
+        conn,
+        """SELECT e.name,ase.name,assign.assigned_date
+        FROM assignments AS assign
+        JOIN assets AS ase ON ase.id=assign.asset_id
+        JOIN employees AS e ON e.id=assign.employee_id
+        WHERE assign.return_date IS NULL""",
+    )
+    assert "SCAN assign USING INDEX" in plan
+    assert "_open_" in plan
+
+
+@pytest.mark.parametrize(
+    "query, index",
+    [
+        ("SELECT * FROM assets WHERE status='AVAILABLE'", "idx_assets_status"),
+        ("SELECT * FROM assets WHERE category='Laptop'", "idx_assets_category"),
+        ("SELECT * FROM employees WHERE is_active=1", "idx_employees_active"),
+        ("SELECT * FROM employees WHERE department='IT'", "idx_employees_department"),
+    ],
+)
+def test_filter_columns_are_indexed(conn, query, index):
+    assert f"USING INDEX {index}" in query_plan(conn, query)
+
+
+def test_open_assignment_is_unique_per_asset(conn):
+    conn.execute("INSERT INTO assignments(asset_id,employee_id) VALUES(1,1)")
+    conn.execute(
+        "INSERT INTO assignments(asset_id,employee_id,return_date) VALUES(1,2,'2025-01-01')"
+    )
+
+    with pytest.raises(sql.IntegrityError):
+        conn.execute("INSERT INTO assignments(asset_id,employee_id) VALUES(1,3)")
+
+
+def test_duplicate_open_assignments_are_closed_on_upgrade(tmp_path):
+    db_name = str(tmp_path / "racy.db")
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute(
+            "CREATE TABLE assignments(id INTEGER PRIMARY KEY AUTOINCREMENT, asset_id INTEGER, employee_id INTEGER, assigned_date TEXT, return_date TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date) VALUES(?,?,?)",
+            [(1, 1, "2025-01-01"), (1, 2, "2025-01-03"), (2, 1, "2025-01-02")],
+        )
+        conn.commit()
+
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        rows = conn.execute(
+            "SELECT id, return_date FROM assignments ORDER BY id"
+        ).fetchall()
+
+    assert rows == [(1, "2025-01-03"), (2, None), (3, None)]
+
+
+@pytest.mark.parametrize(
+    "query, index",
+    [
+        (
+            "SELECT * FROM assignments WHERE asset_id=1 AND assigned_date <= '2025-12-31' ORDER BY assigned_date",
+            "idx_assignments_asset_date",
+        ),
+        (
+            "SELECT * FROM assignments WHERE employee_id=1 AND assigned_date <= '2025-12-31' ORDER BY assigned_date",
+            "idx_assignments_employee_date",
+        ),
+    ],
+)
+def test_history_queries_use_composite_indexes(conn, query, index):
+    assert f"USING INDEX {index}" in query_plan(conn, query)
+
+
+def test_unpadded_dates_are_normalized_on_upgrade(tmp_path):
+    db_name = str(tmp_path / "dates.db")
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute(
+            "CREATE TABLE assignments(id INTEGER PRIMARY KEY AUTOINCREMENT, asset_id INTEGER, employee_id INTEGER, assigned_date TEXT, return_date TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(1,1,'2024-2-9','2024-10-1')"
+        )
+        conn.commit()
+
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        row = conn.execute("SELECT assigned_date, return_date FROM assignments").fetchone()
+
+    assert row == ("2024-02-09", "2024-10-01")
+
+
+def test_search_index_is_backfilled_and_kept_in_sync(tmp_path):
+    db_name = str(tmp_path / "search.db")
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute(
+            "CREATE TABLE assets(id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, category TEXT, status TEXT DEFAULT 'AVAILABLE')"
+        )
+        conn.execute("INSERT INTO assets(name,category) VALUES('Dell Latitude','Laptop')")
+        conn.commit()
+
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        match = "SELECT rowid FROM assets_fts WHERE assets_fts MATCH ?"
+        assert conn.execute(match, ("lat*",)).fetchall() == [(1,)]
+
+        conn.execute("UPDATE assets SET name='Macbook Pro' WHERE id=1")
+        conn.execute("INSERT INTO assets(name,category) VALUES('Dell Xps','Laptop')")
+        assert conn.execute(match, ("lat*",)).fetchall() == []
+        assert conn.execute(match, ("dell",)).fetchall() == [(2,)]
+
+        conn.execute("DELETE FROM assets WHERE id=2")
+        assert conn.execute(match, ("dell",)).fetchall() == []
+        conn.execute("INSERT INTO assets_fts(assets_fts) VALUES('integrity-check')")
+
+
+@pytest.mark.parametrize(
+    "query, index",
+    [
+        (
+            "SELECT asset_id FROM asset_stats WHERE open_since IS NULL AND COALESCE(last_returned, 0) <= 700000",
+            "idx_asset_stats_idle",
+        ),
+        (
+            "SELECT asset_id FROM asset_stats WHERE open_since IS NULL ORDER BY assigned_days DESC LIMIT 10",
+            "idx_asset_stats_closed_days",
+        ),
+        (
+            "SELECT asset_id FROM asset_stats WHERE open_since IS NOT NULL ORDER BY assigned_days - open_since DESC LIMIT 10",
+            "idx_asset_stats_open_days",
+        ),
+    ],
+)
+def test_asset_stats_reads_use_partial_indexes(conn, query, index):
+    assert f"USING INDEX {index}" in query_plan(conn, query)
+
+
+def test_asset_stats_are_backfilled_on_upgrade(tmp_path):
+    db_name = str(tmp_path / "old.db")
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        conn.execute("INSERT INTO assets(name,category,status) VALUES('Dell','Laptop','ASSIGNED')")
+        conn.executemany(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date,return_date) VALUES(?,?,?,?)",
+            [(1, 1, "2025-01-01", "2025-01-11"), (1, 1, "2025-02-01", None)],
+        )
+        conn.execute("DROP TABLE asset_stats")
+        conn.execute("PRAGMA user_version = 7")
+        conn.commit()
+
+    setup_database(db_name)
+
+    with closing(sql.connect(db_name)) as conn:
+        row = conn.execute("SELECT * FROM asset_stats").fetchone()
+
+    assert row == (1, 2, 10, date(2025, 2, 1).toordinal(), date(2025, 1, 11).toordinal())
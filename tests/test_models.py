@@ -1,5 +1,12 @@
 import pytest
-from src.models import Asset, Employee, Assignment
+from src.models import (
+    Asset,
+    Assignment,
+    Employee,
+    validate_assets,
+    validate_assignments,
+    validate_employees,
+)
 
 
 # Asset Tests
@@ -95,3 +102,143 @@ def test_assign_return_valid_date_format() -> None:
             assigned_date="2025-01-01",
             return_date="01-01-2025",
         )
+
+
+def test_assign_rejects_impossible_date() -> None:
+    with pytest.raises(ValueError, match="Dates must be in YYYY-MM-DD"):
+        Assignment(asset_id=1, employee_id=1, assigned_date="2025-02-30")
+
+
+def test_assign_normalizes_dates_to_iso() -> None:
+    assign = Assignment(
+        asset_id=1, employee_id=1, assigned_date="2024-2-29", return_date="2024-3-1"
+    )
+    assert assign.assigned_date == "2024-02-29"
+    assert assign.return_date == "2024-03-01"
+
+
+def test_emp_name_cant_contain_unicode_digits() -> None:
+    with pytest.raises(ValueError, match="Employee name cannot contain numbers"):
+        Employee(name="Bob²", department="it")
+
+
+# Row hydration
+
+
+def test_models_are_slotted() -> None:
+    a = Asset(name="dell", category="laptop")
+
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        a.colour = "black"
+
+
+def test_from_row_maps_table_columns() -> None:
+    assert Asset.from_row((1, "Dell", "Laptop", "ASSIGNED")) == Asset(
+        name="Dell", category="Laptop", status="ASSIGNED", id=1
+    )
+    assert Employee.from_row((2, "Bob", "IT", 0)) == Employee(
+        name="Bob", department="IT", is_active=0, id=2
+    )
+    assert Assignment.from_row((3, 1, 2, "2025-01-01", None)) == Assignment(
+        asset_id=1, employee_id=2, assigned_date="2025-01-01", id=3
+    )
+
+
+def test_from_row_skips_validation() -> None:
+    asset = Asset.from_row((1, "  raw  ", "laptop", "available"))
+    assert asset.name == "  raw  "
+
+
+def per_object(model, rows: list[dict]) -> tuple[list, list]:
+    built, errors = [], []
+    for i, row in enumerate(rows):
+        try:
+            built.append(model(**row))
+        except ValueError as e:
+            errors.append((i, str(e)))
+    return built, errors
+
+
+def test_validate_assets_matches_the_model() -> None:
+    rows = [
+        {"name": " dell xps ", "category": "laptop", "status": "available"},
+        {"name": "  ", "category": "laptop"},
+        {"name": "23", "category": " "},
+        {"name": "23", "category": "42"},
+        {"name": "lg", "category": "monitor", "status": "retired", "id": "7"},
+        {"name": "lg 2", "category": "monitor", "id": 8},
+    ]
+    batch = validate_assets(
+        [r["name"] for r in rows],
+        [r["category"] for r in rows],
+        [r.get("status", "AVAILABLE") for r in rows],
+        [r.get("id") for r in rows],
+    )
+    built, errors = per_object(Asset, rows)
+
+    assert batch.errors == errors
+    assert bytes(batch.valid) == bytes([1, 0, 0, 0, 0, 1])
+    assert list(batch.rows("name", "category", "status")) == [
+        (a.name, a.category, a.status) for a in built
+    ]
+
+
+def test_validate_employees_matches_the_model() -> None:
+    rows = [
+        {"name": "bob dob", "department": "it"},
+        {"name": "r2d2", "department": "it"},
+        {"name": "josé ２", "department": "hr"},
+        {"name": "ann", "department": "42"},
+        {"name": "ann", "department": "hr", "is_active": 2},
+        {"name": "", "department": ""},
+    ]
+    batch = validate_employees(
+        [r["name"] for r in rows],
+        [r["department"] for r in rows],
+        [r.get("is_active", 1) for r in rows],
+    )
+    built, errors = per_object(Employee, rows)
+
+    assert batch.errors == errors
+    assert list(batch.rows("name", "department", "is_active")) == [
+        (e.name, e.department, e.is_active) for e in built
+    ]
+    # the all-ascii, digit-free column takes the single-search path
+    assert validate_employees(["ann", "bob"], ["it", "hr"]).errors == []
+
+
+def test_validate_assignments_matches_the_model() -> None:
+    rows = [
+        {"asset_id": 1, "employee_id": 1, "assigned_date": "2025-1-5"},
+        {"asset_id": "1", "employee_id": 1, "assigned_date": "2025-01-05"},
+        {"asset_id": 1, "employee_id": None, "assigned_date": "2025-01-05"},
+        {"asset_id": 1, "employee_id": 1, "assigned_date": "2025-02-30"},
+        {"asset_id": 1, "employee_id": 1, "assigned_date": "2025-01-05", "return_date": "soon"},
+        {"asset_id": 2, "employee_id": 3, "assigned_date": "2025-01-05", "return_date": "2025-2-1"},
+    ]
+    batch = validate_assignments(
+        [r["asset_id"] for r in rows],
+        [r["employee_id"] for r in rows],
+        [r["assigned_date"] for r in rows],
+        [r.get("return_date") for r in rows],
+    )
+    built, errors = per_object(Assignment, rows)
+
+    assert batch.errors == errors
+    assert list(
+        batch.rows("asset_id", "employee_id", "assigned_date", "return_date")
+    ) == [(a.asset_id, a.employee_id, a.assigned_date, a.return_date) for a in built]
+
+
+@pytest.mark.parametrize(
+    "validate, columns",
+    [
+        (validate_assets, (["dell", "hp", "lg"], ["laptop"])),
+        (validate_employees, (["bob"], ["it"], [1, 0])),
+        (validate_assignments, ([1, 2], [1, 2], ["2025-01-01"])),
+    ],
+)
+def test_batch_columns_must_have_the_same_length(validate, columns) -> None:
+    with pytest.raises(ValueError, match="same length"):
+        validate(*columns)
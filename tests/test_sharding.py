@@ -0,0 +1,107 @@
+import sqlite3 as sql
+from contextlib import closing
+
+import pytest
+from src.database import Database_manager, setup_database
+from src.models import Asset, Assignment, Employee
+from src.sharding import SHARD_ID_SPAN, ShardedDatabaseManager
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {site: str(tmp_path / f"{site}.db") for site in ("nyc", "sfo", "ldn")}
+
+
+@pytest.fixture
+def sharded(paths):
+    with ShardedDatabaseManager(paths, row_type="named") as db:
+        yield db
+
+
+def test_each_site_hands_out_ids_from_its_own_range(sharded):
+    nyc = sharded.add_assets(Asset(name="dell", category="laptop"), site="nyc")
+    ldn = sharded.add_assets(Asset(name="lg", category="monitor"), site="ldn")
+    ldn_emp = sharded.add_employees(Employee(name="bob", department="it"), site="ldn")
+
+    assert nyc == SHARD_ID_SPAN + 1
+    assert ldn == ldn_emp == 3 * SHARD_ID_SPAN + 1
+    assert sharded.site_for_id(nyc) == "nyc"
+    assert sharded.site_for_id(ldn) == "ldn"
+    assert sharded.get_asset(ldn).name == "Lg"
+    assert sharded.shard("nyc").get_asset(ldn) is None
+
+    with pytest.raises(ValueError, match="pass site="):
+        sharded.site_for_id(5)
+    with pytest.raises(ValueError, match="Unknown site"):
+        sharded.add_assets(Asset(name="dell", category="laptop"), site="tokyo")
+
+
+def test_writes_route_by_id(sharded):
+    asset = sharded.add_assets(Asset(name="dell", category="laptop"), site="sfo")
+    emp = sharded.add_employees(Employee(name="bob", department="it"), site="sfo")
+    other = sharded.add_employees(Employee(name="ann", department="hr"), site="nyc")
+
+    with pytest.raises(ValueError, match="different sites"):
+        sharded.assign_asset(Assignment(asset_id=asset, employee_id=other))
+
+    sharded.assign_asset(Assignment(asset_id=asset, employee_id=emp, assigned_date="2025-01-02"))
+    assert sharded.get_asset(asset).status == "ASSIGNED"
+
+    sharded.return_asset(asset, "2025-02-01")
+    sharded.update_asset_status(asset, "RETIRED")
+    assert sharded.shard("sfo").get_asset(asset).status == "RETIRED"
+
+
+def test_reads_fan_out_and_merge(sharded):
+    for site in ("ldn", "nyc", "sfo"):
+        sharded.bulk_add_assets(
+            [{"name": f"{site} laptop {i}", "category": "laptop"} for i in range(3)], site=site
+        )
+        emp = sharded.add_employees(Employee(name=f"{site} lead", department="it"), site=site)
+        first_asset = (sharded.sites.index(site) + 1) * SHARD_ID_SPAN + 1
+        sharded.assign_asset(Assignment(asset_id=first_asset, employee_id=emp))
+
+    rows = list(sharded.iter_assets(batch_size=2))
+    assert [r.id for r in rows] == sorted(r.id for r in rows)
+    assert [r.name for r in rows[:3]] == ["Nyc Laptop 0", "Nyc Laptop 1", "Nyc Laptop 2"]
+    assert len(list(sharded.iter_assets(batch_size=2, status="AVAILABLE"))) == 6
+
+    assert len(sharded.get_active_assignments()) == 3
+    assert [r.employee for r in sharded.iter_active_assignments()] == [
+        "Nyc Lead",
+        "Sfo Lead",
+        "Ldn Lead",
+    ]
+    assert sharded.get_inventory_summary() == {
+        "assets": {"Laptop": {"AVAILABLE": 6, "ASSIGNED": 3}},
+        "assigned_by_department": {"IT": {"Laptop": 3}},
+    }
+
+    # sites take turns by rank
+    hits = sharded.search_assets("laptop 0", limit=2)
+    assert [h.name for h in hits] == ["Nyc Laptop 0", "Sfo Laptop 0"]
+
+
+def test_existing_site_files_keep_their_rows(paths):
+    setup_database(paths["nyc"])
+    with Database_manager(paths["nyc"]) as legacy:
+        legacy.add_assets(Asset(name="old", category="laptop"))
+
+    with ShardedDatabaseManager(paths) as db:
+        assert db.get_asset(1, site="nyc")[1] == "Old"
+        assert db.add_assets(Asset(name="new", category="laptop"), site="nyc") == SHARD_ID_SPAN + 1
+        assert db.shard("nyc").load_snapshot().count_assets("category") == {"Laptop": 2}
+
+    # reordering the sites would give each file another site's range
+    with pytest.raises(ValueError, match="original order"):
+        ShardedDatabaseManager({"ldn": paths["ldn"], "nyc": paths["nyc"]})
+
+
+def test_reopening_keeps_the_sequence(paths):
+    with ShardedDatabaseManager(paths) as db:
+        first = db.add_assets(Asset(name="dell", category="laptop"), site="sfo")
+    with ShardedDatabaseManager(paths) as db:
+        assert db.add_assets(Asset(name="dell", category="laptop"), site="sfo") == first + 1
+
+    with closing(sql.connect(paths["sfo"])) as conn:
+        assert conn.execute("SELECT MIN(id) FROM assets").fetchone()[0] == first
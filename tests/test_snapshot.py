@@ -0,0 +1,119 @@
+import sqlite3 as sql
+from contextlib import closing
+from datetime import date
+
+import pytest
+from src.database import Database_manager, setup_database
+from src.models import Asset
+from src.snapshot import load_snapshot
+
+
+@pytest.fixture
+def db(tmp_path):
+    db_name = str(tmp_path / "snapshot.db")
+    setup_database(db_name)
+    manager = Database_manager(db_name)
+
+    manager.bulk_add_assets(
+        [
+            {"name": "Dell", "category": "Laptop"},
+            {"name": "Lenovo", "category": "Laptop"},
+            {"name": "LG", "category": "Monitor"},
+            {"name": "Mac", "category": "Laptop"},
+        ]
+    )
+    manager.bulk_add_employees(
+        [
+            {"name": "Alice", "department": "IT"},
+            {"name": "Bob", "department": "HR"},
+        ]
+    )
+    manager.bulk_assign(
+        [
+            {"asset_id": 1, "employee_id": 1, "assigned_date": "2025-01-01"},
+            {"asset_id": 3, "employee_id": 1, "assigned_date": "2025-01-11"},
+            {"asset_id": 2, "employee_id": 2, "assigned_date": "2025-02-01"},
+        ]
+    )
+    manager.return_asset(1, "2025-01-31")
+    manager.update_asset_status(4, "RETIRED")
+    return manager
+
+
+@pytest.fixture
+def snapshot(db):
+    with closing(sql.connect(db.db_name)) as conn:
+        return load_snapshot(conn, "2025-03-01")
+
+
+def test_snapshot_counts_match_the_tables(snapshot):
+    assert len(snapshot.assets) == 4
+    assert len(snapshot.assignments) == 3
+    assert snapshot.today == date(2025, 3, 1).toordinal()
+
+    assert snapshot.count_assets("status") == {"AVAILABLE": 1, "ASSIGNED": 2, "RETIRED": 1}
+    assert snapshot.count_assets("category", "status") == {
+        ("Laptop", "AVAILABLE"): 1,
+        ("Laptop", "ASSIGNED"): 1,
+        ("Laptop", "RETIRED"): 1,
+        ("Monitor", "ASSIGNED"): 1,
+    }
+
+
+def test_snapshot_dictionary_encodes_labels_and_stores_day_ordinals(snapshot):
+    assets = snapshot.assets
+
+    assert assets["category"].typecode == "H"
+    assert [assets.decode("category", code) for code in assets["category"]] == [
+        "Laptop",
+        "Laptop",
+        "Monitor",
+        "Laptop",
+    ]
+    assert list(snapshot.assignments["assigned"]) == [
+        date(2025, 1, 1).toordinal(),
+        date(2025, 1, 11).toordinal(),
+        date(2025, 2, 1).toordinal(),
+    ]
+    assert list(snapshot.assignments["open"]) == [0, 1, 1]
+
+
+def test_mean_duration_counts_open_assignments_up_to_snapshot_day(snapshot):
+    # 30 days returned, 49 and 28 days still open on 2025-03-01
+    assert snapshot.mean_duration("department") == {"IT": 39.5, "HR": 28.0}
+    assert snapshot.mean_duration("department", open=0) == {"IT": 30.0}
+    assert snapshot.mean_duration("category", department="IT") == {"Laptop": 30.0, "Monitor": 49.0}
+
+
+def test_filters_on_unknown_labels_match_nothing(snapshot):
+    assert snapshot.count_assignments("category", department="SALES") == {}
+    assert snapshot.count_assignments("department", category="Laptop") == {"IT": 1, "HR": 1}
+
+    with pytest.raises(ValueError, match="Group by at least one column"):
+        snapshot.count_assets()
+
+
+@pytest.mark.parametrize("asset_id", [0, 9, 10**9])
+def test_assignments_without_a_parent_row_get_blank_labels(db, asset_id):
+    # the manager's connections leave foreign keys off, so nothing stops these
+    with closing(sql.connect(db.db_name)) as conn:
+        conn.execute(
+            "INSERT INTO assignments(asset_id,employee_id,assigned_date) VALUES(?,7,'2025-02-20')",
+            (asset_id,),
+        )
+        conn.commit()
+
+    snapshot = db.load_snapshot()
+
+    assert snapshot.count_assignments("category", "department")[("", "")] == 1
+    assert snapshot.count_assignments("category") == {"Laptop": 2, "Monitor": 1, "": 1}
+    assert "" not in snapshot.count_assets("category")
+
+
+def test_manager_snapshot_reflects_committed_writes(db):
+    db.add_assets(Asset(name="Surface", category="Tablet"))
+
+    snapshot = db.load_snapshot()
+
+    assert snapshot.count_assets("category")["Tablet"] == 1
+    assert snapshot.today == date.today().toordinal()
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+import pytest
+import main as cli
+import src.database as database
+from src.database import setup_database
+
+LAZY_MODULES = [
+    "csv",
+    "json",
+    "random",
+    "logging",
+    "concurrent.futures",
+    "src.group_commit",
+    "src.instrumentation",
+    "http.server",
+]
+
+
+def imported_after(code: str) -> set[str]:
+    # a fresh interpreter, since this test process has imported everything
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_cli_import_skips_rarely_used_modules():
+    loaded = imported_after("import main")
+
+    assert "src.database" in loaded
+    assert loaded.isdisjoint(LAZY_MODULES)
+
+
+def test_lazy_modules_load_on_use(tmp_path):
+    db_name = str(tmp_path / "lazy.db")
+    loaded = imported_after(
+        f"import main; main.main(['--db', {db_name!r}, 'list-assets', '--format', 'json'])"
+    )
+
+    assert "json" in loaded
+    assert "src.group_commit" not in loaded
+
+
+def test_setup_skips_migrations_when_schema_is_current(tmp_path, monkeypatch):
+    db_name = str(tmp_path / "current.db")
+    setup_database(db_name)
+
+    def fail(conn):
+        raise AssertionError("migrate() should not run on a current schema")
+
+    monkeypatch.setattr(database, "migrate", fail)
+    setup_database(db_name)
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["list-assets", "--status", "retired"], "list-assets"),
+        (["--db", "assign", "return", "1"], "return"),
+        (["--metrics", "m.json", "batch"], "batch"),
+        (["-h"], None),
+        ([], None),
+        (["bogus"], None),
+    ],
+)
+def test_requested_command_finds_the_subcommand(argv, expected):
+    assert cli.requested_command(argv) == expected
+
+
+def test_parser_built_for_one_command_still_parses_it():
+    args = cli.build_parser(["assign", "1", "2"]).parse_args(["assign", "1", "2"])
+
+    assert (args.asset_id, args.employee_id) == (1, 2)
+    assert args.handler is cli.handle_assign_command